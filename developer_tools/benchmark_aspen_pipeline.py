@@ -0,0 +1,176 @@
+# Copyright 2024, Battelle Energy Alliance, LLC
+# ALL RIGHTS RESERVED
+"""
+Benchmark of the Aspen-HERON pipeline (see src/pipeline.py).
+
+For each number of components N, synthetic Aspen HYSYS and APEA output xlsx files with N components are generated
+(see developer_tools/synthetic_aspen.py) together with one Setfile per HYSYS category and a small HERON input file. The pipeline is then run on them and
+the time and the peak memory of each stage are recorded:
+  - The time of a stage is the shortest time of the timed runs (see --repeat). These runs are not traced.
+  - The peak memory of a stage is measured by tracemalloc in one extra run (tracemalloc slows the stages down)
+The results are written to a JSON file so that they can be compared between versions.
+
+Usage:
+  python developer_tools/benchmark_aspen_pipeline.py --sizes 10 100 1000 10000 --output benchmark_results.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.src.pipeline import AspenHeronPipeline, STAGES
+from FORCE.developer_tools.synthetic_aspen import create_synthetic_aspen_outputs, write_setfiles, COST_MODELS
+
+SYNTHETIC_HERON_XML = """<HERON>
+  <Case name="Runs">
+    <mode>sweep</mode>
+  </Case>
+  <Components>
+    <Component name="source">
+      <economics>
+        <lifetime>30</lifetime>
+      </economics>
+    </Component>
+  </Components>
+</HERON>
+"""
+
+#####
+# Section 1:
+# Creating the synthetic cases
+
+def create_synthetic_case(case_folder, n_components, n_files=1, seed=0):
+  """
+    Creating the input files of the pipeline for N synthetic components
+    @ In, case_folder, str, the folder of the case (it is created)
+    @ In, n_components, int, the number of components
+    @ In, n_files, int, optional, the number of HYSYS (and APEA) output files
+    @ In, seed, int, optional, the seed of the random number generator
+    @ Out, pipeline_inputs, dict, the folders/files of the pipeline inputs
+  """
+  pipeline_inputs = {"hysys_folder": os.path.join(case_folder, "HYSYS_outputs") + "/",
+                     "apea_folder": os.path.join(case_folder, "APEA_outputs") + "/",
+                     "comp_sets_folder": os.path.join(case_folder, "Sets") + "/",
+                     "heron_input_xml": os.path.join(case_folder, "heron_input.xml")}
+  files_components = create_synthetic_aspen_outputs(pipeline_inputs["hysys_folder"], pipeline_inputs["apea_folder"], n_components,
+                                                    n_files=n_files, seed=seed)
+  # A component set needs at least one component: small cases may not have components of every category
+  categories = set(comp["HYSYS Category"] for components in files_components.values() for comp in components)
+  write_setfiles(pipeline_inputs["comp_sets_folder"], categories=[category for category in COST_MODELS if category in categories])
+  with open(pipeline_inputs["heron_input_xml"], 'w') as heron_input:
+    heron_input.write(SYNTHETIC_HERON_XML)
+  return pipeline_inputs
+
+#####
+# Section 2:
+# Running the benchmark
+
+def run_pipeline(pipeline_inputs, workers=None, trace_memory=False, persist=True, verbose=False):
+  """
+    Running the whole pipeline once
+    @ In, pipeline_inputs, dict, the folders/files of the pipeline inputs (see create_synthetic_case)
+    @ In, workers, int, optional, the number of processes that parse the xlsx files
+    @ In, trace_memory, bool, optional, if True, the peak memory of each stage is traced
+    @ In, persist, bool, optional, if False, the components text files are not written
+    @ In, verbose, bool, optional, if False, the printouts of the pipeline are discarded
+    @ Out, report, list, the report of the stages (see AspenHeronPipeline.run_stage)
+  """
+  pipeline = AspenHeronPipeline(workers=workers, trace_memory=trace_memory, persist=persist, **pipeline_inputs)
+  with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(sys.stdout if verbose else devnull):
+    pipeline.run()
+  return pipeline.report
+
+
+def benchmark(sizes, work_folder, repeat=1, n_files=1, workers=None, trace_memory=True, persist=True, seed=0, verbose=False):
+  """
+    Benchmarking the pipeline stages for several numbers of components
+    @ In, sizes, list, the numbers of components
+    @ In, work_folder, str, the folder where the synthetic cases are created
+    @ In, repeat, int, optional, the number of timed runs of each case (the shortest time is kept)
+    @ In, n_files, int, optional, the number of HYSYS (and APEA) output files of each case
+    @ In, workers, int, optional, the number of processes that parse the xlsx files
+    @ In, trace_memory, bool, optional, if True, one more run traces the peak memory of each stage
+    @ In, persist, bool, optional, if False, the components text files are not written
+    @ In, seed, int, optional, the seed of the synthetic components
+    @ In, verbose, bool, optional, if True, the printouts of the pipeline are shown
+    @ Out, results, list, one dictionary per size and stage
+  """
+  results = []
+  for n_components in sizes:
+    start = time.perf_counter()
+    pipeline_inputs = create_synthetic_case(os.path.join(work_folder, f"N{n_components}"), n_components, n_files=n_files, seed=seed)
+    print(f" N = {n_components}: the synthetic case is created in {time.perf_counter() - start:.1f} s")
+    times = {stage: [] for stage in STAGES}
+    for _ in range(repeat):
+      for stage_report in run_pipeline(pipeline_inputs, workers=workers, persist=persist, verbose=verbose):
+        times[stage_report["Stage"]].append(stage_report["Time (s)"])
+    peak_memory = {}
+    if trace_memory:
+      for stage_report in run_pipeline(pipeline_inputs, workers=workers, trace_memory=True, persist=persist, verbose=verbose):
+        peak_memory[stage_report["Stage"]] = stage_report["Peak Memory (MB)"]
+    for stage in STAGES:
+      stage_result = {"Components": n_components, "Stage": stage, "Time (s)": min(times[stage]), "Times (s)": times[stage]}
+      if trace_memory:
+        stage_result["Peak Memory (MB)"] = peak_memory[stage]
+      results.append(stage_result)
+      line = f"   {stage:<18} {stage_result['Time (s)']:10.3f} s"
+      if trace_memory:
+        line += f" {stage_result['Peak Memory (MB)']:10.1f} MB"
+      print(line)
+  return results
+
+
+def benchmark_metadata(args):
+  """
+    The information needed to compare the results of different runs
+    @ In, args, argparse.Namespace, the benchmark arguments
+    @ Out, metadata, dict, the metadata of the benchmark
+  """
+  try:
+    commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    commit = None
+  return {"Date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+          "Commit": commit,
+          "Python": platform.python_version(),
+          "Platform": platform.platform(),
+          "CPUs": os.cpu_count(),
+          "Repeat": args.repeat,
+          "Files": args.files,
+          "Workers": args.workers,
+          "Persist": not args.no_persist,
+          "Seed": args.seed}
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description="Benchmark of the Aspen-HERON pipeline with synthetic HYSYS/APEA output files")
+  parser.add_argument("--sizes", type=int, nargs='+', default=[10, 100, 1000, 10000], help="The numbers of synthetic components")
+  parser.add_argument("--output", default="benchmark_results.json", help="The JSON file of the results")
+  parser.add_argument("--repeat", type=int, default=1, help="The number of timed runs of each size (the shortest time is reported)")
+  parser.add_argument("--files", type=int, default=1, help="The number of HYSYS (and APEA) output files of each size")
+  parser.add_argument("--workers", type=int, default=None, help="The number of processes that parse the xlsx files")
+  parser.add_argument("--seed", type=int, default=0, help="The seed of the synthetic components")
+  parser.add_argument("--work-folder", default=None, help="The folder of the synthetic cases (a temporary folder is used and removed by default)")
+  parser.add_argument("--no-memory", action="store_true", help="The peak memory of the stages is not traced")
+  parser.add_argument("--no-persist", action="store_true", help="The components text files are not written")
+  parser.add_argument("--verbose", action="store_true", help="The printouts of the pipeline are shown")
+  args = parser.parse_args()
+
+  work_folder = args.work_folder if args.work_folder is not None else tempfile.mkdtemp(prefix="force_benchmark_")
+  try:
+    results = benchmark(args.sizes, work_folder, repeat=args.repeat, n_files=args.files, workers=args.workers, trace_memory=not args.no_memory,
+                        persist=not args.no_persist, seed=args.seed, verbose=args.verbose)
+  finally:
+    if args.work_folder is None:
+      shutil.rmtree(work_folder)
+  with open(args.output, 'w') as output:
+    json.dump({"Metadata": benchmark_metadata(args), "Results": results}, output, indent=2)
+  print(f"\n The benchmark results are written to: {args.output}")
@@ -0,0 +1,220 @@
+# Copyright 2024, Battelle Energy Alliance, LLC
+# ALL RIGHTS RESERVED
+"""
+The objective of this code is the vertical integration (auomated data transfer) between different IES codes.
+- Most of these IES codes are the FORCE codes: https://ies.inl.gov/SitePages/FORCE.aspx
+- Other codes are the Aspen HYSYS and the Aspen APEA:
+https://www.aspentech.com/en/products/engineering/aspen-hysys
+https://www.aspentech.com/en/products/pages/aspen-process-economic-analyzer
+
+This developer tool generates synthetic Aspen HYSYS and APEA output xlsx files of any size (e.g. for the load tests and the benchmarks
+of the HYSYS and APEA modules) without running the Aspen codes. It is not part of the FORCE package (see src) and it is imported
+as FORCE.developer_tools.synthetic_aspen:
+
+1 - Python Methods to generate the synthetic components (with a seeded random number generator so that the same seed gives the same components)
+2 - Python Methods to write the synthetic HYSYS output files (the seven equipment sheets with the "Unit" column and the POWER/DUTY rows)
+and the synthetic APEA output files (the 'Equipment' sheet under three title rows)
+3 - Python Methods to write a whole synthetic case: the HYSYS and APEA output files (with the same names so that their components are merged)
+and the Setfiles of the component sets
+"""
+#####
+# Section 0
+# Importing libraries and modules
+
+import os
+import json
+import numpy as np
+import openpyxl
+from FORCE.src.hysys import HYSYS_SHEETS
+
+# The rows (label, unit) of each HYSYS sheet. The capacity row of a sheet is its POWER/DUTY row (the Tees and the Mixers do not have one)
+HYSYS_SHEET_ROWS = {
+  'Expanders': [('Expander Speed', 'rpm'), ('POWER', 'kW'), ('Capacity (act feed vol flow)', 'ACT_m3/h'),
+                ('Feed Pressure', 'kPa'), ('Product Pressure', 'kPa'), ('Product Temperature', 'C')],
+  'Coolers': [('DUTY', 'MW'), ('Feed Temperature', 'C'), ('Product Temperature', 'C')],
+  'Pumps': [('Speed', 'rpm'), ('Power', 'kW'), ('Capacity(Actual Vol. Flow)', 'm3/h'),
+            ('Feed Pressure', 'kPa'), ('Product Pressure', 'kPa'), ('Product Temperature', 'C')],
+  'Heaters': [('Duty', 'MW'), ('Feed Temperature', 'C'), ('Product Temperature', 'C')],
+  'Tees': [('Feed Molar Flow', 'kgmole/h'), ('Feed Temperature', 'C'), ('Feed Pressure', 'kPa'),
+           ('Flow Ratio(1)', None), ('Flow Ratio(2)', None)],
+  'Mixers': [('Product Molar Flow', 'kgmole/h'), ('Product Temperature', 'C'), ('Product Pressure', 'kPa'),
+             ('Equalize Pressures', None)],
+  'Heat Exchangers': [('Duty', 'MW'), ('Tube Side Feed Mass Flow', 'kg/s'), ('Shell Side Feed Mass Flow', 'kg/s'),
+                      ('Tube Inlet Temperature', 'C'), ('Tube Outlet Temperature', 'C')],
+}
+# The name prefix of the components of each HYSYS sheet
+HYSYS_NAME_PREFIXES = {'Expanders': 'K', 'Coolers': 'E', 'Pumps': 'P', 'Heaters': 'E', 'Tees': 'TEE', 'Mixers': 'MIX', 'Heat Exchangers': 'E'}
+# The cost model of each HYSYS sheet that has a capacity row: the capacity range and the cost function
+# (installed cost = reference price * (capacity / reference driver) ** scaling factor). The Tees and the Mixers cost nothing
+COST_MODELS = {
+  'Expanders': {"Capacity Range": (1.0e3, 1.0e5), "Reference Driver": 1.0e4, "Reference Price": 5.0e6, "Scaling Factor": 0.7},
+  'Coolers': {"Capacity Range": (1.0, 200.0), "Reference Driver": 50.0, "Reference Price": 2.0e6, "Scaling Factor": 0.65},
+  'Pumps': {"Capacity Range": (0.5, 2.0e3), "Reference Driver": 100.0, "Reference Price": 1.5e5, "Scaling Factor": 0.6},
+  'Heaters': {"Capacity Range": (1.0, 250.0), "Reference Driver": 50.0, "Reference Price": 3.0e6, "Scaling Factor": 0.7},
+  'Heat Exchangers': {"Capacity Range": (0.5, 50.0), "Reference Driver": 10.0, "Reference Price": 7.0e5, "Scaling Factor": 0.6},
+}
+# The relative noise of the synthetic costs around the cost functions
+COST_NOISE = 0.1
+# The first columns of the sheets hold the row labels and the units
+MAX_COMPONENTS_PER_SHEET = 16384 - 2
+APEA_HEADER = ['Name', 'Equipment Cost [USD]', 'Installed Cost [USD]', 'Equipment Weight [LBS]',
+               'Total Installed Weight [LBS]', 'Sizing Errors', 'Evaluation Errors']
+
+#####
+# Section 1:
+# Python Methods to generate the synthetic components
+
+def capacity_row(sheet):
+  """
+    The capacity (POWER/DUTY) row of a HYSYS sheet
+    @ In, sheet, str, the HYSYS sheet
+    @ Out, capacity_row, tuple, the (label, unit) of the capacity row (None if the sheet does not have one)
+  """
+  for label, unit in HYSYS_SHEET_ROWS[sheet]:
+    if label.upper() in ['POWER', 'DUTY']:
+      return label, unit
+  return None
+
+
+def synthetic_components(n_components, seed=0, categories=None):
+  """
+    Generating synthetic components with random HYSYS categories, capacities and APEA costs
+    @ In, n_components, int, the number of components
+    @ In, seed, int, optional, the seed of the random number generator (the same seed gives the same components)
+    @ In, categories, list, optional, the HYSYS sheets of the components (all the HYSYS sheets by default)
+    @ Out, components, list, the components dictionaries (name, HYSYS category, capacity and its units, APEA costs and weights)
+  """
+  categories = list(HYSYS_SHEETS if categories is None else categories)
+  unknown_categories = [category for category in categories if category not in HYSYS_SHEET_ROWS]
+  if unknown_categories:
+    raise ValueError(f"The categories {unknown_categories} are not HYSYS sheets: {list(HYSYS_SHEET_ROWS)}")
+  rng = np.random.default_rng(seed)
+  components_categories = rng.choice(categories, size=n_components)
+  uniforms = rng.uniform(size=n_components)
+  noises = rng.lognormal(0.0, COST_NOISE, size=n_components)
+  components = []
+  for i, category in enumerate(components_categories):
+    category = str(category)
+    component = {"Component Name": f"{HYSYS_NAME_PREFIXES[category]}-{100 + i}",
+                 "HYSYS Category": category,
+                 "Capacity": None,
+                 "Capacity Units": None,
+                 "Equipment Cost [USD]": 0,
+                 "Installed Cost [USD]": 0,
+                 "Equipment Weight [LBS]": 0,
+                 "Total Installed Weight [LBS]": 0}
+    if category in COST_MODELS:
+      model = COST_MODELS[category]
+      # The capacities are uniformly distributed on a log scale (as in a catalog of equipment sizes)
+      low, high = np.log(model["Capacity Range"])
+      capacity = float(np.exp(low + (high - low) * uniforms[i]))
+      installed_cost = model["Reference Price"] * (capacity / model["Reference Driver"]) ** model["Scaling Factor"] * noises[i]
+      component.update({"Capacity": capacity,
+                        "Capacity Units": capacity_row(category)[1],
+                        "Equipment Cost [USD]": round(0.6 * installed_cost),
+                        "Installed Cost [USD]": round(installed_cost),
+                        "Equipment Weight [LBS]": round(0.02 * installed_cost),
+                        "Total Installed Weight [LBS]": round(0.03 * installed_cost)})
+    components.append(component)
+  return components
+
+#####
+# Section 2:
+# Python Methods to write the synthetic HYSYS and APEA output files
+
+def write_hysys_workbook(xlsx_path, components, seed=0):
+  """
+    Writing a synthetic HYSYS output xlsx file: one sheet per HYSYS category (all the HYSYS sheets are written even if they are empty).
+    Each sheet has the "Unit" column and one column per component, and the values of the rows other than the capacity row are random.
+    @ In, xlsx_path, str, the path of the xlsx file
+    @ In, components, list, the components dictionaries (see synthetic_components)
+    @ In, seed, int, optional, the seed of the random values of the rows other than the capacity row
+    @ Out, None
+  """
+  rng = np.random.default_rng(seed)
+  workbook = openpyxl.Workbook(write_only=True)
+  summary = workbook.create_sheet('WorkBook Summary')
+  summary.append(['Case:', 'Synthetic HYSYS case'])
+  summary.append(['Flowsheet:', 'Main'])
+  for sheet in HYSYS_SHEET_ROWS:
+    sheet_components = [comp for comp in components if comp["HYSYS Category"] == sheet]
+    if len(sheet_components) > MAX_COMPONENTS_PER_SHEET:
+      raise ValueError(f"The sheet '{sheet}' cannot have more than {MAX_COMPONENTS_PER_SHEET} components "
+                       f"({len(sheet_components)} components). The components need to be split into more files")
+    worksheet = workbook.create_sheet(sheet)
+    worksheet.append([None, 'Unit'] + [comp["Component Name"] for comp in sheet_components])
+    worksheet.append([None])
+    for label, unit in HYSYS_SHEET_ROWS[sheet]:
+      if (label, unit) == capacity_row(sheet):
+        values = [comp["Capacity"] for comp in sheet_components]
+      elif unit == 'rpm' or unit is None:
+        values = ['<empty>'] * len(sheet_components)
+      else:
+        values = np.round(rng.uniform(1.0, 1.0e3, len(sheet_components)), 3).tolist()
+      worksheet.append([label, unit] + values)
+  workbook.save(xlsx_path)
+
+
+def write_apea_workbook(xlsx_path, components):
+  """
+    Writing a synthetic APEA output xlsx file: the 'Equipment' sheet has three title rows and then one row per component
+    (starting from the third column) so that it is read with skiprows=3
+    @ In, xlsx_path, str, the path of the xlsx file
+    @ In, components, list, the components dictionaries (see synthetic_components)
+    @ Out, None
+  """
+  workbook = openpyxl.Workbook(write_only=True)
+  worksheet = workbook.create_sheet('Equipment')
+  worksheet.append([None])
+  worksheet.append([None])
+  worksheet.append([None, None, 'Equipment'])
+  worksheet.append([None, None] + APEA_HEADER)
+  for comp in components:
+    worksheet.append([None, None, comp["Component Name"]] + [comp.get(column) for column in APEA_HEADER[1:]])
+  workbook.save(xlsx_path)
+
+#####
+# Section 3:
+# Python Methods to write a whole synthetic case
+
+def create_synthetic_aspen_outputs(hysys_folder, apea_folder, n_components, n_files=1, seed=0, categories=None):
+  """
+    Writing the synthetic HYSYS and APEA output files of N components. The components are split evenly between the files,
+    and each HYSYS file has an APEA file with the same name so that their components are merged into FORCE components.
+    @ In, hysys_folder, str, the folder of the HYSYS output files (it is created if needed)
+    @ In, apea_folder, str, the folder of the APEA output files (it is created if needed)
+    @ In, n_components, int, the number of components
+    @ In, n_files, int, optional, the number of HYSYS (and APEA) output files
+    @ In, seed, int, optional, the seed of the random number generator
+    @ In, categories, list, optional, the HYSYS sheets of the components (all the HYSYS sheets by default)
+    @ Out, files_components, dict, the components dictionaries of each file by the file name
+  """
+  for folder in [hysys_folder, apea_folder]:
+    os.makedirs(folder, exist_ok=True)
+  components = synthetic_components(n_components, seed=seed, categories=categories)
+  files_components = {}
+  for file_number, indices in enumerate(np.array_split(np.arange(n_components), n_files)):
+    file_name = f"synthetic_{file_number:03d}.xlsx"
+    file_components = [components[i] for i in indices]
+    write_hysys_workbook(os.path.join(hysys_folder, file_name), file_components, seed=seed + file_number)
+    write_apea_workbook(os.path.join(apea_folder, file_name), file_components)
+    files_components[file_name] = file_components
+  return files_components
+
+
+def write_setfiles(comp_sets_folder, categories=None):
+  """
+    Writing one Setfile per HYSYS category
+    @ In, comp_sets_folder, str, the folder of the Setfiles (it is created if needed)
+    @ In, categories, list, optional, the HYSYS categories (the HYSYS sheets that have a capacity row by default)
+    @ Out, Setfiles_paths, list, the paths of the Setfiles
+  """
+  os.makedirs(comp_sets_folder, exist_ok=True)
+  categories = list(COST_MODELS if categories is None else categories)
+  Setfiles_paths = []
+  for category in categories:
+    Setfile_path = os.path.join(comp_sets_folder, "Setfile_" + category.lower().replace(" ", "_") + ".txt")
+    with open(Setfile_path, 'w') as Setfile:
+      json.dump({"Set Name": category + " set", "Included Categories": [category]}, Setfile, indent=2)
+    Setfiles_paths.append(Setfile_path)
+  return Setfiles_paths
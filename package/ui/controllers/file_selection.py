@@ -112,6 +112,30 @@ class FileSelectionController:
     args.extend(self.unknown_args)
     return args
 
+  def get_single_input_file_type(self):
+    """
+    The file type of the input file if the package takes a single file (e.g. a RAVEN or HERON XML file)
+    @In, None
+    @Out, file_type, str, the file type (None if the package takes several files)
+    """
+    if len(self._file_specs) != 1 or self._file_specs[0].is_output:
+      return None
+    return self._file_specs[0].file_type
+
+  def get_sys_args_for_input_file(self, filename: str):
+    """
+    Gets the arguments of a run of the given input file (for the packages that take a single input file)
+    @In, filename, str, the input file
+    @Out, args, list, the input file with its argument flag, if any, and the unknown arguments
+    """
+    if self.get_single_input_file_type() is None:
+      raise ValueError("The package takes several files: the arguments cannot be built from one input file")
+    if not os.path.exists(filename):
+      raise FileNotFoundError(f"File {filename} not found")
+    spec = self._file_specs[0]
+    args = [spec.arg_name, filename] if spec.arg_name.startswith('-') else [filename]
+    return args + list(self.unknown_args)
+
   def close_persistence(self):
     """
     Closes the file location persistence
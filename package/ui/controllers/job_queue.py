@@ -0,0 +1,227 @@
+import os
+import queue
+import tkinter as tk
+from tkinter import filedialog, messagebox
+
+from ..models.main import ModelStatus
+from ..models.job_queue import JobScheduler
+
+# The interval (in ms) between two updates of the elapsed times of the running jobs
+ELAPSED_TIME_INTERVAL = 1000
+# The virtual event generated by the threads of the jobs when the scheduler pushes a job change (it wakes up the Tk main loop)
+JOBS_CHANGED_EVENT = '<<JobsChanged>>'
+
+
+class JobQueueController:
+  """ Controller for the job queue window: queues runs of the model and runs them with a JobScheduler. """
+  def __init__(self, model, view, file_selection_controller):
+    """
+    Constructor
+    @In, model, Model, the model (its function gives the package entry point of the jobs)
+    @In, view, JobQueue, the view
+    @In, file_selection_controller, FileSelectionController, the controller of the selected input files
+    @Out, None
+    """
+    self.view = view
+    self.file_selection_controller = file_selection_controller
+    self.scheduler = JobScheduler(model.func, max_concurrent=self.view.max_concurrent.get())
+    self.jobs = {}
+    self._after_id = None
+    # The scheduler notifies from the threads of the jobs: the changed jobs are queued and a virtual event wakes up the Tk main loop,
+    # which is the only one to update the view. Nothing is done by the main loop while no job changes
+    self.job_updates = queue.SimpleQueue()
+    self._bind_id = self.view.bind(JOBS_CHANGED_EVENT, self.update_jobs, add='+')
+    self.scheduler.add_observer(self.push_job)
+
+    self.view.add_selection_button.config(command=self.add_current_selection)
+    self.view.add_files_button.config(command=self.add_files)
+    self.view.remove_button.config(command=self.remove_selected)
+    self.view.abort_button.config(command=self.abort_selected)
+    self.view.start_stop_button.config(command=self.toggle_running)
+    self.view.max_concurrent.trace_add('write', lambda *args: self.set_max_concurrent())
+
+  def show(self):
+    """
+    Show the job queue window
+    @In, None
+    @Out, None
+    """
+    self.view.show()
+
+  def add_current_selection(self):
+    """
+    Queue a run with the files selected in the main window
+    @In, None
+    @Out, None
+    """
+    try:
+      args = self.file_selection_controller.get_sys_args_from_file_selection()
+    except (FileNotFoundError, TypeError) as e:
+      messagebox.showerror('Add Current Selection', f'The selected files cannot be queued: {e}', parent=self.view)
+      return
+    self.scheduler.add_job(args)
+
+  def add_files(self):
+    """
+    Queue one run per input file chosen in a file dialog (only for the packages with a single input file)
+    @In, None
+    @Out, None
+    """
+    file_type = self.file_selection_controller.get_single_input_file_type()
+    if file_type is None:
+      messagebox.showinfo('Add Files', 'This package needs several files per run. '
+                          'Select them in the main window and use "Add Current Selection".', parent=self.view)
+      return
+    initial_dir = self.file_selection_controller.persistence.get_location() or os.getcwd()
+    filenames = filedialog.askopenfilenames(parent=self.view, initialdir=initial_dir,
+                                            filetypes=[(file_type.upper(), f'*.{file_type}'), ('All Files', '*.*')])
+    for filename in filenames:
+      self.scheduler.add_job(self.file_selection_controller.get_sys_args_for_input_file(filename))
+
+  def remove_selected(self):
+    """
+    Remove the selected jobs that are not running
+    @In, None
+    @Out, None
+    """
+    for job_id in self.view.selected_jobs():
+      self.scheduler.remove_job(self.jobs[job_id])
+
+  def abort_selected(self):
+    """
+    Abort the selected running jobs
+    @In, None
+    @Out, None
+    """
+    running = [self.jobs[job_id] for job_id in self.view.selected_jobs() if self.jobs[job_id].model.can_abort()]
+    if running and messagebox.askokcancel('Abort jobs', f'Are you sure you want to abort {len(running)} running job(s)?', parent=self.view):
+      for job in running:
+        job.model.abort()
+
+  def toggle_running(self):
+    """
+    Start or stop the queue. Stopping the queue does not abort the running jobs.
+    @In, None
+    @Out, None
+    """
+    if self.scheduler.running:
+      self.scheduler.stop()
+    else:
+      self.scheduler.start()
+    self.view.set_running(self.scheduler.running)
+    self._update_elapsed_times()
+
+  def set_max_concurrent(self):
+    """
+    Apply the number of concurrent runs of the view to the scheduler
+    @In, None
+    @Out, None
+    """
+    try:
+      self.scheduler.max_concurrent = self.view.max_concurrent.get()
+    except (ValueError, tk.TclError):  # The spinbox is being edited
+      pass
+
+  def push_job(self, job):
+    """
+    Queue a job change pushed by the scheduler and wake up the Tk main loop (called from the thread of the job)
+    @In, job, Job, the job that changed
+    @Out, None
+    """
+    self.job_updates.put(job)
+    try:
+      self.view.event_generate(JOBS_CHANGED_EVENT, when='tail')
+    except (tk.TclError, RuntimeError):  # The window is destroyed (or its main loop is over)
+      pass
+
+  def update_jobs(self, event=None):
+    """
+    Update the rows of the jobs changed since the last call (called by the Tk main loop)
+    @In, event, tk.Event, optional, the jobs changed event
+    @Out, None
+    """
+    changed_jobs = {}
+    while True:
+      try:
+        job = self.job_updates.get_nowait()
+      except queue.Empty:
+        break
+      changed_jobs[job.job_id] = job
+    for job in changed_jobs.values():
+      self.update_job(job)
+
+  def update_job(self, job):
+    """
+    Update the row of a job (called by the Tk main loop)
+    @In, job, Job, the job
+    @Out, None
+    """
+    if job not in self.scheduler.jobs:
+      self.jobs.pop(job.job_id, None)
+      self.view.remove_job(job.job_id)
+      return
+    self.jobs[job.job_id] = job
+    self.view.set_job(job.job_id, job_row(job))
+    if job.status == ModelStatus.RUNNING:
+      self._update_elapsed_times()
+
+  def _update_elapsed_times(self):
+    """
+    Update the elapsed times of the running jobs every ELAPSED_TIME_INTERVAL ms while jobs are running
+    @In, None
+    @Out, None
+    """
+    if self._after_id is not None:
+      self.view.after_cancel(self._after_id)
+      self._after_id = None
+    running_jobs = self.scheduler.running_jobs()
+    for job in running_jobs:
+      self.view.set_job(job.job_id, job_row(job))
+    if running_jobs:
+      self._after_id = self.view.after(ELAPSED_TIME_INTERVAL, self._update_elapsed_times)
+
+  def close(self):
+    """
+    Stop the queue and abort the running jobs (e.g. when the application is closed).
+    It returns when the subprocesses of the jobs are terminated or killed. The view is not updated anymore.
+    @In, None
+    @Out, None
+    """
+    self.scheduler.remove_observer(self.push_job)
+    if self._bind_id is not None:
+      self.view.unbind(JOBS_CHANGED_EVENT, self._bind_id)
+      self._bind_id = None
+    if self._after_id is not None:
+      self.view.after_cancel(self._after_id)
+      self._after_id = None
+    self.scheduler.abort_all(wait=True)
+
+
+def job_row(job):
+  """
+  The values of the row of a job in the job queue view
+  @In, job, Job, the job
+  @Out, values, dict, the values by column name
+  """
+  elapsed = job.elapsed_time()
+  if job.start_time is None:
+    status = 'Queued'
+  elif job.status == ModelStatus.NOT_STARTED:
+    status = 'Starting'
+  else:
+    status = job.status.value
+  return {'input': job.name,
+          'status': status,
+          'elapsed': '' if elapsed is None else format_elapsed_time(elapsed),
+          'exit_code': '' if job.exit_code is None else str(job.exit_code)}
+
+
+def format_elapsed_time(seconds: float):
+  """
+  Format a duration as H:MM:SS
+  @In, seconds, float, the duration in s
+  @Out, text, str, the formatted duration
+  """
+  minutes, seconds = divmod(int(seconds), 60)
+  hours, minutes = divmod(minutes, 60)
+  return f'{hours}:{minutes:02d}:{seconds:02d}'
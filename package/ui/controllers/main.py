@@ -3,6 +3,7 @@ import sys
 from .file_selection import FileSelectionController
 from .text_output import TextOutputController
 from .model_status import ModelStatusController
+from .job_queue import JobQueueController
 
 
 class Controller:
@@ -14,20 +15,46 @@ class Controller:
     self.file_selection_controller = FileSelectionController(self.model, self.view.frames["file_selection"])
     self.text_output_controller = TextOutputController(self.model, self.view.frames["text_output"])
     self.model_status_controller = ModelStatusController(self.model, self.view.frames["text_output"].model_status)
+    self.job_queue_controller = JobQueueController(self.model, self.view.job_queue, self.file_selection_controller)
 
     # Bind the run button to the model
     self.view.frames["run_abort"].run_button.config(command=self.run_model)
-    # Bind the abort button to closing the window
-    self.view.frames["run_abort"].abort_button.config(command=self.quit)
+    # Bind the abort button to aborting the run (or closing the window if the run cannot be aborted)
+    self.view.frames["run_abort"].abort_button.config(command=self.abort)
+    # Bind the job queue button to showing the job queue window
+    self.view.frames["run_abort"].job_queue_button.config(command=self.job_queue_controller.show)
 
   def run_model(self):
+    if self.model.is_running():
+      print("The model is already running. Abort it before running it again.")
+      return
     # Construct sys.argv from the file selectors
-    sys.argv = [sys.argv[0]] + self.file_selection_controller.get_sys_args_from_file_selection()
+    args = self.file_selection_controller.get_sys_args_from_file_selection()
+    sys.argv = [sys.argv[0]] + args
     # Start the model
-    self.model.start()
+    self.model.start(args)
+
+  def abort(self):
+    """
+    Abort the run if it runs in a subprocess, otherwise quit the application
+    @In, None
+    @Out, None
+    """
+    if self.model.can_abort():
+      if self.view.ask_abort_run():
+        self.model.abort()
+    else:
+      self.quit()
 
   def start(self):
     self.view.mainloop()
+    # The status of the model is not shown anymore (the view must not be updated after the main loop)
+    self.model_status_controller.close()
+    # The window is closed: the runs in subprocesses are not left behind (they are terminated or killed before returning)
+    self.model.abort(wait=True)
+    self.job_queue_controller.close()
+    # The window is closed: the output is not redirected to it anymore
+    self.text_output_controller.close()
 
   def quit(self, showdialog: bool = True):
     """
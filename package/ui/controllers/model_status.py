@@ -1,7 +1,10 @@
-import threading
-import time
+import queue
+import tkinter as tk
 from ..models.main import ModelStatus
 
+# The virtual event generated by the model thread when it pushes a status change (it wakes up the Tk main loop)
+STATUS_CHANGED_EVENT = '<<ModelStatusChanged>>'
+
 
 class ModelStatusController:
   """ Tracks if the model is running and updates the view to reflect the status. """
@@ -14,28 +17,46 @@ class ModelStatusController:
     self.model = model
     self.view = view
     self._model_has_run = False  # Flag to indicate the model has already been run
-    self.check_model_status()
+    # The model pushes its status changes from its own thread: they are queued and a virtual event wakes up the Tk main loop,
+    # which is the only one to update the view. Nothing is done by the main loop while the status does not change
+    self.status_queue = queue.SimpleQueue()
+    self._bind_id = self.view.bind(STATUS_CHANGED_EVENT, self.update_status, add='+')
+    self.model.add_status_observer(self.push_status)
 
-  def check_model_status(self):
+  def push_status(self, status: ModelStatus):
     """
-    Check the status of the model and update the view
-    @In, None
+    Queue a status change of the model and wake up the Tk main loop (called from the thread of the model)
+    @In, status, ModelStatus, the new status
+    @Out, None
+    """
+    self.status_queue.put(status)
+    try:
+      self.view.event_generate(STATUS_CHANGED_EVENT, when='tail')
+    except (tk.TclError, RuntimeError):  # The window is destroyed (or its main loop is over)
+      pass
+
+  def update_status(self, event=None):
+    """
+    Show the last status pushed by the model (called by the Tk main loop)
+    @In, event, tk.Event, optional, the status changed event
     @Out, None
     """
-    def _check_status():
-      """
-      Local helper function for checking the status of the model in a separate thread
-      @In, None
-      @Out, None
-      """
-      current_status = self.model.status
-      while True:
-        if current_status != self.model.status:
-          current_status = self.model.status
-          self.view.set_status(self.model.status)
-        time.sleep(0.5)
+    status = None
+    while True:
+      try:
+        status = self.status_queue.get_nowait()
+      except queue.Empty:
+        break
+    if status is not None:
+      self.view.set_status(status)
 
-    thread = threading.Thread(target=_check_status)
-    thread.daemon = True
-    thread.name = "ModelStatusChecker"
-    thread.start()
+  def close(self):
+    """
+    Stop following the status of the model (e.g. when the window is closed)
+    @In, None
+    @Out, None
+    """
+    self.model.remove_status_observer(self.push_status)
+    if self._bind_id is not None:
+      self.view.unbind(STATUS_CHANGED_EVENT, self._bind_id)
+      self._bind_id = None
@@ -1,22 +1,65 @@
+import os
 import sys
 import io
-import threading
-import tkinter as tk
 import time
+import queue
+import tempfile
+import tkinter as tk
+from tkinter import messagebox
+
+from ui.utils import open_file
+
+# The default interval (in ms) between two flushes of the output to the widget and the default maximum number of lines
+# and characters per flush (the characters are also capped since the output may have few newlines, e.g. progress bars)
+FLUSH_INTERVAL = 100
+MAX_LINES_PER_FLUSH = 1000
+MAX_CHARS_PER_FLUSH = 100000
 
 
 class TextOutputController:
-  def __init__(self, model, view):
+  def __init__(self, model, view, flush_interval: int = FLUSH_INTERVAL, max_lines_per_flush: int = MAX_LINES_PER_FLUSH,
+               log_file: str | None = None, max_chars_per_flush: int = MAX_CHARS_PER_FLUSH):
     """
     Constructor
     @In, model, Model, the model to control
     @In, view, TextOutput, the view to control
+    @In, flush_interval, int, optional, the interval (in ms) between two flushes of the output to the text widget
+    @In, max_lines_per_flush, int, optional, the maximum number of lines written to the text widget per flush
+    @In, log_file, str, optional, the file to which the full output is written. The text widget only keeps the last lines
+      of the output. By default, a new "<package>_<date>_<time>.log" file is created in the temporary directory
+    @In, max_chars_per_flush, int, optional, the maximum number of characters written to the text widget per flush
     """
     self.view = view
-    self.redirector = StdoutRedirector(self.view.text)
+    if log_file is None:
+      log_file = os.path.join(tempfile.gettempdir(), f"{model.get_package_name()}_{time.strftime('%Y%m%d_%H%M%S')}.log")
+    self.log_file = log_file
+    self.redirector = StdoutRedirector(self.view.text, flush_interval=flush_interval, max_lines_per_flush=max_lines_per_flush,
+                                      log_file=self.log_file, max_chars_per_flush=max_chars_per_flush)
     self.redirector.start()
     # Define show/hide button behavior
     self.view.show_hide_button.config(command=self.toggle_show_text)
+    # The full log is only opened (by the default application) when asked for
+    self.view.view_log_button.config(command=self.view_full_log)
+
+  def view_full_log(self):
+    """
+    Open the log file with the full output
+    @In, None
+    @Out, None
+    """
+    self.redirector.flush_log()
+    try:
+      open_file(self.log_file)
+    except OSError as e:
+      messagebox.showerror('View Full Log', f'The log file {self.log_file} could not be opened: {e}')
+
+  def close(self):
+    """
+    Stop redirecting the output and close the log file
+    @In, None
+    @Out, None
+    """
+    self.redirector.stop()
 
   def toggle_show_text(self):
     """
@@ -35,47 +78,161 @@ class TextOutputController:
     # self.view.is_showing = not self.view.is_showing
 
 
+class QueueStream(io.TextIOBase):
+  """
+  A thread-safe text stream. The written text is put in a queue and read back in batches of lines by a single reader.
+  """
+  def __init__(self):
+    """
+    Constructor
+    @In, None
+    @Out, None
+    """
+    super().__init__()
+    self.queue = queue.SimpleQueue()
+    # The chunk taken from the queue and the position up to which it was read (only used by the reader)
+    self._pending = ''
+    self._offset = 0
+
+  def writable(self):
+    """
+    The stream is writable
+    @In, None
+    @Out, writable, bool, True
+    """
+    return True
+
+  def write(self, text):
+    """
+    Write text to the stream. It can be called from any thread.
+    @In, text, str, the text to write
+    @Out, n, int, the number of characters written
+    """
+    if text:
+      self.queue.put(text)
+    return len(text)
+
+  def read_lines(self, max_lines, max_chars=MAX_CHARS_PER_FLUSH):
+    """
+    Read the text written to the stream, up to max_lines lines and max_chars characters. The rest is kept for the next read.
+    A long chunk (e.g. a large write without newlines) is read in several calls without being copied again at each call.
+    @In, max_lines, int, the maximum number of lines to read
+    @In, max_chars, int, optional, the maximum number of characters to read
+    @Out, text, str, the text read (empty if nothing was written)
+    @Out, has_more, bool, whether there is more text to read
+    """
+    pieces = []
+    n_lines = n_chars = 0
+    while n_lines < max_lines and n_chars < max_chars:
+      if self._offset >= len(self._pending):
+        try:
+          self._pending, self._offset = self.queue.get_nowait(), 0
+        except queue.Empty:
+          break
+      # The rest of the chunk, within the characters left to read
+      piece = self._pending[self._offset:self._offset + max_chars - n_chars]
+      piece_lines = piece.count('\n')
+      if n_lines + piece_lines > max_lines:
+        # Split the piece after the last line that can be read
+        end = -1
+        for _ in range(max_lines - n_lines):
+          end = piece.index('\n', end + 1)
+        piece, piece_lines = piece[:end + 1], max_lines - n_lines
+      pieces.append(piece)
+      n_lines += piece_lines
+      n_chars += len(piece)
+      self._offset += len(piece)
+    if self._offset >= len(self._pending):
+      self._pending, self._offset = '', 0
+    return ''.join(pieces), bool(self._pending) or not self.queue.empty()
+
+
 class StdoutRedirector:
-  """ Redirects stdout to a tkinter widget """
-  def __init__(self, widget: tk.Widget):
+  """
+  Redirects stdout and stderr to a tkinter widget. The output can be written from any thread: it is put in a
+  queue that the Tk main loop drains periodically (with after()) so that the widget is only updated by the main thread.
+  The full output can also be written to a log file, since the widget may only keep the last lines of the output.
+  """
+  def __init__(self, widget: tk.Widget, flush_interval: int = FLUSH_INTERVAL, max_lines_per_flush: int = MAX_LINES_PER_FLUSH,
+               log_file: str | None = None, max_chars_per_flush: int = MAX_CHARS_PER_FLUSH):
     """
     Constructor
     @In, widget, tk.Widget, the widget to redirect stdout to
+    @In, flush_interval, int, optional, the interval (in ms) between two flushes of the output to the widget
+    @In, max_lines_per_flush, int, optional, the maximum number of lines written to the widget per flush. The rest of the
+      output is written by the next flushes, which are scheduled right away, so that the UI stays responsive when a lot is printed
+    @In, log_file, str, optional, the file to which the full output is written
+    @In, max_chars_per_flush, int, optional, the maximum number of characters written to the widget per flush
     @Out, None
     """
     self.widget = widget
-    self.redirect_output = io.StringIO()
+    self.flush_interval = flush_interval
+    self.max_lines_per_flush = max_lines_per_flush
+    self.max_chars_per_flush = max_chars_per_flush
+    self.redirect_output = QueueStream()
+    self._original_streams = (sys.stdout, sys.stderr)
+    self._after_id = None
+    self.log = open(log_file, 'a', encoding='utf-8') if log_file is not None else None
     sys.stdout = self.redirect_output
     sys.stderr = self.redirect_output
 
   def start(self):
     """
-    Start the redirector. Uses a daemon thread to monitor the output.
+    Start the redirector. The output is flushed to the widget by the Tk main loop.
+    @In, None
+    @Out, None
+    """
+    self._after_id = self.widget.after(self.flush_interval, self.flush)
+
+  def stop(self):
+    """
+    Stop the redirector, write the remaining output to the widget, restore stdout and stderr and close the log file
     @In, None
     @Out, None
     """
-    self.monitor_thread = threading.Thread(target=self.monitor_output)
-    self.monitor_thread.daemon = True
-    self.monitor_thread.start()
+    if self._after_id is not None:
+      self.widget.after_cancel(self._after_id)
+      self._after_id = None
+    sys.stdout, sys.stderr = self._original_streams
+    while self.write_output()[1]:
+      pass
+    if self.log is not None:
+      self.log.close()
+      self.log = None
 
-  def monitor_output(self):
+  def flush_log(self):
     """
-    Monitors the output and updates the widget
+    Write the output to the log file now (and to the widget) so that the log file is up to date
     @In, None
     @Out, None
     """
-    while True:
-      # Get the buffer's contents, then clear it
-      text = self.redirect_output.getvalue()
-      self.redirect_output.seek(0)
-      self.redirect_output.truncate(0)
-
-      # Update the widget's text
-      if text:
-        self.widget.config(state=tk.NORMAL)
-        self.widget.insert(tk.END, text)
-        self.widget.config(state=tk.DISABLED)
-        self.widget.see(tk.END)
-
-      # Sleep to prevent busy-waiting
-      time.sleep(0.1)  # FIXME: expose this as a parameter
+    while self.write_output()[1]:
+      pass
+    if self.log is not None:
+      self.log.flush()
+
+  def flush(self):
+    """
+    Writes a batch of the output to the widget and schedules the next flush
+    @In, None
+    @Out, None
+    """
+    has_more = self.write_output()[1]
+    # The next batch is written as soon as the pending events are processed if the output is not fully written yet
+    self._after_id = self.widget.after(1 if has_more else self.flush_interval, self.flush)
+
+  def write_output(self):
+    """
+    Writes up to max_lines_per_flush lines and max_chars_per_flush characters of the output to the widget (and the log file).
+    It must be called from the Tk main loop.
+    @In, None
+    @Out, text, str, the text written to the widget
+    @Out, has_more, bool, whether there is more output to write
+    """
+    text, has_more = self.redirect_output.read_lines(self.max_lines_per_flush, self.max_chars_per_flush)
+    if text:
+      if self.log is not None:
+        self.log.write(text)
+        self.log.flush()
+      self.widget.append(text)
+    return text, has_more
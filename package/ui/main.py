@@ -4,15 +4,17 @@ from ui.controllers import Controller
 from ui.views import View
 
 
-def run_from_gui(func: Callable, **kwargs):
+def run_from_gui(func: Callable, mode: str = "subprocess", **kwargs):
   """
   Runs the given function from the GUI.
   @In, func, Callable, the function to run
+  @In, mode, str, optional, "subprocess" to run the package entry point in a child process (the run can be aborted)
+    or "thread" to run the function in a thread of the GUI process
   @In, args, argparse.Namespace, optional, the parsed command-line arguments
   @In, kwargs, dict, optional, the keyword arguments for the model
   @Out, None
   """
-  model = Model(func, **kwargs)
+  model = Model(func, mode=mode, **kwargs)
   view = View()
   controller = Controller(model, view)
   controller.start()
@@ -1 +1,2 @@
 from .main import Model
+from .job_queue import Job, JobScheduler
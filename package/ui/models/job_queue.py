@@ -0,0 +1,230 @@
+import os
+import time
+import threading
+from typing import Callable
+
+from .main import Model, ModelStatus, ABORT_TIMEOUT
+
+# The statuses of a job that has run
+FINAL_STATUSES = (ModelStatus.FINISHED, ModelStatus.ERROR, ModelStatus.ABORTED)
+
+
+class Job:
+  """ One run of the model, with its own command line arguments, in a subprocess. """
+  def __init__(self, job_id: int, func: Callable, args: list):
+    """
+    Constructor
+    @In, job_id, int, the number of the job in the queue
+    @In, func, Callable, the function of the model (it gives the package entry point)
+    @In, args, list, the command line arguments of the run (e.g. the input file)
+    @Out, None
+    """
+    self.job_id = job_id
+    self.args = list(args)
+    self.name = os.path.basename(next((str(arg) for arg in self.args if str(arg).endswith('.xml')), str(self.args[0]) if self.args else ''))
+    self.model = Model(func, mode="subprocess", output_prefix=f"[job {job_id}] ")
+    self.start_time = None
+    self.end_time = None
+
+  @property
+  def status(self):
+    """
+    status getter
+    @In, None
+    @Out, status, ModelStatus, the status of the job
+    """
+    return self.model.status
+
+  @property
+  def exit_code(self):
+    """
+    exit_code getter
+    @In, None
+    @Out, exit_code, int, the exit code of the run (None if it has not finished)
+    """
+    return self.model.exit_code
+
+  def elapsed_time(self):
+    """
+    The time since the job started (or its duration if it has finished)
+    @In, None
+    @Out, elapsed, float, the elapsed time in s (None if the job has not started)
+    """
+    if self.start_time is None:
+      return None
+    return (self.end_time if self.end_time is not None else time.monotonic()) - self.start_time
+
+
+class JobScheduler:
+  """
+  A queue of jobs run in subprocesses, at most max_concurrent at a time, in the order they were added.
+  The next queued jobs are started when a job ends (the jobs statuses are pushed by the models, nothing is polled).
+  The job observers are called from the threads of the jobs.
+  """
+  def __init__(self, func: Callable, max_concurrent: int = 1):
+    """
+    Constructor
+    @In, func, Callable, the function of the model (it gives the package entry point)
+    @In, max_concurrent, int, optional, the maximum number of jobs that run at the same time
+    @Out, None
+    """
+    self.func = func
+    self.jobs = []
+    self.running = False
+    self._max_concurrent = max(1, int(max_concurrent))
+    self._observers = []
+    self._lock = threading.RLock()
+    self._next_id = 1
+
+  @property
+  def max_concurrent(self):
+    """
+    max_concurrent getter
+    @In, None
+    @Out, max_concurrent, int, the maximum number of jobs that run at the same time
+    """
+    return self._max_concurrent
+
+  @max_concurrent.setter
+  def max_concurrent(self, value: int):
+    """
+    max_concurrent setter. More jobs are started right away if the limit is raised.
+    @In, value, int, the maximum number of jobs that run at the same time
+    @Out, None
+    """
+    self._max_concurrent = max(1, int(value))
+    self._schedule()
+
+  def add_observer(self, callback: Callable):
+    """
+    Add a function that is called with a job whenever the job is added, removed or changes status
+    @In, callback, Callable, the observer, called as callback(job)
+    @Out, None
+    """
+    self._observers.append(callback)
+
+  def remove_observer(self, callback: Callable):
+    """
+    Remove a job observer
+    @In, callback, Callable, the observer
+    @Out, None
+    """
+    self._observers.remove(callback)
+
+  def _notify(self, job: Job):
+    """
+    Call the observers with a job
+    @In, job, Job, the job that changed
+    @Out, None
+    """
+    for observer in list(self._observers):
+      observer(job)
+
+  def add_job(self, args: list):
+    """
+    Add a job at the end of the queue. It is started right away if the scheduler is running and a slot is free.
+    @In, args, list, the command line arguments of the run
+    @Out, job, Job, the new job
+    """
+    with self._lock:
+      job = Job(self._next_id, self.func, args)
+      self._next_id += 1
+      self.jobs.append(job)
+    job.model.add_status_observer(lambda status, job=job: self._on_job_status(job, status))
+    self._notify(job)
+    self._schedule()
+    return job
+
+  def remove_job(self, job: Job):
+    """
+    Remove a job that is not running from the queue
+    @In, job, Job, the job
+    @Out, removed, bool, False if the job has started and has not ended (it needs to be aborted first)
+    """
+    with self._lock:
+      # A started job may not be RUNNING yet: its start time is set by _schedule under the same lock
+      if (job.start_time is not None and job.end_time is None) or job not in self.jobs:
+        return False
+      self.jobs.remove(job)
+    self._notify(job)
+    return True
+
+  def queued_jobs(self):
+    """
+    The jobs waiting to be run
+    @In, None
+    @Out, jobs, list, the queued jobs in order
+    """
+    with self._lock:
+      return [job for job in self.jobs if job.status == ModelStatus.NOT_STARTED and job.start_time is None]
+
+  def running_jobs(self):
+    """
+    The jobs that are running
+    @In, None
+    @Out, jobs, list, the running jobs
+    """
+    with self._lock:
+      return [job for job in self.jobs if job.start_time is not None and job.end_time is None]
+
+  def start(self):
+    """
+    Start running the queued jobs
+    @In, None
+    @Out, None
+    """
+    self.running = True
+    self._schedule()
+
+  def stop(self):
+    """
+    Do not start any more jobs (the running jobs go on)
+    @In, None
+    @Out, None
+    """
+    self.running = False
+
+  def abort_all(self, timeout: float = ABORT_TIMEOUT, wait: bool = False):
+    """
+    Stop the scheduler and abort the running jobs. All the jobs are aborted at the same time.
+    @In, timeout, float, optional, the time (in s) given to each job to terminate before it is killed
+    @In, wait, bool, optional, if True, the call blocks until the subprocesses of all the jobs are terminated or killed
+      (e.g. when the application is closed)
+    @Out, done, bool, False if some aborts were still in progress when the call returned
+    """
+    self.stop()
+    aborted = [job for job in self.running_jobs() if job.model.abort(timeout=timeout)]
+    if not wait:
+      return not aborted
+    # Each abort kills its job after the timeout: one more second is left for the kill itself
+    deadline = time.monotonic() + timeout + 1
+    return all([job.model.wait_for_abort(max(0.0, deadline - time.monotonic())) for job in aborted])
+
+  def _schedule(self):
+    """
+    Start the next queued jobs while fewer than max_concurrent jobs are running
+    @In, None
+    @Out, None
+    """
+    with self._lock:
+      if not self.running:
+        return
+      n_free = self._max_concurrent - len(self.running_jobs())
+      # The jobs are started under the lock so that abort_all reaches every started job
+      for job in self.queued_jobs()[:max(0, n_free)]:
+        job.start_time = time.monotonic()
+        job.model.start(job.args)
+
+  def _on_job_status(self, job: Job, status: ModelStatus):
+    """
+    Record the end of a job, start the next jobs and notify the observers (called from the thread of the job)
+    @In, job, Job, the job
+    @In, status, ModelStatus, the new status of the job
+    @Out, None
+    """
+    if status in FINAL_STATUSES:
+      with self._lock:
+        job.end_time = time.monotonic()
+    self._notify(job)
+    if status in FINAL_STATUSES:
+      self._schedule()
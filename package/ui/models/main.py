@@ -1,8 +1,21 @@
+import os
+import sys
+import signal
 import threading
+import subprocess
+import traceback
+from collections import deque
 from typing import Callable
 import time
 from enum import Enum
 
+from ui.utils import is_frozen_app
+
+# The time (in s) given to an aborted process to terminate before it is killed
+ABORT_TIMEOUT = 5
+# The number of lines of the standard error of a subprocess that are kept to find its traceback
+STDERR_TAIL_LINES = 200
+
 
 class ModelStatus(Enum):
   """ Enum for model status """
@@ -10,46 +23,275 @@ class ModelStatus(Enum):
   RUNNING = "Running"
   FINISHED = "Finished"
   ERROR = "Error"
+  ABORTED = "Aborted"
 
 
 class Model:
-  """ Runs a function in a separate thread """
-  def __init__(self, func: Callable, **kwargs):
+  """
+  Runs a function in a separate thread, or its package entry point in a subprocess.
+  In the subprocess mode, the entry point script (or the frozen executable) that started the GUI is run again with the
+  selected input files, so that the GUI stays responsive, the run can be aborted and its exit code is known.
+  The status changes are pushed to the observers (see add_status_observer) and notified through a condition
+  variable (see wait_for_status), so that nobody needs to poll the status.
+  """
+  MODES = ("thread", "subprocess")
+
+  def __init__(self, func: Callable, mode: str = "thread", output_prefix: str = "", **kwargs):
     """
     Constructor
     @In, func, Callable, the function to run
-    @In, kwargs, dict, keyword arguments to pass to the function
+    @In, mode, str, optional, "thread" to run the function in a thread of the GUI process or "subprocess" to run
+      the package entry point in a child process whose stdout and stderr are streamed to sys.stdout and sys.stderr
+    @In, output_prefix, str, optional, a prefix of the output lines of the subprocess (e.g. to tell concurrent runs apart)
+    @In, kwargs, dict, keyword arguments to pass to the function (only used in the thread mode)
     @Out, None
     """
+    if mode not in self.MODES:
+      raise ValueError(f"The mode '{mode}' is not one of the model modes: {self.MODES}")
     self.func = func
+    self.mode = mode
+    self.output_prefix = output_prefix
     self.thread = None
     self.kwargs = kwargs
-    self.status = ModelStatus.NOT_STARTED
+    self.status_changed = threading.Condition()
+    self._status_observers = []
+    self._status = ModelStatus.NOT_STARTED
+    self.process = None
+    self.exit_code = None
+    self.traceback = None
+    self._aborted = False
+    self._abort_thread = None
+    self._process_lock = threading.Lock()  # An abort and the launch of the subprocess do not interleave
+    # The command that runs the package entry point (sys.argv[0] may be relative to the initial working directory)
+    self.entry_point = [sys.executable] if is_frozen_app() else [sys.executable, os.path.abspath(sys.argv[0])]
 
-  def start(self):
+  @property
+  def status(self):
     """
-    Start the thread
+    status getter
     @In, None
+    @Out, status, ModelStatus, the status of the model
+    """
+    return self._status
+
+  @status.setter
+  def status(self, value: ModelStatus):
+    """
+    status setter. The waiting threads and the observers are notified if the status changes.
+    The observers are called from the thread that changes the status (usually not the Tk main loop).
+    @In, value, ModelStatus, the new status
+    @Out, None
+    """
+    with self.status_changed:
+      if value == self._status:
+        return
+      self._status = value
+      self.status_changed.notify_all()
+      observers = list(self._status_observers)
+    for observer in observers:
+      observer(value)
+
+  def add_status_observer(self, callback: Callable):
+    """
+    Add a function that is called with the new status whenever the status of the model changes
+    @In, callback, Callable, the observer, called as callback(status)
+    @Out, None
+    """
+    with self.status_changed:
+      self._status_observers.append(callback)
+
+  def remove_status_observer(self, callback: Callable):
+    """
+    Remove a status observer
+    @In, callback, Callable, the observer
+    @Out, None
+    """
+    with self.status_changed:
+      self._status_observers.remove(callback)
+
+  def wait_for_status(self, statuses, timeout: float | None = None):
+    """
+    Block until the status of the model is one of the given statuses
+    @In, statuses, ModelStatus or iterable, the expected status(es)
+    @In, timeout, float, optional, the maximum time to wait (in s). There is no limit if None
+    @Out, reached, bool, False if the timeout expired before the status was reached
+    """
+    statuses = (statuses,) if isinstance(statuses, ModelStatus) else tuple(statuses)
+    with self.status_changed:
+      return self.status_changed.wait_for(lambda: self._status in statuses, timeout=timeout)
+
+  def start(self, args: list | None = None):
+    """
+    Start the thread (or the subprocess)
+    @In, args, list, optional, the command line arguments of the run. sys.argv[1:] is used if None
+    @Out, None
+    """
+    if args is None:
+      args = sys.argv[1:]
+    self.exit_code = None
+    self.traceback = None
+    self._aborted = False
+    target = self._run_subprocess if self.mode == "subprocess" else self._run_function
+
+    self.thread = threading.Thread(target=target, args=(args,))
+    self.thread.daemon = True
+    self.thread.name = self.get_package_name()
+    self.thread.start()
+
+  def _run_function(self, args: list):
+    """
+    Run the function and set the status to FINISHED when done (or ERROR if it raises an exception)
+    @In, args, list, the command line arguments of the run (the function reads them from sys.argv)
     @Out, None
     """
-    def func_wrapper():
+    self.status = ModelStatus.RUNNING
+    try:
+      result = self.func(**self.kwargs)
+    except SystemExit as e:
+      self.exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+      self.exit_code = 1
+      self.traceback = traceback.format_exc()
+      print(self.traceback, file=sys.stderr)
+    else:
+      self.exit_code = result if isinstance(result, int) else 0
+    if self.traceback is None and self.exit_code == 0:
+      self.status = ModelStatus.FINISHED
+    else:
+      self.status = ModelStatus.ERROR
+
+  def _run_subprocess(self, args: list):
+    """
+    Run the package entry point in a subprocess, stream its output and set the status from its exit code
+    @In, args, list, the command line arguments of the run
+    @Out, None
+    """
+    self.status = ModelStatus.RUNNING
+    env = dict(os.environ, PYTHONUNBUFFERED="1")  # The output of the run is streamed as it is printed
+    popen_kwargs = {}
+    if sys.platform == "win32":
+      popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
+    else:
+      popen_kwargs["start_new_session"] = True  # The whole process group (e.g. the RAVEN workers) can be aborted
+    with self._process_lock:
+      if self._aborted:  # The run was aborted before its subprocess was launched
+        self.status = ModelStatus.ABORTED
+        return
+      try:
+        self.process = subprocess.Popen(self.entry_point + [str(arg) for arg in args], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                        stdin=subprocess.DEVNULL, text=True, bufsize=1, errors='replace', env=env, **popen_kwargs)
+      except OSError:
+        self.exit_code = 1
+        self.traceback = traceback.format_exc()
+        print(self.traceback, file=sys.stderr)
+        self.status = ModelStatus.ERROR
+        return
+
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    readers = [threading.Thread(target=self._forward_stream, args=(self.process.stdout, sys.stdout, self.output_prefix), daemon=True),
+               threading.Thread(target=self._forward_stream, args=(self.process.stderr, sys.stderr, self.output_prefix, stderr_tail), daemon=True)]
+    for reader in readers:
+      reader.start()
+    self.exit_code = self.process.wait()
+    for reader in readers:
+      reader.join()
+    self.traceback = extract_traceback(stderr_tail)
+    print(f"\n{self.output_prefix}{self.get_package_name()} exited with code {self.exit_code}", file=sys.stdout)
+    if self._aborted:
+      self.status = ModelStatus.ABORTED
+    elif self.exit_code == 0:
+      self.status = ModelStatus.FINISHED
+    else:
+      self.status = ModelStatus.ERROR
+
+  @staticmethod
+  def _forward_stream(pipe, stream, prefix: str = "", tail: deque | None = None):
+    """
+    Forward the lines read from a pipe of the subprocess to a stream until the pipe is closed
+    @In, pipe, io.TextIOWrapper, the stdout or stderr pipe of the subprocess
+    @In, stream, io.TextIOBase, the stream to write to (e.g. sys.stdout)
+    @In, prefix, str, optional, the prefix of the lines written to the stream
+    @In, tail, deque, optional, a bounded deque in which the last lines are also kept
+    @Out, None
+    """
+    with pipe:
+      for line in pipe:
+        stream.write(prefix + line)
+        if tail is not None:
+          tail.append(line)
+
+  def is_running(self):
+    """
+    Whether the model is running
+    @In, None
+    @Out, is_running, bool, True if the model is running
+    """
+    return self.status == ModelStatus.RUNNING
+
+  def can_abort(self):
+    """
+    Whether the run can be aborted (only a run in a subprocess can be aborted)
+    @In, None
+    @Out, can_abort, bool, True if the model is running in a subprocess
+    """
+    return self.mode == "subprocess" and self.process is not None and self.process.poll() is None
+
+  def abort(self, timeout: float = ABORT_TIMEOUT, wait: bool = False):
+    """
+    Abort the run: the subprocess (and its children) are terminated, and killed if they are still running after the timeout.
+    The status is set to ABORTED when the subprocess has exited.
+    @In, timeout, float, optional, the time (in s) given to the subprocess to terminate before it is killed
+    @In, wait, bool, optional, if True, the call blocks until the subprocess is terminated or killed (e.g. when the
+      application is closed). Otherwise, see wait_for_abort
+    @Out, aborted, bool, False if there is no subprocess to abort
+    """
+    with self._process_lock:
+      if self.mode != "subprocess" or self.thread is None:
+        return False
+      if self.process is None:
+        if not self.thread.is_alive():
+          return False
+        # The run is starting: its subprocess is not launched
+        self._aborted = True
+        return True
+      if self.process.poll() is not None:
+        return False
+      self._aborted = True
+      process = self.process
+
+    def _terminate():
       """
-      Wrapper for the function to run and set the status to FINISHED when done
+      Terminate the subprocess, then kill what is left of its process group after the timeout
       @In, None
       @Out, None
       """
-      self.status = ModelStatus.RUNNING
       try:
-        self.func(**self.kwargs)
-      except:
-        self.status = ModelStatus.ERROR
-      else:
-        self.status = ModelStatus.FINISHED
+        signal_process_group(process, force=False)
+        process.wait(timeout=timeout)
+      except subprocess.TimeoutExpired:
+        pass
+      except OSError:  # The process has already exited
+        pass
+      # The children that ignored the termination (or that outlived the subprocess) are killed
+      signal_process_group(process, force=True)
 
-    self.thread = threading.Thread(target=func_wrapper)
-    self.thread.daemon = True
-    self.thread.name = self.get_package_name()
-    self.thread.start()
+    # The thread is not a daemon: the interpreter does not exit before the subprocess is killed
+    self._abort_thread = threading.Thread(target=_terminate, name="ModelAbort")
+    self._abort_thread.start()
+    if wait:
+      self.wait_for_abort()
+    return True
+
+  def wait_for_abort(self, timeout: float | None = None):
+    """
+    Block until the last abort is done (the subprocess and its children are terminated or killed)
+    @In, timeout, float, optional, the maximum time to wait (in s). There is no limit if None
+    @Out, done, bool, False if the abort is still in progress after the timeout
+    """
+    if self._abort_thread is None:
+      return True
+    self._abort_thread.join(timeout)
+    return not self._abort_thread.is_alive()
 
   def get_package_name(self):
     """
@@ -58,3 +300,40 @@ class Model:
     @Out, package_name, str, the package name
     """
     return self.func.__module__.split('.')[0]
+
+
+def signal_process_group(process: subprocess.Popen, force: bool = False):
+  """
+  Terminate (or kill) a process started in its own process group (session) together with its children.
+  On POSIX, the children are signaled even if the process itself has already exited
+  @In, process, subprocess.Popen, the process
+  @In, force, bool, optional, if True, the processes are killed instead of terminated
+  @Out, None
+  """
+  if sys.platform == "win32":
+    if process.poll() is not None:
+      return
+    # taskkill also stops the children of the process
+    command = ["taskkill", "/T", "/PID", str(process.pid)] + (["/F"] if force else [])
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if force:
+      process.kill()
+  else:
+    # The process group outlives the process if some of its children are still running
+    try:
+      os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):  # The whole process group has exited
+      pass
+
+
+def extract_traceback(lines) -> str | None:
+  """
+  Find the last Python traceback in the output lines of a run
+  @In, lines, iterable, the last lines of the standard error of the run
+  @Out, traceback, str, the traceback (None if there is no traceback)
+  """
+  lines = list(lines)
+  starts = [i for i, line in enumerate(lines) if line.startswith("Traceback (most recent call last)")]
+  if not starts:
+    return None
+  return ''.join(lines[starts[-1]:])
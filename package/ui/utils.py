@@ -344,3 +344,18 @@ def run_in_workbench(file: str | None = None):
       command = [str(workbench_path), file]
     print("using command", command)
     subprocess.run(command)
+
+
+def open_file(file: str):
+  """
+  Opens a file with the default application of the operating system (e.g. a text editor for a log file).
+  The application is not waited for.
+  @ In, file, str, the file to open
+  @ Out, None
+  """
+  if platform.system() == "Windows":
+    os.startfile(file)
+  elif platform.system() == "Darwin":  # macOS
+    subprocess.Popen(["/usr/bin/open", file])
+  else:  # Linux
+    subprocess.Popen(["xdg-open", file])
@@ -0,0 +1,111 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class JobQueue(tk.Toplevel):
+  """ A window for queueing several runs and following their status. It is hidden instead of destroyed when closed. """
+  COLUMNS = {'input': ('Input', 260), 'status': ('Status', 90), 'elapsed': ('Elapsed', 80), 'exit_code': ('Exit Code', 70)}
+
+  def __init__(self, master: tk.Widget, **kwargs):
+    """
+    Constructor
+    @In, master, tk.Widget, the parent widget
+    @In, kwargs, dict, keyword arguments
+    @Out, None
+    """
+    super().__init__(master, **kwargs)
+    self.title('FORCE Job Queue')
+    self.geometry('600x350')
+    self.protocol('WM_DELETE_WINDOW', self.hide)
+
+    # Buttons to edit the queue
+    edit_frame = tk.Frame(self)
+    edit_frame.grid(row=0, column=0, sticky='ew', padx=10, pady=5)
+    self.add_selection_button = tk.Button(edit_frame, text='Add Current Selection', width=18)
+    self.add_selection_button.grid(row=0, column=0, sticky='w', padx=2)
+    self.add_files_button = tk.Button(edit_frame, text='Add Files...', width=10)
+    self.add_files_button.grid(row=0, column=1, sticky='w', padx=2)
+    self.remove_button = tk.Button(edit_frame, text='Remove', width=10)
+    self.remove_button.grid(row=0, column=2, sticky='w', padx=2)
+
+    # The jobs table
+    self.table = ttk.Treeview(self, columns=list(self.COLUMNS), show='headings', selectmode='extended')
+    for column, (heading, width) in self.COLUMNS.items():
+      self.table.heading(column, text=heading)
+      self.table.column(column, width=width, anchor='w' if column == 'input' else 'center')
+    scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.table.yview)
+    self.table.configure(yscrollcommand=scrollbar.set)
+    self.table.grid(row=1, column=0, sticky='nsew', padx=(10, 0))
+    scrollbar.grid(row=1, column=1, sticky='ns', padx=(0, 10))
+
+    # Scheduler controls
+    run_frame = tk.Frame(self)
+    run_frame.grid(row=2, column=0, columnspan=2, sticky='ew', padx=10, pady=5)
+    tk.Label(run_frame, text='Concurrent runs').grid(row=0, column=0, sticky='w')
+    self.max_concurrent = tk.IntVar(value=1)
+    self.max_concurrent_spinbox = tk.Spinbox(run_frame, from_=1, to=64, width=4, textvariable=self.max_concurrent)
+    self.max_concurrent_spinbox.grid(row=0, column=1, sticky='w', padx=5)
+    self.abort_button = tk.Button(run_frame, text='Abort Selected', width=12)
+    self.abort_button.grid(row=0, column=2, sticky='e', padx=2)
+    self.start_stop_button = tk.Button(run_frame, text='Start Queue', width=12)
+    self.start_stop_button.grid(row=0, column=3, sticky='e', padx=2)
+    run_frame.grid_columnconfigure(1, weight=1)
+
+    self.grid_rowconfigure(1, weight=1)
+    self.grid_columnconfigure(0, weight=1)
+    self.hide()
+
+  def show(self):
+    """
+    Show the window
+    @In, None
+    @Out, None
+    """
+    self.deiconify()
+    self.lift()
+
+  def hide(self):
+    """
+    Hide the window (the jobs keep running)
+    @In, None
+    @Out, None
+    """
+    self.withdraw()
+
+  def set_job(self, job_id: int, values: dict):
+    """
+    Add or update the row of a job
+    @In, job_id, int, the job number
+    @In, values, dict, the values of the row by column name (see COLUMNS)
+    @Out, None
+    """
+    row = [values.get(column, '') for column in self.COLUMNS]
+    if self.table.exists(str(job_id)):
+      self.table.item(str(job_id), values=row)
+    else:
+      self.table.insert('', tk.END, iid=str(job_id), values=row)
+
+  def remove_job(self, job_id: int):
+    """
+    Remove the row of a job
+    @In, job_id, int, the job number
+    @Out, None
+    """
+    if self.table.exists(str(job_id)):
+      self.table.delete(str(job_id))
+
+  def selected_jobs(self):
+    """
+    The job numbers of the selected rows
+    @In, None
+    @Out, job_ids, list, the selected job numbers
+    """
+    return [int(item) for item in self.table.selection()]
+
+  def set_running(self, running: bool):
+    """
+    Set the label of the start/stop button
+    @In, running, bool, whether the queue is running
+    @Out, None
+    """
+    self.start_stop_button.config(text='Stop Queue' if running else 'Start Queue')
@@ -2,6 +2,7 @@ from .root import Root
 from .file_selection import FileSelection
 from .text_output import TextOutput
 from .run_abort import RunAbort
+from .job_queue import JobQueue
 
 from tkinter.messagebox import askokcancel
 
@@ -29,6 +30,9 @@ class View:
     self.root.grid_rowconfigure(1, weight=1)
     self.root.grid_columnconfigure(0, weight=1)
 
+    # The job queue is a separate window, hidden until it is opened
+    self.job_queue = JobQueue(self.root)
+
   def add_frame(self, name, frame, **kwargs):
     """
     Add a frame to the view
@@ -48,6 +52,14 @@ class View:
     """
     self.root.mainloop()
 
+  def ask_abort_run(self):
+    """
+    Ask the user to confirm aborting the run
+    @In, None
+    @Out, confirmed, bool, True if the run should be aborted
+    """
+    return askokcancel('Abort run', 'Are you sure you want to abort the run?')
+
   def quit(self, showdialog: bool = True):
     """
     Quit the application
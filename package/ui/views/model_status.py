@@ -30,5 +30,7 @@ class ModelStatus(tk.Frame):
       self.status_label.config(fg='green')
     elif new_status == ModelStatusEnum.ERROR:
       self.status_label.config(fg='red')
+    elif new_status == ModelStatusEnum.ABORTED:
+      self.status_label.config(fg='orange')
     else:
       self.status_label.config(fg='black')
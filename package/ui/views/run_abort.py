@@ -12,11 +12,15 @@ class RunAbort(tk.Frame):
     """
     super().__init__(master, **kwargs)
     button_width = 10
+    self.job_queue_button = tk.Button(self, text='Job Queue', width=button_width)
+    self.job_queue_button.grid(row=0, column=0, sticky='w', padx=5)
+
     self.abort_button = tk.Button(self, text='Abort', width=button_width)
-    self.abort_button.grid(row=0, column=0, sticky='w', padx=5)
+    self.abort_button.grid(row=0, column=1, sticky='w', padx=5)
 
     self.run_button = tk.Button(self, text='Run', width=button_width)
-    self.run_button.grid(row=0, column=1, sticky='w', padx=5)
+    self.run_button.grid(row=0, column=2, sticky='w', padx=5)
 
     self.grid_columnconfigure(0, minsize=50)
-    self.grid_columnconfigure(1, weight=1, minsize=50)
+    self.grid_columnconfigure(1, minsize=50)
+    self.grid_columnconfigure(2, weight=1, minsize=50)
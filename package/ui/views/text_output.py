@@ -2,27 +2,62 @@ import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
 from .model_status import ModelStatus
 
+# The default number of lines kept in the text output widget
+MAX_SCROLLBACK_LINES = 10000
+
+
+class ScrollbackText(ScrolledText):
+  """ A read-only scrolled text widget that only keeps its last lines. """
+  def __init__(self, master, max_lines: int | None = MAX_SCROLLBACK_LINES, **kwargs):
+    """
+    Constructor
+    @In, master, tk.Widget, the parent widget
+    @In, max_lines, int, optional, the maximum number of lines kept in the widget. All the lines are kept if None
+    @In, kwargs, dict, keyword arguments
+    @Out, None
+    """
+    super().__init__(master, state=tk.DISABLED, **kwargs)
+    self.max_lines = max_lines
+
+  def append(self, text: str):
+    """
+    Append text at the end of the widget, drop the oldest lines beyond max_lines and scroll to the end
+    @In, text, str, the text to append
+    @Out, None
+    """
+    self.config(state=tk.NORMAL)
+    self.insert(tk.END, text)
+    if self.max_lines:
+      n_lines = int(self.index('end-1c').split('.')[0])
+      if n_lines > self.max_lines:
+        self.delete('1.0', f'{n_lines - self.max_lines + 1}.0')
+    self.config(state=tk.DISABLED)
+    self.see(tk.END)
+
 
 class TextOutput(tk.Frame):
   """ A widget for displaying text output. """
-  def __init__(self, master, **kwargs):
+  def __init__(self, master, max_lines: int | None = MAX_SCROLLBACK_LINES, **kwargs):
     """
     Constructor
     @In, master, tk.Widget, the parent widget
+    @In, max_lines, int, optional, the maximum number of lines kept in the text widget (the full output is in the log file)
     @In, kwargs, dict, keyword arguments
     @Out, None
     """
     super().__init__(master, **kwargs)
     self.show_hide_button = tk.Button(self, text='Hide Ouptut', pady=5, width=15)
     self.show_hide_button.grid(row=0, column=0, sticky='w')
+    self.view_log_button = tk.Button(self, text='View Full Log', pady=5, width=12)
+    self.view_log_button.grid(row=0, column=1, sticky='w')
     self.model_status = ModelStatus(self)
-    self.model_status.grid(row=0, column=1, sticky='e')
-    self.text = ScrolledText(self, state=tk.DISABLED)
+    self.model_status.grid(row=0, column=2, sticky='e')
+    self.text = ScrollbackText(self, max_lines=max_lines)
     self.is_showing = True  # To use with show/hide button
-    self.text.grid(row=1, column=0, sticky='nsew', columnspan=2)
+    self.text.grid(row=1, column=0, sticky='nsew', columnspan=3)
     self.grid_rowconfigure(0, minsize=50)
     self.grid_rowconfigure(1, weight=1)
-    self.grid_columnconfigure(0, weight=1)
+    self.grid_columnconfigure(1, weight=1)
 
   def show_text_output(self):
     """
@@ -30,7 +65,7 @@ class TextOutput(tk.Frame):
     @In, None
     @Out, None
     """
-    self.text.grid(row=1, column=0, sticky='nsew', columnspan=2)
+    self.text.grid(row=1, column=0, sticky='nsew', columnspan=3)
     self.show_hide_button.config(text='Hide Output')
     self.is_showing = True
     # Set window to default size
@@ -48,4 +83,4 @@ class TextOutput(tk.Frame):
     self.is_showing = False
     # Reduce window size
     self.master.update()
-    self.master.geometry("350x175")
+    self.master.geometry("450x175")
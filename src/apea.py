@@ -14,7 +14,8 @@ https://www.osti.gov/biblio/1890160
 
 To faciliate this integration, vaious classes and methods are created. This code includes the following:
 
-1 - Python Class and method for the component info in Aspen APEA
+1 - Python Class for the Aspen APEA output workbook (the 'Equipment' sheet is parsed once)
+2 - Python Class and method for the component info in Aspen APEA
 """
 #####
 # Section 0
@@ -24,26 +25,80 @@ import os
 from pathlib import Path
 import json
 import shutil
-import pandas as pd
+from functools import partial
+try:
+  from .aspen_utils import list_xlsx_files, map_files, cache_file_path, load_cached_components, store_cached_components, write_components_jsonl
+  from .aspen_utils import open_workbook, iter_sheet_rows, rows_to_frame
+except ImportError:
+  from aspen_utils import list_xlsx_files, map_files, cache_file_path, load_cached_components, store_cached_components, write_components_jsonl
+  from aspen_utils import open_workbook, iter_sheet_rows, rows_to_frame
+
+# The version of the extracted APEA components. It should be increased whenever the extracted information changes
+# so that the cached components (see extract_all_apea_components) are not used anymore
+APEA_PARSER_VERSION = 1
 
 #####
 # Section 1:
-# Python Classes for the APEA Component
+# Python Classes for the APEA Workbook and the APEA Component
+
+class ApeaWorkbook:
+  """
+    The APEA output workbook: the 'Equipment' sheet of an APEA output xlsx file is parsed only once
+    and the equipment rows are indexed by the component 'Name' so that every component look-up is done in memory
+  """
+  def __init__(self, xlsx_filename):
+    """
+    Constructor
+    @ In, xlsx_filename, str, APEA output xlsx file
+    @ Out, None
+    """
+    self.xlsx_filename = xlsx_filename
+    # Only the 'Equipment' sheet is read (in read-only mode)
+    workbook = open_workbook(self.xlsx_filename)
+    try:
+      self.equipment_data = rows_to_frame(list(iter_sheet_rows(workbook['Equipment'])), skiprows=3)
+    finally:
+      workbook.close()
+    # If two rows have the same name, the first row is the one used for this component (similar to the first match)
+    self.equipment_table = self.equipment_data.drop_duplicates(subset='Name', keep='first').set_index('Name')
+
+  def component_names(self):
+    """
+    The names of all the components (one name per row of the 'Equipment' sheet)
+    @ In, None
+    @ Out, component_names, list, the components names in the order of the 'Equipment' sheet
+    """
+    return list(self.equipment_data['Name'])
+
+  def component_value(self, component_name, column):
+    """
+    Looking up one value of one component
+    @ In, component_name, str, the component name
+    @ In, column, str, the column of the 'Equipment' sheet (e.g. 'Installed Cost [USD]')
+    @ Out, value, numpy scalar, the value of the component at the given column
+    """
+    if component_name not in self.equipment_table.index:
+      raise KeyError(f"The component '{component_name}' is not found in the APEA output file {self.xlsx_filename}")
+    return self.equipment_table.at[component_name, column]
+
 
 class ApeaComponent:
   """
     The APEA component: the APEA component is defined by the component name and the APEA output xlsx file from which the component info is 
     imported (it is possible to have two compoennts with the same name) from different xlsx APEA outputs
   """
-  def __init__(self, xlsx_filename, component_name):
+  def __init__(self, xlsx_filename, component_name, workbook=None):
     """
     Constructor
     @ In, xlsx_filename, str, APEA output xlsx file from which the component info is imported
     @ In, component_name, str, the component name
+    @ In, workbook, ApeaWorkbook, optional, the already loaded APEA workbook of xlsx_filename.
+      If not provided, the workbook is loaded when the component info is requested
     @ Out, None
     """
     self.xlsx_filename = xlsx_filename
     self.component_name = component_name
+    self.workbook = workbook
 
   def component_cost_info(self):
     """
@@ -52,11 +107,12 @@ class ApeaComponent:
     @ Out, apea_comp_info,  dict, The component economic infomration extracted from the APEA code for a specific component
     """
 
-    file_data= pd.read_excel(self.xlsx_filename, sheet_name='Equipment', skiprows=3)
-    equipment_cost = file_data.loc[file_data['Name'] == self.component_name,  'Equipment Cost [USD]'].values[0]
-    installed_cost = file_data.loc[file_data['Name'] == self.component_name,  'Installed Cost [USD]'].values[0]
-    equipment_weight  = file_data.loc[file_data['Name'] == self.component_name,  'Equipment Weight [LBS]'].values[0]
-    total_installed_weight = file_data.loc[file_data['Name'] == self.component_name, 'Total Installed Weight [LBS]'].values[0]
+    if self.workbook is None:
+      self.workbook = ApeaWorkbook(self.xlsx_filename)
+    equipment_cost = self.workbook.component_value(self.component_name, 'Equipment Cost [USD]')
+    installed_cost = self.workbook.component_value(self.component_name, 'Installed Cost [USD]')
+    equipment_weight  = self.workbook.component_value(self.component_name, 'Equipment Weight [LBS]')
+    total_installed_weight = self.workbook.component_value(self.component_name, 'Total Installed Weight [LBS]')
 
     apea_comp_info= {
                       "Component Name": self.component_name,
@@ -73,38 +129,76 @@ class ApeaComponent:
 
 #####
 # Section 2:
-# Python Method extracing all the APEA components
+# Python Methods extracing all the APEA components
+
+def extract_apea_components_from_file(apea_file_path, apea_xlsx_outputs_folder_path, cache_folder=None, persist=True):
+  """
+    Extracting all the Aspen APEA components of one APEA output file
+    @ In, apea_file_path, str, The path of the APEA output xlsx file
+    @ In, apea_xlsx_outputs_folder_path, str, The path of the folder that includes all the outut files from APEA
+    @ In, cache_folder, str, optional, The folder of the cached components. If the same file was already parsed
+      (same content and same parser version), the components are loaded from the cache instead of the xlsx file
+    @ In, persist, bool, optional, If False, the components are only returned in memory and no text file is written
+    @ Out, APEA_outputs_path, str, The folder that contains the components created from this APEA file (None if persist is False)
+    @ Out, list_of_APEA_dicts, list, The components dictionaries of this APEA file
+  """
+  cache_path = None
+  if cache_folder is not None:
+    cache_path = cache_file_path(cache_folder, apea_file_path, "APEA", APEA_PARSER_VERSION)
+  list_of_APEA_dicts = load_cached_components(cache_path)
+  if list_of_APEA_dicts is None:
+    # The 'Equipment' sheet is parsed once per file
+    apea_workbook = ApeaWorkbook(apea_file_path)
+    list_of_APEA_dicts = []
+    for component_name in apea_workbook.component_names():
+      component_1= ApeaComponent(apea_file_path, component_name, workbook=apea_workbook)
+      list_of_APEA_dicts.append(component_1.component_cost_info())
+    store_cached_components(cache_path, apea_file_path, list_of_APEA_dicts)
+
+  if not persist:
+    return None, list_of_APEA_dicts
+  APEA_outputs_path = os.path.split(os.path.abspath(apea_xlsx_outputs_folder_path))[0]+\
+    "/APEA_comps/comp_from_"+str(os.path.basename(apea_file_path))+"/"
+  APEA_outputs_path  = APEA_outputs_path.replace(" ", "_")
+  isExist = os.path.exists(APEA_outputs_path)
+  if isExist:
+    shutil.rmtree(APEA_outputs_path)
+  # Create a new directory
+  os.makedirs(APEA_outputs_path)
+  print("\n A new directory is created with all the APEA components at:","\n",APEA_outputs_path, "\n")
+
+  for component_1_info in list_of_APEA_dicts:
+    output_file = APEA_outputs_path + str(component_1_info["Component Name"]).replace(" ", "").replace('/', '_')+".txt"
+    # # remove old file if exists
+    file_exists = os.path.exists(output_file)
+    if file_exists:
+      os.remove(output_file)
+    with open(output_file, 'w') as output:
+      json.dump(component_1_info, output, indent = 2)
+  return APEA_outputs_path, list_of_APEA_dicts
+
 
-def extract_all_apea_components(apea_xlsx_outputs_folder_path):
+def extract_all_apea_components(apea_xlsx_outputs_folder_path, workers=None, cache_folder=None, persist=True, jsonl_file=None):
   """
     Extracting all the Aspen APEA components
     @ In, apea_xlsx_outputs, str, The path of the folder that includes all the outut files from APEA
-    @ Out, APEA_outputs_path, str, The folder that contains the components created from the Aspen APEA code
+    @ In, workers, int, optional, The number of processes that parse the APEA files in parallel (sequential if None or 1)
+    @ In, cache_folder, str, optional, The folder of the cached components. Only the new or modified files are parsed
+    @ In, persist, bool, optional, If False, no folder and no text file is created for the components (they are only returned in memory)
+    @ In, jsonl_file, str, optional, The path of a JSON Lines file where all the components are written (one component per line)
+    @ Out, APEA_outputs_path, str, The folder that contains the components created from the Aspen APEA code (None if persist is False)
+    @ Out, list_of_APEA_dicts, list, The components dictionaries of all the APEA files (in the order of the files names)
   """
-  files_list = os.listdir(apea_xlsx_outputs_folder_path)
+  apea_files_paths = list_xlsx_files(apea_xlsx_outputs_folder_path)
+  results = map_files(partial(extract_apea_components_from_file,
+                              apea_xlsx_outputs_folder_path=apea_xlsx_outputs_folder_path,
+                              cache_folder=cache_folder,
+                              persist=persist),
+                      apea_files_paths, workers=workers)
+  APEA_outputs_path = None
   list_of_APEA_dicts = []
-  for xlsxfile in files_list:
-    if xlsxfile.endswith(".xlsx"):
-      if xlsxfile[0].isalpha() or xlsxfile[0].isdigit():
-        apea_file_path = apea_xlsx_outputs_folder_path + "/"+xlsxfile
-        apea_file_data= pd.read_excel(apea_file_path, sheet_name='Equipment',skiprows=3)
-        APEA_outputs_path = os.path.split(os.path.abspath(apea_xlsx_outputs_folder_path))[0]+\
-          "/APEA_comps/comp_from_"+str(os.path.basename(apea_file_path))+"/"
-        APEA_outputs_path  = APEA_outputs_path.replace(" ", "_")
-        isExist = os.path.exists(APEA_outputs_path)
-        if isExist:
-          shutil.rmtree(APEA_outputs_path)
-        # Create a new directory
-        os.makedirs(APEA_outputs_path)
-        print("\n A new directory is created with all the APEA components at:","\n",APEA_outputs_path, "\n")
-
-        for ind in apea_file_data.index:
-          component_1= ApeaComponent(apea_file_path, apea_file_data['Name'][ind])
-          output_file = APEA_outputs_path + str(component_1.component_name).replace(" ", "").replace('/', '_')+".txt"
-          # # remove old file if exists
-          file_exists = os.path.exists(output_file)
-          if file_exists:
-            os.remove(output_file)
-          json.dump(component_1.component_cost_info(), open(output_file, 'w'),indent = 2)
-          list_of_APEA_dicts.append(component_1.component_cost_info())
+  for APEA_outputs_path, file_APEA_dicts in results:
+    list_of_APEA_dicts.extend(file_APEA_dicts)
+  if jsonl_file is not None:
+    write_components_jsonl(jsonl_file, list_of_APEA_dicts)
   return APEA_outputs_path, list_of_APEA_dicts
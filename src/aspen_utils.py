@@ -0,0 +1,276 @@
+# Copyright 2024, Battelle Energy Alliance, LLC
+# ALL RIGHTS RESERVED
+"""
+The objective of this code is the vertical integration (auomated data transfer) between different IES codes.
+- Most of these IES codes are the FORCE codes: https://ies.inl.gov/SitePages/FORCE.aspx
+- Other codes are the Aspen HYSYS and the Aspen APEA:
+https://www.aspentech.com/en/products/engineering/aspen-hysys
+https://www.aspentech.com/en/products/pages/aspen-process-economic-analyzer
+
+This code includes the utilities that are shared by the Aspen HYSYS and the Aspen APEA modules:
+
+1 - Python Methods to find the Aspen output xlsx files and to process them (sequentially or on a process pool)
+2 - Python Methods for the on-disk cache of the components extracted from the Aspen output files.
+The cache is keyed by the content of the xlsx file and the version of the parser so that unchanged files are not parsed again
+3 - Python Methods for the consolidated JSON Lines artifacts (one file with one component per line instead of one file per component)
+4 - Python Methods for the streaming (read-only) access to the xlsx files. The rows of a sheet are read lazily so that only the needed sheets
+and rows are read, and the rows are converted to DataFrames exactly as pandas.read_excel converts them
+"""
+#####
+# Section 0
+# Importing libraries and modules
+
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import openpyxl
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+# The strings that pandas.read_excel reads as missing values (its default na_values)
+NA_STRINGS = frozenset(["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+                        "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"])
+
+#####
+# Section 1:
+# Python Methods to find and process the Aspen output xlsx files
+
+def list_xlsx_files(xlsx_outputs_folder_path):
+  """
+    Listing the Aspen output xlsx files of a folder (temporary files such as "~$file.xlsx" are skipped)
+    @ In, xlsx_outputs_folder_path, str, The path of the folder that includes the xlsx output files
+    @ Out, xlsx_files_paths, list, The paths of the xlsx files sorted by the file name
+  """
+  xlsx_files_paths = []
+  for xlsxfile in sorted(os.listdir(xlsx_outputs_folder_path)):
+    if xlsxfile.endswith(".xlsx"):
+      if xlsxfile[0].isalpha() or xlsxfile[0].isdigit():
+        xlsx_files_paths.append(xlsx_outputs_folder_path + "/" + xlsxfile)
+  return xlsx_files_paths
+
+
+def map_files(func, files_paths, workers=None):
+  """
+    Applying a function to several files either sequentially or on a process pool
+    @ In, func, callable, a picklable (module level) function that takes one file path
+    @ In, files_paths, list, The paths of the files
+    @ In, workers, int, optional, The number of worker processes. The files are processed sequentially if None or 1
+    @ Out, results, list, The results of func in the same order as files_paths
+  """
+  if workers is None or workers <= 1 or len(files_paths) <= 1:
+    return [func(file_path) for file_path in files_paths]
+  with ProcessPoolExecutor(max_workers=min(workers, len(files_paths))) as executor:
+    return list(executor.map(func, files_paths))
+
+
+#####
+# Section 2:
+# Python Methods for the cache of the extracted components
+
+def file_content_hash(file_path, chunk_size=1 << 20):
+  """
+    Hashing the content of a file
+    @ In, file_path, str, The path of the file
+    @ In, chunk_size, int, optional, The number of bytes read at once
+    @ Out, content_hash, str, The sha256 hex digest of the file content
+  """
+  content_hash = hashlib.sha256()
+  with open(file_path, 'rb') as opened_file:
+    for chunk in iter(lambda: opened_file.read(chunk_size), b''):
+      content_hash.update(chunk)
+  return content_hash.hexdigest()
+
+
+def cache_file_path(cache_folder, xlsx_file_path, parser_name, parser_version):
+  """
+    The path of the cache file of one xlsx file.
+    The cache key includes the file content, the path of the file (it is stored in the components "Source" and "ID"),
+    the parser name and the parser version
+    @ In, cache_folder, str, The folder of the cache files
+    @ In, xlsx_file_path, str, The path of the xlsx file
+    @ In, parser_name, str, The parser name (e.g. "HYSYS" or "APEA")
+    @ In, parser_version, int, The parser version. It should be increased whenever the extracted information changes
+    @ Out, cache_path, str, The path of the cache file
+  """
+  cache_key = hashlib.sha256()
+  cache_key.update(f"{parser_name}|{parser_version}|{xlsx_file_path}|".encode('utf8'))
+  cache_key.update(file_content_hash(xlsx_file_path).encode('utf8'))
+  return os.path.join(cache_folder, f"{parser_name}_{cache_key.hexdigest()}.json")
+
+
+def load_cached_components(cache_path):
+  """
+    Loading the components of an xlsx file from the cache
+    @ In, cache_path, str, The path of the cache file (see cache_file_path). No cache is used if None
+    @ Out, components, list, The cached components dictionaries (None if the file is not cached)
+  """
+  if cache_path is None or not os.path.exists(cache_path):
+    return None
+  try:
+    with open(cache_path) as cache_file:
+      cached = json.load(cache_file)
+    source, components = cached["Source"], cached["Components"]
+  except (ValueError, KeyError, TypeError):
+    # A corrupted cache file (truncated, not JSON or not a cache file) is ignored and the xlsx file is parsed again
+    return None
+  if not isinstance(components, list):
+    return None
+  print(f"\n The components of '{source}' are loaded from the cache file: {cache_path}")
+  return components
+
+
+def store_cached_components(cache_path, xlsx_file_path, components):
+  """
+    Storing the components of an xlsx file in the cache
+    @ In, cache_path, str, The path of the cache file (see cache_file_path). Nothing is stored if None
+    @ In, xlsx_file_path, str, The path of the xlsx file
+    @ In, components, list, The components dictionaries extracted from the xlsx file
+    @ Out, None
+  """
+  if cache_path is None:
+    return
+  os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+  cached = {"Source": xlsx_file_path,
+            "Components": components}
+  # Writing to a temporary file first so that an interrupted run does not leave a corrupted cache file
+  temporary_path = cache_path + f".{os.getpid()}.tmp"
+  with open(temporary_path, 'w') as cache_file:
+    json.dump(cached, cache_file, default=_json_default)
+  os.replace(temporary_path, cache_path)
+
+
+def _json_default(value):
+  """
+    Converting the numpy scalars (e.g. numpy.int64) that are not JSON serializable
+    @ In, value, object, The value that the json module cannot serialize
+    @ Out, value, object, The equivalent python value
+  """
+  if hasattr(value, 'item'):
+    return value.item()
+  raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+#####
+# Section 3:
+# Python Methods for the consolidated JSON Lines artifacts
+
+def write_components_jsonl(jsonl_file_path, components):
+  """
+    Writing components dictionaries to one JSON Lines file (one component per line)
+    @ In, jsonl_file_path, str, The path of the JSON Lines file (e.g. "HYSYS_comps.jsonl"). It is overwritten if it exists
+    @ In, components, list, The components dictionaries
+    @ Out, None
+  """
+  folder = os.path.dirname(os.path.abspath(jsonl_file_path))
+  os.makedirs(folder, exist_ok=True)
+  temporary_path = jsonl_file_path + f".{os.getpid()}.tmp"
+  with open(temporary_path, 'w') as jsonl_file:
+    for component in components:
+      jsonl_file.write(json.dumps(component, default=_json_default) + "\n")
+  os.replace(temporary_path, jsonl_file_path)
+  print(f"\n {len(components)} components are written to: {jsonl_file_path}")
+
+
+def read_components_jsonl(jsonl_file_path):
+  """
+    Reading the components dictionaries of a JSON Lines file (see write_components_jsonl)
+    @ In, jsonl_file_path, str, The path of the JSON Lines file
+    @ Out, components, list, The components dictionaries
+  """
+  with open(jsonl_file_path) as jsonl_file:
+    return [json.loads(line) for line in jsonl_file if line.strip()]
+
+#####
+# Section 4:
+# Python Methods for the streaming (read-only) access to the xlsx files
+
+def open_workbook(xlsx_file_path):
+  """
+    Opening an xlsx file in read-only mode: the sheets are not loaded until their rows are iterated.
+    The workbook should be closed (workbook.close()) once the needed rows are read
+    @ In, xlsx_file_path, str, The path of the xlsx file
+    @ Out, workbook, openpyxl.Workbook, The read-only workbook (the cached values of the formulas are read)
+  """
+  return openpyxl.load_workbook(xlsx_file_path, read_only=True, data_only=True, keep_links=False)
+
+
+def _convert_cell(cell):
+  """
+    Converting the value of a cell as pandas.read_excel converts it (empty cells are "", errors are NaN and integral numbers are int)
+    @ In, cell, openpyxl cell, The cell
+    @ Out, value, object, The converted value
+  """
+  if cell.value is None:
+    return ""
+  if cell.data_type == TYPE_ERROR:
+    return np.nan
+  if cell.data_type == TYPE_NUMERIC:
+    value = int(cell.value)
+    if value == cell.value:
+      return value
+    return float(cell.value)
+  return cell.value
+
+
+def iter_sheet_rows(worksheet):
+  """
+    Streaming the rows of a read-only worksheet. The rows are read lazily so that the caller can stop once it has the needed rows
+    @ In, worksheet, openpyxl read-only worksheet, The worksheet (see open_workbook)
+    @ Out, rows, generator, The converted values of each row (the trailing empty cells are trimmed)
+  """
+  # The dimensions stored in some xlsx files are wrong
+  worksheet.reset_dimensions()
+  for row in worksheet.rows:
+    converted_row = [_convert_cell(cell) for cell in row]
+    while converted_row and converted_row[-1] == "":
+      converted_row.pop()
+    yield converted_row
+
+
+def rows_to_frame(rows, skiprows=None):
+  """
+    Creating a DataFrame from the streamed rows of a sheet (see iter_sheet_rows). The first row that is not skipped is the header,
+    and the column names, the missing values and the data types are the same as the ones of pandas.read_excel
+    @ In, rows, list, The rows of the sheet
+    @ In, skiprows, int, optional, The number of rows that are skipped before the header
+    @ Out, frame, pandas.DataFrame, The sheet data
+  """
+  # The empty rows at the end of the sheet are dropped and the number of columns is the width of the sheet (including the skipped rows)
+  last_row_with_data = max((i for i, row in enumerate(rows) if row), default=-1)
+  max_width = max((len(row) for row in rows), default=0)
+  rows = rows[(skiprows or 0):last_row_with_data + 1]
+  if not rows:
+    return pd.DataFrame()
+  header = [f"Unnamed: {i}" if name == "" else name for i, name in enumerate(rows[0] + [""] * (max_width - len(rows[0])))]
+  data = [[np.nan if isinstance(value, str) and value in NA_STRINGS else value for value in row] + [np.nan] * (max_width - len(row))
+          for row in rows[1:]]
+  frame = pd.DataFrame(data, columns=deduplicate_names(header), dtype=object)
+  if data:
+    # As read by pandas, the columns of numbers (or of numeric strings) are numeric and the other columns get their inferred type
+    for i in range(max_width):
+      try:
+        frame.isetitem(i, pd.to_numeric(frame.iloc[:, i]))
+      except (ValueError, TypeError):
+        frame.isetitem(i, frame.iloc[:, i].infer_objects())
+  return frame
+
+
+def deduplicate_names(names):
+  """
+    Renaming the duplicate column names as pandas does ("X", "X.1", "X.2", ...)
+    @ In, names, list, The column names
+    @ Out, names, list, The unique column names
+  """
+  counts = {}
+  unique_names = []
+  for name in names:
+    count = counts.get(name, 0)
+    while count > 0:
+      counts[name] = count + 1
+      name = f"{name}.{count}"
+      count = counts.get(name, 0)
+    unique_names.append(name)
+    counts[name] = count + 1
+  return unique_names
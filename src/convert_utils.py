@@ -15,7 +15,7 @@
 # This script is imported from: /raven/scripts/conversionScripts/convert_utils.py. It can be also imported from RAVEN
 
 from __future__ import print_function, unicode_literals
-import xml.dom.minidom as pxml
+import io
 import xml.etree.ElementTree as ET
 import os
 import sys
@@ -41,16 +41,157 @@ def prettify(tree):
   """
     Script for turning XML tree into something mostly RAVEN-preferred.  Does not align attributes as some devs like (yet).
     The output can be written directly to a file, as open('whatever.who','w').writelines(prettify(mytree))
+    To write large files, write_pretty can be used to write the tree directly to the file.
     @ In, tree, xml.etree.ElementTree object, the tree form of an input file
     @Out, towrite, string, the entire contents of the desired file to write, including newlines
   """
-  #make the first pass at pretty.  This will insert way too many newlines, because of how we maintain XML format.
-  pretty = pxml.parseString(ET.tostring(tree.getroot())).toprettyxml(indent='  ')
-  #loop over each "line" and toss empty ones, but for ending main nodes, insert a newline after.
-  towrite=''
-  for line in pretty.split('\n'):
-    if line.strip()=='':continue
-    towrite += line.rstrip()+'\n'
-    if line.startswith('  </'): towrite+='\n\n'
-    if line.startswith('    </'): towrite+='\n'
-  return towrite
+  towrite = io.StringIO()
+  write_pretty(tree, towrite)
+  return towrite.getvalue()
+
+
+def write_pretty(tree, handle, indent='  '):
+  """
+    Writes the XML tree in the RAVEN-preferred format (see prettify) to a file handle.
+    The tree is traversed once and written line by line, so that large trees are written in linear time
+    without keeping a copy of the whole document in memory.
+    The output is the same as the one of xml.dom.minidom toprettyxml, without the empty lines,
+    and with blank lines after the ending main nodes.
+    Namespaced tags and attributes ('{uri}name') are written with prefixes and xmlns declarations on the root
+    element, the same way as xml.etree.ElementTree.tostring does.
+    @ In, tree, xml.etree.ElementTree object (or its root element), the tree form of an input file
+    @ In, handle, file-like object, the opened file (or any object with a write method)
+    @ In, indent, string, optional, the indentation added at each level
+    @Out, None
+  """
+  root = tree.getroot() if hasattr(tree, 'getroot') else tree
+  namespaces = _namespaces(root)
+  pending = [] # the chunks of the current line
+  for chunk in _pretty_chunks(root, '', indent, '<?xml version="1.0" ?>\n', namespaces):
+    if '\n' not in chunk:
+      pending.append(chunk)
+      continue
+    pending.append(chunk)
+    lines = ''.join(pending).split('\n')
+    pending = [lines.pop()]
+    for line in lines:
+      _write_pretty_line(line, handle)
+  _write_pretty_line(''.join(pending), handle)
+
+
+def _write_pretty_line(line, handle):
+  """
+    Writes one line of the pretty XML: empty lines are tossed, and for ending main nodes, a newline is inserted after.
+    @ In, line, string, the line (without its newline)
+    @ In, handle, file-like object, the opened file
+    @Out, None
+  """
+  if line.strip() == '':
+    return
+  handle.write(line.rstrip()+'\n')
+  if line.startswith('  </'):
+    handle.write('\n\n')
+  if line.startswith('    </'):
+    handle.write('\n')
+
+
+def _namespaces(root):
+  """
+    Finds the namespaces of the tags and attribute names of a tree and gives them a prefix, the same way as
+    xml.etree.ElementTree.tostring (the registered prefixes are used, the other namespaces are named ns0, ns1...)
+    @ In, root, xml.etree.ElementTree.Element, the root element
+    @Out, namespaces, dict, the prefix of each namespace uri, in the order in which they are found
+  """
+  namespaces = {}
+  registered = ET._namespace_map # the prefixes registered with ET.register_namespace (and the well-known ones)
+  for node in root.iter():
+    if not isinstance(node.tag, str):
+      continue # comments and processing instructions
+    for name in [node.tag] + list(node.attrib):
+      if not isinstance(name, str) or not name.startswith('{'):
+        continue
+      uri = name[1:].split('}', 1)[0]
+      if uri not in namespaces:
+        namespaces[uri] = registered.get(uri, 'ns{}'.format(len(namespaces)))
+  return namespaces
+
+
+def _qualified_name(name, namespaces):
+  """
+    Writes a tag or an attribute name with the prefix of its namespace ('{uri}name' becomes 'prefix:name')
+    @ In, name, string, the name
+    @ In, namespaces, dict, the prefix of each namespace uri (see _namespaces)
+    @Out, name, string, the qualified name
+  """
+  if not name.startswith('{'):
+    return name
+  uri, local = name[1:].split('}', 1)
+  return '{}:{}'.format(namespaces[uri], local)
+
+
+def _pretty_chunks(node, indent, addindent, header='', namespaces=None):
+  """
+    Generates the pretty XML of a node (and its tail) as chunks of text, the same way as xml.dom.minidom toprettyxml.
+    @ In, node, xml.etree.ElementTree.Element, the node (element, comment or processing instruction)
+    @ In, indent, string, the current indentation
+    @ In, addindent, string, the indentation added at each level
+    @ In, header, string, optional, a text written before the node (e.g. the XML declaration). The namespaces are
+      declared on the node if a header is given (i.e. on the root element)
+    @ In, namespaces, dict, optional, the prefix of each namespace uri of the tree (see _namespaces)
+    @Out, chunks, generator, the chunks of text
+  """
+  if namespaces is None:
+    namespaces = _namespaces(node)
+  if header:
+    yield header
+  if node.tag is ET.Comment:
+    data = _normalize_newlines(node.text or '')
+    if '--' in data:
+      raise ValueError("'--' is not allowed in a comment node")
+    yield '{}<!--{}-->\n'.format(indent, data)
+  elif node.tag is ET.PI:
+    target_data = _normalize_newlines(node.text or '').split(None, 1)
+    yield '{}<?{} {}?>\n'.format(indent, target_data[0], target_data[1] if len(target_data) > 1 else '')
+  else:
+    tag = _qualified_name(node.tag, namespaces)
+    yield indent+'<'+tag
+    if header:
+      for uri, prefix in sorted(namespaces.items(), key=lambda item: item[1]):
+        if prefix != 'xml':
+          yield ' xmlns:{}="{}"'.format(prefix, _escape_data(uri))
+    for name, value in node.attrib.items():
+      yield ' {}="{}"'.format(_qualified_name(name, namespaces), _escape_data(value))
+    text = _normalize_newlines(node.text or '')
+    if not text and not len(node):
+      yield '/>\n'
+    elif not len(node):
+      # a single text child is written on the same line
+      yield '>{}</{}>\n'.format(_escape_data(text), tag)
+    else:
+      yield '>\n'
+      if text:
+        yield _escape_data(indent+addindent+text+'\n')
+      for child in node:
+        yield from _pretty_chunks(child, indent+addindent, addindent, namespaces=namespaces)
+        tail = _normalize_newlines(child.tail or '')
+        if tail:
+          yield _escape_data(indent+addindent+tail+'\n')
+      yield '{}</{}>\n'.format(indent, tag)
+
+
+def _escape_data(data):
+  """
+    Escapes the special characters of a text or an attribute value
+    @ In, data, string, the text
+    @Out, data, string, the escaped text
+  """
+  return data.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+
+def _normalize_newlines(data):
+  """
+    Normalizes the line endings of a text the same way as an XML parser does
+    @ In, data, string, the text
+    @Out, data, string, the text with only '\\n' line endings
+  """
+  return data.replace('\r\n', '\n').replace('\r', '\n')
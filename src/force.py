@@ -17,10 +17,16 @@ To faciliate this integration, vaious classes and methods are created. This code
 
 1 - A Python Class for the "FORCE Component". "FORCE Component" is a component that combines the component's inforation from two (or more) codes.
 
-2 - A Python Class for the "FORCE Component Set". The "FORCE Component Set" is set of components grouped together.
+2 - A Python Class for the "FORCE Component Catalog". The catalog indexes all the FORCE components (by name and by HYSYS category) once so that all the component sets are created from it.
+
+3 - A Python Class for the "FORCE Component Set". The "FORCE Component Set" is set of components grouped together.
 For example: grouping all the pumps together. The component set is created to produce the cost function of a specific component category (e.g. a pump or a turbine). It is also needed to create a component set to be used in HERON.
+The cost function can be fitted against several candidate drivers (the HYSYS power and the APEA weights): the drivers are ranked by the fitting error and the best one is used.
+
+4- Python Methods to extract all the  "FORCE" components. This is useful if the user is extracting the information of several components from several output files.
 
-3- Python Methods to extract all the  "FORCE" components. This is useful if the user is extracting the information of several components from several output files.
+5- Python Methods for the columnar table of the FORCE components (one csv or parquet file with one row per component and one column per component information).
+The component sets can be created directly from this table (one file is read instead of one text file per component).
 """
 #####
 # Section 0
@@ -28,11 +34,46 @@ For example: grouping all the pumps together. The component set is created to pr
 
 import os
 import json
-from collections import OrderedDict
+from collections import OrderedDict, Counter
 import numpy as np
+import pandas as pd
 from scipy.optimize import curve_fit
+from scipy import stats
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib as mpl
-import matplotlib.pyplot as plt
+# The figures are created without pyplot (no global state) and rendered by the Agg (headless) backend
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+try:
+  from .aspen_utils import write_components_jsonl
+except ImportError:
+  from aspen_utils import write_components_jsonl
+
+# The power units that can be used in a component set (the value is the unit in kW)
+POWER_UNITS_IN_KW = {'kW': 1.0, 'MW': 1000.0}
+# The candidate cost drivers of the component sets: driver -> (array of the catalog, units).
+# The units of the power are the most common power unit of each component set.
+# Only the power is a capacity in HERON: the power cost function is the one exported to HERON (see heron.add_cost_function_to_cashflow)
+COST_DRIVERS = OrderedDict([("Power", ("powers", None)),
+                            ("Equipment Weight [LBS]", ("equipment_weights", "LBS")),
+                            ("Total Installed Weight [LBS]", ("installed_weights", "LBS"))])
+# The columns of the table of the FORCE components: column -> (mini dictionary, key) of the FORCE component dictionary
+COMPONENT_TABLE_COLUMNS = OrderedDict([
+  ("Component Name", (None, "Component Name")),
+  ("Component ID", (None, "Component ID")),
+  ("Sources", (None, "Sources")),
+  ("HYSYS Category", ("HYSYS", "Category")),
+  ("HYSYS Power", ("HYSYS", "Power")),
+  ("HYSYS Power Units", ("HYSYS", "Power Units")),
+  ("APEA Equipment Cost [USD]", ("APEA", "Equipment Cost [USD]")),
+  ("APEA Installed Cost [USD]", ("APEA", "Installed Cost [USD]")),
+  ("APEA Equipment Weight [LBS]", ("APEA", "Equipment Weight [LBS]")),
+  ("APEA Total Installed Weight [LBS]", ("APEA", "Total Installed Weight [LBS]"))])
+# The numeric columns of the table (the unknown values are stored as NaN)
+NUMERIC_TABLE_COLUMNS = ["HYSYS Power", "APEA Equipment Cost [USD]", "APEA Installed Cost [USD]",
+                         "APEA Equipment Weight [LBS]", "APEA Total Installed Weight [LBS]"]
+# The formats of the table files (by file extension)
+TABLE_FORMATS = ['.csv', '.parquet']
 
 # Section 1:
 # Python Classes for the APEA Component, HYSYS Component, FORCE component, and FORCE ComponentSet
@@ -86,6 +127,94 @@ class ForceComponent:
     return(force_dict)
 
 
+class ComponentCatalog:
+  """
+    The FORCE component catalog: it is built once from the list of the FORCE components dictionaries and it includes:
+    1 - name -> components index
+    2 - HYSYS category -> components index
+    3 - Columnar numpy arrays of the components names, IDs, HYSYS categories, HYSYS power, power units, APEA installed cost and APEA weights
+    Only the components with HYSYS information are cataloged since they are the only ones that can be included in a component set.
+    Unknown (non-numeric) powers and missing costs and weights are stored as NaN.
+    The catalog can also be built from the table of the FORCE components (see ComponentCatalog.from_table)
+  """
+
+  def __init__(self, component_dicts_list):
+    """
+    Constructor
+    @ In, component_dicts_list, list, The list of dictionaries of the FORCE components
+    @ Out, None
+    """
+    hysys_components = [comp for comp in component_dicts_list if comp.get('HYSYS')]
+    self.names = np.array([comp.get('Component Name') for comp in hysys_components], dtype=object)
+    self.ids = np.array([comp.get('Component ID') for comp in hysys_components], dtype=object)
+    self.categories = np.array([comp.get('HYSYS').get('Category') for comp in hysys_components], dtype=object)
+    self.powers = np.array([_to_float(comp.get('HYSYS').get('Power')) for comp in hysys_components], dtype=float)
+    self.power_units = np.array([comp.get('HYSYS').get('Power Units') for comp in hysys_components], dtype=object)
+    self.installed_costs = np.array([_to_float((comp.get('APEA') or {}).get('Installed Cost [USD]'))
+                                     for comp in hysys_components], dtype=float)
+    self.equipment_weights = np.array([_to_float((comp.get('APEA') or {}).get('Equipment Weight [LBS]'))
+                                       for comp in hysys_components], dtype=float)
+    self.installed_weights = np.array([_to_float((comp.get('APEA') or {}).get('Total Installed Weight [LBS]'))
+                                       for comp in hysys_components], dtype=float)
+    self.build_indices()
+
+  @classmethod
+  def from_table(cls, table):
+    """
+    Building the catalog from the columns of the table of the FORCE components (no component dictionary is created)
+    @ In, table, pandas.DataFrame, the table of the FORCE components (see components_to_table)
+    @ Out, catalog, ComponentCatalog, the catalog of the components
+    """
+    catalog = cls([])
+    hysys_rows = table["HYSYS Category"].notna().to_numpy()
+    catalog.names = table["Component Name"].to_numpy(dtype=object)[hysys_rows]
+    catalog.ids = table["Component ID"].to_numpy(dtype=object)[hysys_rows]
+    catalog.categories = table["HYSYS Category"].to_numpy(dtype=object)[hysys_rows]
+    catalog.powers = pd.to_numeric(table["HYSYS Power"], errors='coerce').to_numpy(dtype=float)[hysys_rows]
+    catalog.power_units = table["HYSYS Power Units"].to_numpy(dtype=object)[hysys_rows]
+    catalog.installed_costs = pd.to_numeric(table["APEA Installed Cost [USD]"], errors='coerce').to_numpy(dtype=float)[hysys_rows]
+    catalog.equipment_weights = pd.to_numeric(table["APEA Equipment Weight [LBS]"], errors='coerce').to_numpy(dtype=float)[hysys_rows]
+    catalog.installed_weights = pd.to_numeric(table["APEA Total Installed Weight [LBS]"], errors='coerce').to_numpy(dtype=float)[hysys_rows]
+    catalog.build_indices()
+    return catalog
+
+  def build_indices(self):
+    """
+    Building the name -> components and the HYSYS category -> components indices from the columnar arrays
+    @ In, None
+    @ Out, None
+    """
+    self.name_index = {}
+    self.category_index = {}
+    for i, (name, category) in enumerate(zip(self.names, self.categories)):
+      self.name_index.setdefault(name, []).append(i)
+      self.category_index.setdefault(category, []).append(i)
+
+  def __len__(self):
+    """
+    The number of cataloged components
+    @ In, None
+    @ Out, len, int, the number of components
+    """
+    return len(self.names)
+
+  def category_indices(self, category):
+    """
+    The indices of the components of one HYSYS category
+    @ In, category, str, the HYSYS category (e.g. 'Pumps')
+    @ Out, indices, list, the components indices (empty if the category does not exist)
+    """
+    return self.category_index.get(category, [])
+
+  def name_indices(self, component_name):
+    """
+    The indices of the components with the given name (the same name can be found in several xlsx files)
+    @ In, component_name, str, the component name
+    @ Out, indices, list, the components indices (empty if the component does not exist)
+    """
+    return self.name_index.get(component_name, [])
+
+
 class ForceComponentSet:
   """
     FORCE component_set class which is characterized by:
@@ -97,128 +226,160 @@ class ForceComponentSet:
     6- The cost function equation coefficient X: The scaling factor
   """
   
-  def __init__(self, component_sets_file, component_dicts_list):
+  def __init__(self, component_sets_file, component_dicts_list, catalog=None, drivers=None):
     """
     Constructor
     @ In, component_sets_file, str,
     The file that is is edited by the used to idnetify the sets of components that need to be grouped together
-    @ In, list of dictionaries of the FORCE components, list.
+    @ In, list of dictionaries of the FORCE components, list (or the table of the FORCE components, pandas.DataFrame).
+    @ In, catalog, ComponentCatalog, optional, the catalog of the FORCE components.
+      If not provided, it is built from component_dicts_list
+    @ In, drivers, list, optional, the candidate cost drivers (see COST_DRIVERS). The power is always a candidate driver.
+      If there are several candidate drivers, only the components with known values of all the drivers are included,
+      the cost function is fitted against each driver and the driver with the lowest fitting error is used
     @ Out, None
     """
+    self.drivers = ["Power"] + [driver for driver in (drivers or []) if driver != "Power"]
+    unknown_drivers = [driver for driver in self.drivers if driver not in COST_DRIVERS]
+    if unknown_drivers:
+      raise ValueError(f"The cost drivers {unknown_drivers} are not supported. The supported cost drivers are: {list(COST_DRIVERS)}")
     self.component_sets_file = component_sets_file
     self.component_dicts_list = component_dicts_list
+    if catalog is None:
+      catalog = component_catalog(component_dicts_list)
+    self.catalog = catalog
+    # The fitting data are set by prepare() and the plot data are set by component_set_info()
+    self.capacity_ratio = None
+    self.plot_data = None
 
-   
-  def component_set_info(self):
+
+  def prepare(self):
     """
-    Creating the component set and its the cost function
+    Selecting the components of the component set (from the catalog) and preparing the data of the cost function fitting
     @ In, None
-    @ Out, comp_set_info_dict,  dict, A dictionay of the component set information
+    @ Out, self, ForceComponentSet, the component set (the fitting data are stored as attributes)
     """
+    catalog = self.catalog
+    included_indices = []
 
-    available_components, available_component_types = [], []
-
-    for comp in self.component_dicts_list:
-      if comp.get('HYSYS'):
-        component_name = comp.get('Component Name')      
-        component_type=(comp.get('HYSYS')).get('Category')
-        available_components.append(component_name)
-        available_component_types.append(component_type)
-    all_included_components, all_included_powers, all_included_power_units, all_included_installed_costs=[], [], [], []
-
-    component_sets_file_dict = json.load(open(self.component_sets_file))
+    with open(self.component_sets_file) as component_sets_file:
+      component_sets_file_dict = json.load(component_sets_file)
     set_name = component_sets_file_dict.get("Set Name")
     
     if "Included Categories" in component_sets_file_dict:
       included_types = (component_sets_file_dict.get("Included Categories"))
       for type in included_types:
-        if type not in available_component_types:
+        if not catalog.category_indices(type):
           print(f"The components category '{type}' does not exist")
-        elif type in available_component_types: 
-          
-          for comp in self.component_dicts_list:
-            if comp.get('HYSYS'):
-              component_type=(comp.get('HYSYS')).get('Category')
-              if component_type == type:
-                included_comp =comp.get('Component Name')  
-                all_included_components.append(included_comp)
-                included_power = (comp.get('HYSYS')).get('Power')
-                all_included_powers.append(included_power)
-                included_power_unit = (comp.get('HYSYS')).get('Power Units')
-                all_included_power_units.append(included_power_unit)
-                included_installed_cost_USD = (comp.get('APEA')).get('Installed Cost [USD]')
-                all_included_installed_costs.append(included_installed_cost_USD)
-
+        else:
+          included_indices.extend(catalog.category_indices(type))
 
     if "Included Components" in component_sets_file_dict:
       included_names = (component_sets_file_dict.get("Included Components"))
       for comp_name in included_names:
-        if comp_name not in available_components:
+        if not catalog.name_indices(comp_name):
           print(f"The component named '{comp_name}' does not exist")
         else:
-          all_included_components.append(comp_name)
-          
-          for comp in self.component_dicts_list:
-            if comp.get('HYSYS'):
-              component_name= comp.get('Component Name') 
-              if component_name == comp_name:
-                included_power = (comp.get('HYSYS')).get('Power')
-                all_included_powers.append(included_power)
-                included_power_unit = (comp.get('HYSYS')).get('Power Units')
-                all_included_power_units.append(included_power_unit)
-                included_installed_cost_USD = (comp.get('APEA')).get('Installed Cost [USD]')
-                all_included_installed_costs.append(included_installed_cost_USD)
-
-    # # Excluding components with unknown information or non reasonable info
-    excluded_components_indices = []
-    for i in range(len(all_included_components)):
-      if float(all_included_powers[i])<=0 or all_included_powers[i] =="unknown":
-        print('\033[91m', "\n", f"The component(s) '{all_included_components[i]}' will be excluded because of unknown or non-positive power value",  '\033[0m')
-        excluded_components_indices.append(i)
-      if all_included_power_units[i] not in ['kW', 'MW']:
-        print('\033[91m', "\n", f"The component(s) '{all_included_components[i]}' will be excluded because of unknown power unit", '\033[0m')
-        excluded_components_indices.append(i)
-      if all_included_installed_costs[i]<=0:
-            print('\033[91m', "\n", f"The component '{all_included_components[i]}' will be excluded because of non-positive cost", '\033[0m')
-            excluded_components_indices.append(i)
-
-
-    updated_components_set, updated_powers, updated_power_units, updated_costs=[], [], [], []
-    for i in range(len(all_included_components)):
-      if i not in excluded_components_indices:
-        updated_components_set.append(all_included_components[i])
-        updated_powers.append(all_included_powers[i])
-        updated_power_units.append(all_included_power_units[i])
-        updated_costs.append(all_included_installed_costs[i])
-
-    # To ensure that the power units are the same
-    common_unit=(max(set(updated_power_units), key=updated_power_units.count))
-    updated_powers_same_unit=[0]*len(updated_powers)
-    for i in range(len(updated_power_units)):
-      if updated_power_units[i] !=common_unit:
-        if common_unit == "kW":
-          updated_powers_same_unit[i] = 1000*updated_powers[i]
-        if common_unit == "MW":
-          updated_powers_same_unit[i] = 0.001*updated_powers[i]
-      else:
-        updated_powers_same_unit[i] = updated_powers[i]
-
-    reference_driver = max(updated_powers_same_unit)
+          included_indices.extend(catalog.name_indices(comp_name))
+
+    included_indices = np.asarray(included_indices, dtype=int)
+    all_included_components = catalog.names[included_indices]
+    all_included_powers = catalog.powers[included_indices]
+    all_included_power_units = catalog.power_units[included_indices]
+    all_included_installed_costs = catalog.installed_costs[included_indices]
+
+    # # Excluding components with unknown information or non reasonable info (unknown powers and missing costs are NaN)
+    valid_powers = np.isfinite(all_included_powers) & (all_included_powers > 0)
+    valid_power_units = np.isin(all_included_power_units, list(POWER_UNITS_IN_KW))
+    valid_costs = np.isfinite(all_included_installed_costs) & (all_included_installed_costs > 0)
+    included_mask = valid_powers & valid_power_units & valid_costs
+    # The other candidate drivers need to be known for all the components so that the drivers are compared on the same components
+    all_included_drivers_values = OrderedDict((driver, getattr(catalog, COST_DRIVERS[driver][0])[included_indices]) for driver in self.drivers[1:])
+    valid_drivers = [(np.isfinite(values) & (values > 0), driver) for driver, values in all_included_drivers_values.items()]
+    for valid_driver, _ in valid_drivers:
+      included_mask = included_mask & valid_driver
+    self.excluded_components = exclusion_report(all_included_components, catalog.ids[included_indices],
+                                                valid_powers, valid_power_units, valid_costs, valid_drivers=valid_drivers)
+
+    updated_components_set = list(all_included_components[included_mask])
+    updated_powers = all_included_powers[included_mask]
+    updated_power_units = all_included_power_units[included_mask]
+    updated_costs = all_included_installed_costs[included_mask]
+    if not len(updated_components_set):
+      raise ValueError(f"The component set '{set_name}' ({self.component_sets_file}) does not include any valid component")
+
+    # To ensure that the power units are the same (the most common unit is used)
+    common_unit = Counter(updated_power_units).most_common(1)[0][0]
+    unit_conversion_factors = np.empty(len(updated_power_units))
+    for unit, unit_in_kW in POWER_UNITS_IN_KW.items():
+      unit_conversion_factors[updated_power_units == unit] = unit_in_kW / POWER_UNITS_IN_KW[common_unit]
+    updated_powers_same_unit = updated_powers * unit_conversion_factors
+
+    reference_driver = np.max(updated_powers_same_unit)
 
     # (D/D') in the cost function
-    capacity_ratio = []
-    for p in updated_powers_same_unit:
-        capacity_ratio.append(p/reference_driver )
-
+    capacity_ratio = updated_powers_same_unit / reference_driver
+
+    self.set_name = set_name
+    self.updated_components_set = updated_components_set
+    self.updated_powers_same_unit = updated_powers_same_unit
+    self.updated_costs = updated_costs
+    self.common_unit = common_unit
+    self.reference_driver = reference_driver
+    self.capacity_ratio = capacity_ratio
+    # The values, the units and the ratios (D/D') of all the candidate drivers (the power is the first driver)
+    self.drivers_values = OrderedDict([("Power", updated_powers_same_unit)])
+    self.drivers_units = {"Power": common_unit}
+    for driver, values in all_included_drivers_values.items():
+      self.drivers_values[driver] = values[included_mask]
+      self.drivers_units[driver] = COST_DRIVERS[driver][1]
+    self.drivers_ratios = OrderedDict((driver, values / np.max(values)) for driver, values in self.drivers_values.items())
+    return self
+
+  def component_set_info(self, fit=None, plot=True, drivers_fits=None):
+    """
+    Creating the component set and its the cost function
+    @ In, fit, dict, optional, the cost function fitting results of this component set against the power (see fit_cost_functions).
+      If not provided, the cost function of this component set is fitted alone. If there are several candidate drivers, it is the fit of the power driver
+    @ In, drivers_fits, dict, optional, the cost function fitting results of each candidate driver (see fit_cost_drivers).
+      It is only used if there are several candidate drivers. If not provided, the candidate drivers of this component set are fitted alone
+      (except the power if fit is provided)
+    @ In, plot, bool, optional, if True, the cost function curve is plotted and saved next to the Setfile.
+      If False, the plot is skipped but its data are kept in self.plot_data (see plot_cost_function)
+    @ Out, comp_set_info_dict,  dict, A dictionay of the component set information
+    """
+    if self.capacity_ratio is None:
+      self.prepare()
+    set_name = self.set_name
+    updated_components_set = self.updated_components_set
+    updated_powers_same_unit = self.updated_powers_same_unit
+    updated_costs = self.updated_costs
+    common_unit = self.common_unit
+    reference_driver = self.reference_driver
+    capacity_ratio = self.capacity_ratio
 
     # # Curve fitting
-    updated_costs_output = updated_costs
-    popt, _  = curve_fit(lambda t, a, b: a * (t ** b), capacity_ratio, updated_costs_output)
-    ref_price = popt[0]
-    scaling_factor = popt[1]
-    calculated_costs = ref_price*(capacity_ratio**scaling_factor)
-    error = (100*(abs(updated_costs-calculated_costs) )/updated_costs)
-    avg_error = round(sum(error)/len(error), 2)
+    cost_driver = "Power"
+    if len(self.drivers) > 1:
+      # The candidate drivers are ranked by their fitting error and the best driver is used
+      if drivers_fits is None:
+        drivers_ratios = self.drivers_ratios if fit is None else OrderedDict((driver, ratios) for driver, ratios in self.drivers_ratios.items()
+                                                                             if driver != "Power")
+        drivers_fits = fit_cost_drivers([drivers_ratios], [updated_costs])[0]
+      if fit is not None:
+        drivers_fits = OrderedDict(drivers_fits, Power=fit)
+      drivers_ranking = sorted(self.drivers, key=lambda driver: drivers_fits[driver]["MAPE (%)"])
+      cost_driver = drivers_ranking[0]
+      fit = drivers_fits[cost_driver]
+      updated_powers_same_unit = self.drivers_values[cost_driver]
+      common_unit = self.drivers_units[cost_driver]
+      reference_driver = np.max(updated_powers_same_unit)
+      capacity_ratio = self.drivers_ratios[cost_driver]
+    elif fit is None:
+      fit = fit_cost_functions([capacity_ratio], [updated_costs])[0]
+    ref_price = fit["Reference Price"]
+    scaling_factor = fit["Scaling Factor"]
+    avg_error = round(fit["MAPE (%)"], 2)
 
     # The created dictionary of the component set
     comp_set_info_dict = {
@@ -226,41 +387,52 @@ class ForceComponentSet:
                           "Component Set file": self.component_sets_file,
                           "Included components": updated_components_set,
                           "Reference Driver": reference_driver,
-                          "Reference Driver Power Units": common_unit,
+                          "Reference Driver Units": common_unit,
                           "Reference Price (USD)": ref_price,
                           "Scaling Factor": np.round(scaling_factor,5),
-                          "Fitting Average Error (%)": avg_error }
-
-    # Plotting
-    plt.figure()
-    ax = plt.axes()
-    ax.scatter(updated_powers_same_unit, updated_costs, label='APEA Cost')
-    ax.yaxis.set_major_formatter(mpl.ticker.StrMethodFormatter('{x:,.0f}'))
-    ax.xaxis.set_major_formatter(mpl.ticker.StrMethodFormatter('{x:,.1f}'))
-    ax.grid()
-    power_fitted = np.linspace(np.min(updated_powers_same_unit), np.max(updated_powers_same_unit), 100)
-    capacity_ratio_fitted = np.linspace(np.min(capacity_ratio), np.max(capacity_ratio), 100)
-    fitted_costs = ref_price*(capacity_ratio_fitted**scaling_factor)
-
-    ax.plot(power_fitted, fitted_costs, 'k', label='Fitted Cost')
-    reference_driver_rounded= round (reference_driver, 1)
-    ref_price_rounded= round (ref_price, 1)
-    scaling_factor_rounded = round (scaling_factor, 4)
-
-    ax.set_title(f'Cost function curve of "{set_name}" \n Ref Driver = {reference_driver_rounded} {common_unit} \n Ref price(USD) = {ref_price_rounded} \n Scaling factor = {scaling_factor_rounded} \n MAPE = {avg_error } %', pad=12)
-    ax.set_ylabel('Cost [USD]')
-    ax.set_xlabel(f'Power in {common_unit}')
-    ax.legend(bbox_to_anchor=(1,1), loc="upper right", bbox_transform=plt.gcf().transFigure)
-    plt.tight_layout()
-
+                          "Fitting Average Error (%)": avg_error,
+                          "Fitting Confidence Level": fit["Confidence Level"],
+                          "Reference Price Confidence Interval (USD)": fit["Reference Price Confidence Interval"],
+                          "Scaling Factor Confidence Interval": fit["Scaling Factor Confidence Interval"],
+                          "Excluded components": self.excluded_components}
+    if len(self.drivers) > 1:
+      comp_set_info_dict["Cost Driver"] = cost_driver
+      comp_set_info_dict["Cost Drivers Ranking"] = [{"Cost Driver": driver,
+                                                     "Reference Driver": np.max(self.drivers_values[driver]),
+                                                     "Reference Driver Units": self.drivers_units[driver],
+                                                     "Reference Price (USD)": drivers_fits[driver]["Reference Price"],
+                                                     "Scaling Factor": np.round(drivers_fits[driver]["Scaling Factor"], 5),
+                                                     "Fitting Average Error (%)": round(drivers_fits[driver]["MAPE (%)"], 2)}
+                                                    for driver in drivers_ranking]
+      multi_driver_fit = fit_multi_driver_cost_function(self.drivers_ratios, updated_costs)
+      comp_set_info_dict["Multi-Driver Cost Function"] = {
+                          "Cost Drivers": self.drivers,
+                          "Reference Drivers": [np.max(self.drivers_values[driver]) for driver in self.drivers],
+                          "Reference Drivers Units": [self.drivers_units[driver] for driver in self.drivers],
+                          "Reference Price (USD)": multi_driver_fit["Reference Price"],
+                          "Scaling Factors": list(np.round(multi_driver_fit["Scaling Factors"], 5)),
+                          "Fitting Average Error (%)": round(multi_driver_fit["MAPE (%)"], 2)}
+      print('\n', f'The cost drivers of the component set "{set_name}" are ranked by the fitting error: {drivers_ranking}. The cost driver is: {cost_driver}')
+
+    # Plotting: the plot data are kept so that the plot can be rendered later (e.g. by a process pool)
     output_file = self.component_sets_file.split('txt', 1)[0] + 'png'
-    file_exists = os.path.exists(output_file)
-    if file_exists:
-      os.remove(output_file)
-    plt.savefig(output_file)
+    self.plot_data = {"Component Set Name": set_name,
+                      "Cost Driver": cost_driver,
+                      "Powers": updated_powers_same_unit,
+                      "Costs": updated_costs,
+                      "Capacity Ratios": capacity_ratio,
+                      "Reference Driver": reference_driver,
+                      "Reference Driver Units": common_unit,
+                      "Reference Price": ref_price,
+                      "Scaling Factor": scaling_factor,
+                      "Fitting Average Error (%)": avg_error,
+                      "Output File": output_file}
+    if plot:
+      plot_cost_function(self.plot_data)
 
     print('\n', f'The components set "{set_name}" includes the following {len(updated_components_set)} components:','\n', updated_components_set)
-    print('\n', f'The cost function of the component set "{set_name}" is produced and stored at: \n {output_file}')
+    if plot:
+      print('\n', f'The cost function of the component set "{set_name}" is produced and stored at: \n {output_file}')
 
     if len(updated_components_set) <3:
       print ('\n','\033[91m', f"Warning: The number of included components in the the component set '{set_name}' is only {len(updated_components_set)}. At least 3 components are required to produce the cost function curve", '\033[0m')
@@ -268,34 +440,255 @@ class ForceComponentSet:
     return comp_set_info_dict
 
 
+def plot_cost_function(plot_data):
+  """
+    Plotting the cost function curve of a component set and saving it as a png file.
+    This method does not use pyplot so that it can be called for many component sets (or by worker processes) without keeping any open figure
+    @ In, plot_data, dict, the plot data of the component set (see ForceComponentSet.component_set_info)
+    @ Out, output_file, str, the path of the png file
+  """
+  set_name = plot_data["Component Set Name"]
+  powers = plot_data["Powers"]
+  capacity_ratio = plot_data["Capacity Ratios"]
+  ref_price = plot_data["Reference Price"]
+  scaling_factor = plot_data["Scaling Factor"]
+  common_unit = plot_data["Reference Driver Units"]
+  avg_error = plot_data["Fitting Average Error (%)"]
+  output_file = plot_data["Output File"]
+
+  fig = Figure()
+  FigureCanvasAgg(fig)
+  ax = fig.add_subplot()
+  ax.scatter(powers, plot_data["Costs"], label='APEA Cost')
+  ax.yaxis.set_major_formatter(mpl.ticker.StrMethodFormatter('{x:,.0f}'))
+  ax.xaxis.set_major_formatter(mpl.ticker.StrMethodFormatter('{x:,.1f}'))
+  ax.grid()
+  power_fitted = np.linspace(np.min(powers), np.max(powers), 100)
+  capacity_ratio_fitted = np.linspace(np.min(capacity_ratio), np.max(capacity_ratio), 100)
+  fitted_costs = ref_price*(capacity_ratio_fitted**scaling_factor)
+
+  ax.plot(power_fitted, fitted_costs, 'k', label='Fitted Cost')
+  reference_driver_rounded= round (plot_data["Reference Driver"], 1)
+  ref_price_rounded= round (ref_price, 1)
+  scaling_factor_rounded = round (scaling_factor, 4)
+
+  ax.set_title(f'Cost function curve of "{set_name}" \n Ref Driver = {reference_driver_rounded} {common_unit} \n Ref price(USD) = {ref_price_rounded} \n Scaling factor = {scaling_factor_rounded} \n MAPE = {avg_error } %', pad=12)
+  ax.set_ylabel('Cost [USD]')
+  cost_driver = plot_data.get("Cost Driver", "Power")
+  ax.set_xlabel(f'Power in {common_unit}' if cost_driver == "Power" else cost_driver)
+  ax.legend(bbox_to_anchor=(1,1), loc="upper right", bbox_transform=fig.transFigure)
+  fig.tight_layout()
+
+  file_exists = os.path.exists(output_file)
+  if file_exists:
+    os.remove(output_file)
+  fig.savefig(output_file)
+  # Releasing the figure explicitly
+  fig.clear()
+  return output_file
+
+
+def fit_cost_functions(capacity_ratios_list, costs_list, refine=True, confidence_level=0.95):
+  """
+    Fitting the cost functions (cost = A * (D/D')^X) of several component sets in one batched call.
+    1 - The closed form log-log least squares solution (ln(cost) = ln(A) + X ln(D/D')) of all the sets is computed at once
+    2 - If refine, each set is refined by a nonlinear least squares fit of the costs (same objective as the
+        original curve fitting) that starts from the closed form solution and keeps the reference price positive
+    @ In, capacity_ratios_list, list, the capacity ratios (D/D') of each component set (list of np.ndarray)
+    @ In, costs_list, list, the costs of each component set (list of np.ndarray)
+    @ In, refine, bool, optional, if True, the closed form solution is refined by the nonlinear least squares fit
+    @ In, confidence_level, float, optional, the confidence level of the coefficients confidence intervals
+    @ Out, fits, list, a dictionary per component set with the keys: "Reference Price", "Scaling Factor", "MAPE (%)",
+      "Confidence Level", "Reference Price Confidence Interval", "Scaling Factor Confidence Interval" and "Refined"
+  """
+  capacity_ratios_list = [np.asarray(capacity_ratios, dtype=float) for capacity_ratios in capacity_ratios_list]
+  costs_list = [np.asarray(costs, dtype=float) for costs in costs_list]
+  if not capacity_ratios_list:
+    return []
+
+  # 1 - Closed form log-log least squares of all the sets (the sums of each set are computed with bincount)
+  sizes = np.array([len(costs) for costs in costs_list])
+  set_ids = np.repeat(np.arange(len(sizes)), sizes)
+  log_ratios = np.log(np.concatenate(capacity_ratios_list))
+  log_costs = np.log(np.concatenate(costs_list))
+  n = np.bincount(set_ids, minlength=len(sizes)).astype(float)
+  mean_x = np.bincount(set_ids, log_ratios, minlength=len(sizes)) / n
+  mean_y = np.bincount(set_ids, log_costs, minlength=len(sizes)) / n
+  dx = log_ratios - mean_x[set_ids]
+  dy = log_costs - mean_y[set_ids]
+  sxx = np.bincount(set_ids, dx * dx, minlength=len(sizes))
+  sxy = np.bincount(set_ids, dx * dy, minlength=len(sizes))
+  # If all the capacities of a set are equal, the scaling factor cannot be fitted and a linear scaling is assumed
+  degenerate = sxx <= 0
+  scaling_factors = np.where(degenerate, 1.0, sxy / np.where(degenerate, 1.0, sxx))
+  log_ref_prices = mean_y - scaling_factors * mean_x
+  residuals = dy - scaling_factors[set_ids] * dx
+  ssr = np.bincount(set_ids, residuals * residuals, minlength=len(sizes))
+  dof = n - 2
+  with np.errstate(divide='ignore', invalid='ignore'):
+    sigma2 = np.where(dof > 0, ssr / dof, np.nan)
+    scaling_factors_se = np.sqrt(sigma2 / sxx)
+    # the reference price interval is computed in the log space and transformed back
+    log_ref_prices_se = np.sqrt(sigma2 * (1 / n + mean_x ** 2 / sxx))
+    t_values = np.where(dof > 0, stats.t.ppf(0.5 + confidence_level / 2, np.maximum(dof, 1)), np.nan)
+
+  fits = []
+  for i, (capacity_ratios, costs) in enumerate(zip(capacity_ratios_list, costs_list)):
+    ref_price = np.exp(log_ref_prices[i])
+    scaling_factor = scaling_factors[i]
+    ref_price_interval = np.exp(log_ref_prices[i] + np.array([-1, 1]) * t_values[i] * log_ref_prices_se[i])
+    scaling_factor_interval = scaling_factor + np.array([-1, 1]) * t_values[i] * scaling_factors_se[i]
+    refined = False
+
+    # 2 - Nonlinear refinement (warm started from the closed form solution)
+    if refine and not degenerate[i] and len(costs) > 2:
+      try:
+        popt, pcov = curve_fit(lambda t, a, b: a * (t ** b), capacity_ratios, costs,
+                               p0=(ref_price, scaling_factor),
+                               bounds=((0, -np.inf), (np.inf, np.inf)),
+                               # tight tolerances so that the optimum does not depend on the starting point
+                               ftol=1e-12, xtol=1e-12, gtol=1e-12)
+      except (RuntimeError, ValueError) as e:
+        print('\033[91m', "\n", f"Warning: The nonlinear refinement of the cost function did not converge ({e}). The log-log least squares solution is used", '\033[0m')
+      else:
+        ref_price, scaling_factor = popt
+        coefficients_se = np.sqrt(np.diag(pcov))
+        ref_price_interval = ref_price + np.array([-1, 1]) * t_values[i] * coefficients_se[0]
+        scaling_factor_interval = scaling_factor + np.array([-1, 1]) * t_values[i] * coefficients_se[1]
+        refined = True
+
+    calculated_costs = ref_price * (capacity_ratios ** scaling_factor)
+    error = 100 * np.abs(costs - calculated_costs) / costs
+    fits.append({"Reference Price": ref_price,
+                 "Scaling Factor": scaling_factor,
+                 "MAPE (%)": np.mean(error),
+                 "Confidence Level": confidence_level,
+                 "Reference Price Confidence Interval": _interval_to_list(ref_price_interval),
+                 "Scaling Factor Confidence Interval": _interval_to_list(scaling_factor_interval),
+                 "Refined": refined})
+  return fits
+
+
+def fit_cost_drivers(drivers_ratios_list, costs_list, refine=True, confidence_level=0.95):
+  """
+    Fitting the cost functions (cost = A * (D/D')^X) of several component sets against each of their candidate drivers in one batched call
+    @ In, drivers_ratios_list, list, the ratios (D/D') of the candidate drivers of each component set (list of dict: driver -> np.ndarray)
+    @ In, costs_list, list, the costs of each component set (list of np.ndarray)
+    @ In, refine, bool, optional, if True, the closed form solutions are refined (see fit_cost_functions)
+    @ In, confidence_level, float, optional, the confidence level of the coefficients confidence intervals
+    @ Out, drivers_fits_list, list, a dictionary per component set with the fitting results (see fit_cost_functions) of each driver
+  """
+  pairs = [(i, driver) for i, drivers_ratios in enumerate(drivers_ratios_list) for driver in drivers_ratios]
+  fits = fit_cost_functions([drivers_ratios_list[i][driver] for i, driver in pairs], [costs_list[i] for i, _ in pairs],
+                            refine=refine, confidence_level=confidence_level)
+  drivers_fits_list = [OrderedDict() for _ in drivers_ratios_list]
+  for (i, driver), fit in zip(pairs, fits):
+    drivers_fits_list[i][driver] = fit
+  return drivers_fits_list
+
+
+def fit_multi_driver_cost_function(drivers_ratios, costs):
+  """
+    Fitting the cost function of a component set against all its candidate drivers together (cost = A * Π(Di/Di')^Xi)
+    by the log-log least squares (ln(cost) = ln(A) + Σ Xi ln(Di/Di')).
+    If the drivers are collinear (or there are not enough components), the minimum norm solution is used
+    @ In, drivers_ratios, dict, the ratios (D/D') of each candidate driver (driver -> np.ndarray)
+    @ In, costs, np.ndarray, the costs of the components
+    @ Out, fit, dict, the fitting results with the keys: "Reference Price", "Scaling Factors" (one per driver) and "MAPE (%)"
+  """
+  costs = np.asarray(costs, dtype=float)
+  log_ratios = np.log(np.column_stack([np.asarray(ratios, dtype=float) for ratios in drivers_ratios.values()]))
+  design_matrix = np.column_stack([np.ones(len(costs)), log_ratios])
+  coefficients = np.linalg.lstsq(design_matrix, np.log(costs), rcond=None)[0]
+  calculated_costs = np.exp(design_matrix @ coefficients)
+  return {"Reference Price": np.exp(coefficients[0]),
+          "Scaling Factors": coefficients[1:],
+          "MAPE (%)": np.mean(100 * np.abs(costs - calculated_costs) / costs)}
+
+
+def _interval_to_list(interval):
+  """
+    Converting a confidence interval to a JSON-friendly list
+    @ In, interval, np.ndarray, the lower and upper bounds
+    @ Out, interval, list, the lower and upper bounds (None if the interval cannot be computed, e.g. for less than 3 components)
+  """
+  if not np.all(np.isfinite(interval)):
+    return None
+  return [float(bound) for bound in interval]
+
+
+def exclusion_report(components_names, components_ids, valid_powers, valid_power_units, valid_costs, valid_drivers=()):
+  """
+    Reporting the components that are excluded from a component set and the reasons of their exclusion
+    @ In, components_names, np.ndarray, the names of the components
+    @ In, components_ids, np.ndarray, the IDs of the components
+    @ In, valid_powers, np.ndarray, boolean mask of the components with a known and positive power
+    @ In, valid_power_units, np.ndarray, boolean mask of the components with a known power unit
+    @ In, valid_costs, np.ndarray, boolean mask of the components with a known and positive cost
+    @ In, valid_drivers, list, optional, (boolean mask of the components with a known and positive driver value, driver) of the other cost drivers
+    @ Out, excluded_components, list, a dictionary per excluded component: {"Component Name": str, "Component ID": str, "Reasons": list}
+  """
+  reasons = [(valid_powers, "unknown or non-positive power value"),
+             (valid_power_units, "unknown power unit"),
+             (valid_costs, "unknown or non-positive cost")]
+  reasons += [(valid_driver, f"unknown or non-positive {driver}") for valid_driver, driver in valid_drivers]
+  excluded_components = []
+  for i in np.flatnonzero(~np.logical_and.reduce([mask for mask, _ in reasons])):
+    component_reasons = [reason for mask, reason in reasons if not mask[i]]
+    print('\033[91m', "\n", f"The component '{components_names[i]}' will be excluded because of {' and '.join(component_reasons)}", '\033[0m')
+    excluded_components.append({"Component Name": components_names[i],
+                                "Component ID": components_ids[i],
+                                "Reasons": component_reasons})
+  return excluded_components
+
+
+def component_catalog(components):
+  """
+    Building the catalog of the FORCE components from their dictionaries or from their table
+    @ In, components, list or pandas.DataFrame, the list of the FORCE components dictionaries or the table of the FORCE components
+    @ Out, catalog, ComponentCatalog, the catalog of the components
+  """
+  if isinstance(components, pd.DataFrame):
+    return ComponentCatalog.from_table(components)
+  return ComponentCatalog(components)
+
+
+def _to_float(value):
+  """
+    Converting a value to float
+    @ In, value, object, the value (e.g. a HYSYS power that can be "unknown")
+    @ Out, value, float, the float value (NaN if the value is missing or not numeric)
+  """
+  try:
+    return float(value)
+  except (TypeError, ValueError):
+    return np.nan
+
+
 # Section 2:
 # Python Methods extracing all the FORCE components
 
-def create_all_force_components_from_hysys_apea(list_of_lists_of_comps_from_multiple_codes, hysys_folder):
-  comps_from_multiple_codes_flat_list = [item for sublist in list_of_lists_of_comps_from_multiple_codes for item in sublist]
-  available_comps = []
-  for dict in comps_from_multiple_codes_flat_list:
-    available_comps.append(dict.get("Component ID")) 
-      
-
-  force_dicts_list = []
-  for comp in set(available_comps):
-    same_name_comps = []
-    for dict in comps_from_multiple_codes_flat_list:
-      if dict.get("Component ID") == comp:
-        same_name_comps.append(dict)
-    force_dicts_list.append(same_name_comps)
-
-  # merging dictionaries
-  force_dicts_list_1 = []
-  for list in force_dicts_list:
-    force_dict = {}
-    for d in list:
-      force_dict.update(d)
-    force_dicts_list_1.append(force_dict )
+def create_all_force_components_from_hysys_apea(list_of_lists_of_comps_from_multiple_codes, hysys_folder, persist=True, jsonl_file=None,
+                                                table_file=None):
+  """
+    Creating all the FORCE components by merging the components that have the same "Component ID" in the different codes
+    @ In, list_of_lists_of_comps_from_multiple_codes, list, The lists of the components dictionaries of each code (e.g. [HYSYS list, APEA list])
+    @ In, hysys_folder, str, The path of the folder of the HYSYS output files. The FORCE components folder is created next to it
+    @ In, persist, bool, optional, If False, the FORCE components are only returned in memory and no text file is written
+    @ In, jsonl_file, str, optional, The path of a JSON Lines file where all the FORCE components are written (one component per line)
+    @ In, table_file, str, optional, The path of a csv or parquet file where the table of all the FORCE components is written (one row per component)
+    @ Out, force_dicts_list_2, list, The list of dictionaries of the FORCE components
+    @ Out, force_outputs_path, str, The folder that contains the FORCE components (None if persist is False)
+  """
+  # merging dictionaries: single pass join of the dictionaries that have the same "Component ID"
+  force_dicts_by_id = {}
+  for comps_from_one_code in list_of_lists_of_comps_from_multiple_codes:
+    for comp_dict in comps_from_one_code:
+      force_dicts_by_id.setdefault(comp_dict.get("Component ID"), {}).update(comp_dict)
+
   # re-arranging FORCEdictionary
   force_dicts_list_2 = []
-  for dict in force_dicts_list_1:
+  for dict in force_dicts_by_id.values():
     new_force_dict  = {x:dict[x] for x in ["Component Name", "Component ID"]} 
     new_force_dict['Sources'] = str(dict.get('HYSYS Source')) +"  &  " + str(dict.get('APEA_Source'))
     
@@ -320,38 +713,199 @@ def create_all_force_components_from_hysys_apea(list_of_lists_of_comps_from_mult
 
     force_dicts_list_2.append(new_force_dict)
 
-    # dumping FORCE components
-    force_outputs_path = os.path.split(os.path.abspath(hysys_folder))[0]+ "/FORCE_Components/"
-    if not os.path.exists(force_outputs_path):
-      os.makedirs(force_outputs_path)
-    for dict in force_dicts_list_2:
-      output_file = force_outputs_path+str(dict.get("Component ID")).replace(" ", "").replace('/', '_') +".txt"
-      file_exists = os.path.exists(output_file)
-      if file_exists:
-        os.remove(output_file)
-      json.dump(dict, open(output_file, 'w'), indent = 6)
+  if jsonl_file is not None:
+    write_components_jsonl(jsonl_file, force_dicts_list_2)
+  if table_file is not None:
+    write_force_components_table(table_file, force_dicts_list_2)
+  if not persist:
+    return force_dicts_list_2, None
+
+  # dumping FORCE components (one file per component)
+  force_outputs_path = os.path.split(os.path.abspath(hysys_folder))[0]+ "/FORCE_Components/"
+  if not os.path.exists(force_outputs_path):
+    os.makedirs(force_outputs_path)
+  for dict in force_dicts_list_2:
+    output_file = force_outputs_path+str(dict.get("Component ID")).replace(" ", "").replace('/', '_') +".txt"
+    file_exists = os.path.exists(output_file)
+    if file_exists:
+      os.remove(output_file)
+    with open(output_file, 'w') as output:
+      json.dump(dict, output, indent = 6)
   print(f" \n {len(force_dicts_list_2)} FORCE components are created at:\n {force_outputs_path }  \n")
   
   return force_dicts_list_2, force_outputs_path   
 
 
-def extract_all_force_componentsets(component_sets_folder, component_dicts_list):
+def list_setfiles(component_sets_folder):
+  """
+    Listing the Setfiles (the user-input files of the component sets) of a folder
+    @ In, component_sets_folder, str, The path of the folder that includes the Setfiles
+    @ Out, Setfiles_paths, list, The paths of the Setfiles sorted by the file name.
+      The componentSet file of each Setfile is created next to it (see extract_all_force_componentsets)
+  """
+  return [component_sets_folder + Setfile for Setfile in sorted(os.listdir(component_sets_folder))
+          if Setfile.startswith("Setfile") and Setfile.endswith(".txt")]
+
+
+def extract_all_force_componentsets(component_sets_folder, component_dicts_list, plot=True, plot_workers=None, drivers=None):
   """
     Extracting ALL the component sets
     @ In, component_sets_folder, str, The path of the folder that includes several files of the user-input files
     These user-input files determine the components which will be grouped together in one set
-    @ In, list of dictionaries of the FORCE components, list
-    @ Out, None
+    @ In, list of dictionaries of the FORCE components, list (or the table of the FORCE components, pandas.DataFrame)
+    @ In, plot, bool, optional, if False, the cost functions curves are not plotted (e.g. for batch runs)
+    @ In, plot_workers, int, optional, if larger than 1, the cost functions curves are rendered by a process pool
+      with this number of processes while the component sets are written
+    @ In, drivers, list, optional, the candidate cost drivers of the component sets (see ForceComponentSet). Only the power is used if None
+    @ Out, componentSet_dicts, list, The dictionaries of the component sets (including their fitted cost functions)
   """
-  for Setfile in os.listdir(component_sets_folder):
-    if Setfile.startswith("Setfile") and Setfile.endswith(".txt"):
-      print('\033[1m', f"\n\n A component set is found in '{Setfile}'", '\033[0m')
-      Setfile_path = component_sets_folder + Setfile
-      componentSet_dict = ForceComponentSet(Setfile_path, component_dicts_list).component_set_info()
+  # The catalog is built once and shared by all the component sets
+  catalog = component_catalog(component_dicts_list)
+  component_sets = []
+  for Setfile_path in list_setfiles(component_sets_folder):
+    print('\033[1m', f"\n\n A component set is found in '{os.path.basename(Setfile_path)}'", '\033[0m')
+    component_sets.append(ForceComponentSet(Setfile_path, component_dicts_list, catalog=catalog, drivers=drivers).prepare())
+
+  # The cost functions of all the component sets (and all their candidate drivers) are fitted in one batched call
+  drivers_fits_list = fit_cost_drivers([component_set.drivers_ratios for component_set in component_sets],
+                                       [component_set.updated_costs for component_set in component_sets])
+  # The plots are either rendered right away, deferred to a process pool or skipped
+  plot_in_pool = plot and plot_workers is not None and plot_workers > 1 and len(component_sets) > 1
+  plot_executor = ProcessPoolExecutor(max_workers=min(plot_workers, len(component_sets))) if plot_in_pool else None
+  plot_futures = []
+  componentSet_dicts = []
+  try:
+    for component_set, drivers_fits in zip(component_sets, drivers_fits_list):
+      Setfile_path = component_set.component_sets_file
+      componentSet_dict = component_set.component_set_info(fit=drivers_fits["Power"], drivers_fits=drivers_fits, plot=plot and not plot_in_pool)
+      componentSet_dicts.append(componentSet_dict)
+      if plot_in_pool:
+        plot_futures.append(plot_executor.submit(plot_cost_function, component_set.plot_data))
 
       output_file_path = Setfile_path.replace("Setfile", "componentSet")
       file_exists = os.path.exists(output_file_path)
       if file_exists:
         os.remove(output_file_path)
-      json.dump(componentSet_dict, open(output_file_path, 'w'), indent = 2)
-      print(" \n", f"The new component set can be found at {output_file_path}")
\ No newline at end of file
+      with open(output_file_path, 'w') as output:
+        json.dump(componentSet_dict, output, indent = 2)
+      print(" \n", f"The new component set can be found at {output_file_path}")
+
+    for component_set, plot_future in zip(component_sets, plot_futures):
+      print('\n', f'The cost function of the component set "{component_set.set_name}" is produced and stored at: \n {plot_future.result()}')
+  finally:
+    # The worker processes are stopped even if a component set fails (the plots that are not started are cancelled)
+    if plot_executor is not None:
+      plot_executor.shutdown(cancel_futures=True)
+  return componentSet_dicts
+
+
+# Section 3:
+# Python Methods for the columnar table of the FORCE components
+
+def components_to_table(component_dicts_list):
+  """
+    Creating the table of the FORCE components (one row per component and one column per component information, see COMPONENT_TABLE_COLUMNS)
+    @ In, component_dicts_list, list, The list of dictionaries of the FORCE components
+    @ Out, table, pandas.DataFrame, The table of the FORCE components. The unknown powers and the missing values are stored as NaN
+  """
+  columns = OrderedDict()
+  for column, (mini_dict, key) in COMPONENT_TABLE_COLUMNS.items():
+    if mini_dict is None:
+      values = [comp.get(key) for comp in component_dicts_list]
+    else:
+      values = [(comp.get(mini_dict) or {}).get(key) for comp in component_dicts_list]
+    if column in NUMERIC_TABLE_COLUMNS:
+      columns[column] = np.array([_to_float(value) for value in values], dtype=float)
+    else:
+      columns[column] = np.array(values, dtype=object)
+  return pd.DataFrame(columns)
+
+
+def table_to_components(table):
+  """
+    Creating the FORCE components dictionaries from the table of the FORCE components (see components_to_table)
+    @ In, table, pandas.DataFrame, The table of the FORCE components
+    @ Out, component_dicts_list, list, The list of dictionaries of the FORCE components.
+      The numeric values are floats and the unknown HYSYS powers are "unknown"
+  """
+  component_dicts_list = []
+  for row in table.to_dict('records'):
+    force_dict = {}
+    for column, (mini_dict, key) in COMPONENT_TABLE_COLUMNS.items():
+      value = row[column]
+      if isinstance(value, float) and np.isnan(value):
+        value = None
+      if mini_dict is None:
+        force_dict[key] = value
+      else:
+        force_dict.setdefault(mini_dict, {})[key] = value
+    # The mini dictionaries are only kept for the codes that include the component
+    if all(value is None for value in force_dict["APEA"].values()):
+      del force_dict["APEA"]
+    if force_dict["HYSYS"]["Category"] is None:
+      del force_dict["HYSYS"]
+    elif force_dict["HYSYS"]["Power"] is None:
+      force_dict["HYSYS"]["Power"] = "unknown"
+    component_dicts_list.append(force_dict)
+  return component_dicts_list
+
+
+def _table_format(table_path):
+  """
+    The format of a table file (from its extension)
+    @ In, table_path, str, The path of the table file
+    @ Out, table_format, str, The format of the table file ('.csv' or '.parquet')
+  """
+  table_format = os.path.splitext(table_path)[1].lower()
+  if table_format not in TABLE_FORMATS:
+    raise ValueError(f"The format of the table file '{table_path}' is not supported. The supported extensions are: {TABLE_FORMATS}")
+  return table_format
+
+
+def write_force_components_table(table_path, components):
+  """
+    Writing the table of the FORCE components to one csv or parquet file (the format follows the file extension).
+    The parquet format requires pyarrow (or fastparquet)
+    @ In, table_path, str, The path of the table file (e.g. "FORCE_Components.csv"). It is overwritten if it exists
+    @ In, components, list or pandas.DataFrame, The list of dictionaries of the FORCE components or their table
+    @ Out, None
+  """
+  table_format = _table_format(table_path)
+  table = components if isinstance(components, pd.DataFrame) else components_to_table(components)
+  folder = os.path.dirname(os.path.abspath(table_path))
+  os.makedirs(folder, exist_ok=True)
+  # Writing to a temporary file first so that an interrupted run does not leave a corrupted table
+  temporary_path = table_path + f".{os.getpid()}.tmp"
+  if table_format == '.parquet':
+    try:
+      table.to_parquet(temporary_path, index=False)
+    except ImportError as error:
+      raise ImportError(f"Writing the parquet file '{table_path}' requires pyarrow (or fastparquet). "
+                        "The table can be written to a csv file instead") from error
+  else:
+    table.to_csv(temporary_path, index=False)
+  os.replace(temporary_path, table_path)
+  print(f"\n {len(table)} FORCE components are written to: {table_path}")
+
+
+def read_force_components_table(table_path):
+  """
+    Reading the table of the FORCE components from a csv or parquet file (see write_force_components_table)
+    @ In, table_path, str, The path of the table file
+    @ Out, table, pandas.DataFrame, The table of the FORCE components
+  """
+  table_format = _table_format(table_path)
+  if table_format == '.parquet':
+    try:
+      table = pd.read_parquet(table_path)
+    except ImportError as error:
+      raise ImportError(f"Reading the parquet file '{table_path}' requires pyarrow (or fastparquet)") from error
+  else:
+    # Only the empty cells are missing values (e.g. a component named "NA" is kept)
+    text_columns = [column for column in COMPONENT_TABLE_COLUMNS if column not in NUMERIC_TABLE_COLUMNS]
+    table = pd.read_csv(table_path, dtype={column: object for column in text_columns}, keep_default_na=False, na_values=[''])
+  missing_columns = [column for column in COMPONENT_TABLE_COLUMNS if column not in table.columns]
+  if missing_columns:
+    raise ValueError(f"The columns {missing_columns} are missing from the table of the FORCE components '{table_path}'")
+  table = table[list(COMPONENT_TABLE_COLUMNS)]
+  return table.astype({column: float for column in NUMERIC_TABLE_COLUMNS})
@@ -15,6 +15,10 @@ https://www.osti.gov/biblio/1890160
 To faciliate this integration, vaious classes and methods are created. This code includes the following:
 
  1 - A Python Method to create/update a component (or a component set) in HERON using the components' info from Aspen HYSYS and APEA
+ 2 - Python Methods to index the components of a HERON input file and to update them in one pass
+ 3 - Python Methods to update many HERON input files from one library of component sets (in parallel)
+ 4 - Python Methods for the incremental update: the fingerprint of each applied componentSet is stored (as a comment) in the capex "CashFlow" node
+   so that the componentSets that did not change since the last update are skipped
 """
 
 #####
@@ -23,7 +27,38 @@ To faciliate this integration, vaious classes and methods are created. This code
 
 import os
 import json
+import hashlib
+from functools import partial
 from xml.etree import ElementTree as ET
+try:
+  from .aspen_utils import map_files
+  from .convert_utils import write_pretty
+except ImportError:
+  from aspen_utils import map_files
+  from convert_utils import write_pretty
+
+# The beginning of the comments that are created in the HERON file by this module.
+# They are the only comments kept when a HERON file is parsed so that an updated file can be updated again without duplicating them
+FINGERPRINT_COMMENT = "FORCE componentSet fingerprint:"
+# The beginning of the note added when the power cost function is exported although another cost driver fits the costs better
+DRIVER_NOTE_COMMENT = "The power cost function is used since the capacity is a power:"
+GENERATED_COMMENTS = ("This component info are imported from:",
+                      "This component economic info are imported from:",
+                      "Some of this component economic info are imported from:",
+                      "This component cashFlow info are imported from:",
+                      "Some of this component cashFlow info are imported from:",
+                      "Default values are assigned to the cashflow parameters",
+                      "Units :",
+                      DRIVER_NOTE_COMMENT,
+                      "Reference Price (USD)",
+                      "Note that the cost function curve fitting error is",
+                      FINGERPRINT_COMMENT)
+# The generated comments that are replaced when a componentSet is applied again to the same component
+REPLACED_COMMENTS = ("Some of this component economic info are imported from:",
+                     "Some of this component cashFlow info are imported from:",
+                     "Note that the cost function curve fitting error is",
+                     DRIVER_NOTE_COMMENT,
+                     FINGERPRINT_COMMENT)
 
 
 # Section 1:
@@ -37,25 +72,20 @@ def create_componentsets_in_HERON(comp_sets_folder, heron_input_xml):
     @ In, heron_input_xml, str, The path of the original HERON xml file at which components will be updated/created
     @ Out, HERON_inp_tree, xml.etree.ElementTree.ElementTree, the updated HERON inut file (XML tree)
   """
+  HERON_inp_tree = parse_HERON_file(heron_input_xml)
+  comp_sets = load_componentsets(comp_sets_folder)
+  update_HERON_tree(HERON_inp_tree, comp_sets, heron_input_xml)
+  return HERON_inp_tree
 
-  HERON_inp_tree = ET.parse(heron_input_xml)
-  components_list = HERON_inp_tree.findall("Components")  # The "components" node
-  # if the "components" node is not found
-  if not components_list:
-    print("\n", f"The 'Components' node is not found in the HERON input xml file {heron_input_xml} and a new 'Components' node is created")
-    new_comps_node = ET.SubElement(HERON_inp_tree.getroot(), 'Components')
-    components_list = [new_comps_node]
 
-  for components in components_list:
-    component = components.findall("Component")
-    heron_comp_list = []  # The list of components
-    for comp in component:
-      heron_comp_list.append(comp.attrib["name"]) # The list of components found in the HERON input XML file
-    
-  comp_set_files_list = os.listdir(comp_sets_folder)
-
-  # Goin through the FORCE componentSets to extract relevant info
-  for textfile in comp_set_files_list:
+def load_componentsets(comp_sets_folder):
+  """
+    Loading the FORCE componentSets files (componentSet*.json or componentSet*.txt) of a folder
+    @ In, comp_sets_folder, str, The path of the folder that includes the componentSets files
+    @ Out, comp_sets, list, list of tuples (the path of the componentSet file, the componentSet dictionary), in the order of the file names
+  """
+  comp_sets = []
+  for textfile in sorted(os.listdir(comp_sets_folder)):
     if textfile.startswith('componentSet') and (textfile.endswith('.json') or textfile.endswith('.txt')):
       textfile_path = comp_sets_folder+"/"+textfile
       try:
@@ -63,108 +93,339 @@ def create_componentsets_in_HERON(comp_sets_folder, heron_input_xml):
           comp_set_dict = json.load(textfile_opened)
       except json.JSONDecodeError as e:
         raise ValueError(f"The content of {textfile_path} is not in proper JSON format and cannot be read") from e
-      comp_set_name = comp_set_dict.get('Component Set Name')
-
-      ref_driver = comp_set_dict.get('Reference Driver')
-      ref_driver_units = comp_set_dict.get('Reference Driver Power Units')
-      if ref_driver_units == "kW":
-        ref_driver = ref_driver/1000
-      ref_price = comp_set_dict.get('Reference Price (USD)')
-      scaling_factor = comp_set_dict.get('Scaling Factor')
-
-      fit_error = comp_set_dict.get('Fitting Average Error (%)')
-      # print(f" \n The FORCE component set '{comp_set_name}' is found")
-
-      # if the component is already in the HERON file, it gets updated
-      if comp_set_name in heron_comp_list:
-        #print(f"The component set {comp_set_name} already exists in the HERON XML input file. The {comp_set_name} info will be updated")
-        for component in components_list:
-          for comp in component:
-            if comp.attrib["name"] == comp_set_name:
-              for node in comp:
-                # if the "economics" node is found in the component node
-                if node.tag == "economics":
-                  ECO_NODE_FOUND = "True"
-                  print(f"The 'economics' node is found in the component {comp.attrib['name']} and will be updated.")
-
-                  for subnode in node:
-                    # If the cashflow node is found
-                    if subnode.tag == "CashFlow":
-                      if 'capex' in str(subnode.attrib["name"]):
-                        node.append(ET.Comment(f" Some of this component economic info are imported from: {textfile_path}"))
-                        print("The 'cashflow' subnode is found too and is updated")
-                        Cashflow_NODE_FOUND = "True"
-                        elements_to_update = []
-                        for subsubnode in subnode:
-                          if subsubnode.tag in ['reference_driver', 'reference_price', 'scaling_factor_x']:
-                            elements_to_update.append(subsubnode)
-                            print(f"WARNING: The value of the {subsubnode.tag} is updated.")
-                        for element in elements_to_update:
-                          subnode.remove(element)
-                        new_cash_node = subnode
-                        new_cash_node.append(ET.Comment(f" Some of this component cashFlow info are imported from: {textfile_path}"))
-
-                  try:
-                    Cashflow_NODE_FOUND
-                  # If cashflow node is not found
-                  except NameError:
-                    print(f"The 'CashFlow' subnode is not found under the 'economics' node in the component '{comp.attrib['name']}' and a new 'CashFlow' node is created")
-                    new_cash_node = ET.SubElement(node, "CashFlow",
-                                                  {'name': comp.attrib["name"]+"_capex",
-                                                   'type': "one-time",
-                                                   'taxable': "True",
-                                                   'inflation':"None",
-                                                   'mult_target': "False"} )
-                    new_cash_node.append(ET.Comment(f" This component cashFlow info are imported from: {textfile_path}"))
-
-              # if the economic node is not found in the component node
-              try:
-                ECO_NODE_FOUND
-              except NameError:
-                print(f"The 'economics' node is not found in the component '{comp.attrib['name']}' and a new 'economics' node is created")
-                new_econ_node = ET.SubElement(comp, "economics")
-                new_econ_node.append(ET.Comment(f" This component economic info are imported from: {textfile_path}"))
-
-                new_cash_node = ET.SubElement(new_econ_node,
-                                              "CashFlow",{
-                                                'name': comp.attrib["name"]+"_capex",
-                                                'type': "one-time",
-                                                'taxable': "True",
-                                                'inflation':"None",
-                                                'mult_target': "False"} )
-                new_cash_node.append(ET.Comment(f" Default values are assigned to the cashflow parameters and need to be reviewed by the user"))
-
-      else:
-        # if the component is not already in the HERON file, it is created.
-        # print(f"The component set '{comp_set_name}' is not found in the HERON XMl input file. The componnent node '{comp_set_name}' will be created")
-        comp_name_dict = {'name': comp_set_name}
-        for components in components_list:
-          new_comp_node = ET.SubElement(components, "Component", comp_name_dict)
-          new_comp_node.append(ET.Comment(f" This component info are imported from: {textfile_path}"))
-
-          new_econ_node = ET.SubElement(new_comp_node, "economics")
-          new_cash_node = ET.SubElement(new_econ_node, "CashFlow",{
-            'name': comp_set_name+"_capex",
-            'type': "one-time",
-            'taxable': "True",
-            'inflation':"None",
-            'mult_target': "False"} )
-          new_cash_node.append(ET.Comment(f" Default values are assigned to the cashflow parameters and need to be reviewed by the user"))
-
-      ref_driver_node = ET.SubElement(new_cash_node, "reference_driver")
-      ref_driver_val_node = ET.SubElement(ref_driver_node, "fixed_value")
-      ref_driver_val_node.text = str(ref_driver)
-      ref_driver_node.append(ET.Comment("Units : MW"))
-
-      ref_price_node = ET.SubElement(new_cash_node, "reference_price")
-      ref_price_val_node = ET.SubElement(ref_price_node, "fixed_value")
-      ref_price_val_node.text = str(ref_price*(-1))
-      ref_price_node.append(ET.Comment("Reference Price (USD)"))
-
-
-      scaling_factor_node = ET.SubElement(new_cash_node, "scaling_factor_x")
-      scaling_factor_val_node = ET.SubElement(scaling_factor_node, "fixed_value")
-      scaling_factor_val_node.text = str(scaling_factor)
-      new_cash_node.append(ET.Comment(f"Note that the cost function curve fitting error is {fit_error} %"))
+      comp_sets.append((textfile_path, comp_set_dict))
+  return comp_sets
+
+
+#####
+# Section 2:
+# Python Methods to index the components of a HERON input file and to update them in one pass
 
+def index_HERON_components(HERON_inp_tree, heron_input_xml=None):
+  """
+    Indexing the components of the HERON input file by name.
+    If the "Components" node is not found, a new "Components" node is created
+    @ In, HERON_inp_tree, xml.etree.ElementTree.ElementTree, the HERON input file (XML tree)
+    @ In, heron_input_xml, str, optional, The path of the HERON xml file (only used in the printed messages)
+    @ Out, components_node, xml.etree.ElementTree.Element, the first "Components" node (new components are created under it)
+    @ Out, components_index, dict, the "Component" nodes of all the "Components" nodes by their names
+        (the first node is kept if several components have the same name)
+  """
+  components_list = HERON_inp_tree.findall("Components")  # The "components" node
+  # if the "components" node is not found
+  if not components_list:
+    print("\n", f"The 'Components' node is not found in the HERON input xml file {heron_input_xml} and a new 'Components' node is created")
+    components_list = [ET.SubElement(HERON_inp_tree.getroot(), 'Components')]
+
+  components_index = {}
+  for components in components_list:
+    for comp in components.findall("Component"):
+      components_index.setdefault(comp.attrib["name"], comp)
+  return components_list[0], components_index
+
+
+def update_HERON_tree(HERON_inp_tree, comp_sets, heron_input_xml=None, incremental=True):
+  """
+    Create/update the components (component-sets) of a HERON input file (XML tree) in place.
+    The components are indexed once so that each componentSet is applied in a constant time
+    @ In, HERON_inp_tree, xml.etree.ElementTree.ElementTree, the HERON input file (XML tree)
+    @ In, comp_sets, list, list of tuples (the path of the componentSet file, the componentSet dictionary), see load_componentsets
+    @ In, heron_input_xml, str, optional, The path of the HERON xml file (only used in the printed messages)
+    @ In, incremental, bool, optional, if True, the componentSets that were already applied to the component (same fingerprint) are skipped
+    @ Out, HERON_inp_tree, xml.etree.ElementTree.ElementTree, the updated HERON inut file (XML tree)
+  """
+  components_node, components_index = index_HERON_components(HERON_inp_tree, heron_input_xml)
+  skipped_comp_sets = []
+  for textfile_path, comp_set_dict in comp_sets:
+    comp_set_name = comp_set_dict.get('Component Set Name')
+    fingerprint = componentset_fingerprint(comp_set_dict)
+    comp = components_index.get(comp_set_name)
+    # if the component is already in the HERON file, it gets updated (unless the same componentSet was already applied)
+    if comp is not None:
+      if incremental and applied_fingerprint(comp) == fingerprint:
+        skipped_comp_sets.append(comp_set_name)
+        continue
+      cash_node = update_HERON_component(comp, textfile_path)
+    # if the component is not already in the HERON file, it is created.
+    else:
+      comp, cash_node = create_HERON_component(components_node, comp_set_name, textfile_path)
+      components_index[comp_set_name] = comp
+    add_cost_function_to_cashflow(cash_node, comp_set_dict)
+    cash_node.append(ET.Comment(f" {FINGERPRINT_COMMENT} {fingerprint} "))
+  if skipped_comp_sets:
+    print(f"\n The component sets {skipped_comp_sets} did not change since they were applied to the HERON file and are skipped")
   return HERON_inp_tree
+
+
+def update_HERON_component(comp, textfile_path):
+  """
+    Preparing the capex "CashFlow" node of an existing component: the cost function nodes of the capex "CashFlow" node are removed.
+    The "economics" and "CashFlow" nodes are created if they are not found
+    @ In, comp, xml.etree.ElementTree.Element, the "Component" node
+    @ In, textfile_path, str, The path of the componentSet file (only used in the comments of the XML file)
+    @ Out, cash_node, xml.etree.ElementTree.Element, the capex "CashFlow" node at which the cost function is added
+  """
+  comp_name = comp.attrib["name"]
+  econ_node = comp.find("economics")
+  # if the economic node is not found in the component node
+  if econ_node is None:
+    print(f"The 'economics' node is not found in the component '{comp_name}' and a new 'economics' node is created")
+    econ_node = ET.SubElement(comp, "economics")
+    econ_node.append(ET.Comment(f" This component economic info are imported from: {textfile_path}"))
+    cash_node = new_capex_cashflow(econ_node, comp_name)
+    cash_node.append(ET.Comment(f" Default values are assigned to the cashflow parameters and need to be reviewed by the user"))
+    return cash_node
+
+  print(f"The 'economics' node is found in the component {comp_name} and will be updated.")
+  cash_node = find_capex_cashflow(econ_node)
+  # If cashflow node is not found
+  if cash_node is None:
+    print(f"The 'CashFlow' subnode is not found under the 'economics' node in the component '{comp_name}' and a new 'CashFlow' node is created")
+    cash_node = new_capex_cashflow(econ_node, comp_name)
+    cash_node.append(ET.Comment(f" This component cashFlow info are imported from: {textfile_path}"))
+    return cash_node
+
+  # The comments of a previous update are replaced
+  remove_generated_comments(econ_node, REPLACED_COMMENTS)
+  remove_generated_comments(cash_node, REPLACED_COMMENTS)
+  econ_node.append(ET.Comment(f" Some of this component economic info are imported from: {textfile_path}"))
+  print("The 'cashflow' subnode is found too and is updated")
+  elements_to_update = [subsubnode for subsubnode in cash_node
+                        if subsubnode.tag in ['reference_driver', 'reference_price', 'scaling_factor_x']]
+  for element in elements_to_update:
+    print(f"WARNING: The value of the {element.tag} is updated.")
+    cash_node.remove(element)
+  cash_node.append(ET.Comment(f" Some of this component cashFlow info are imported from: {textfile_path}"))
+  return cash_node
+
+
+def create_HERON_component(components_node, comp_set_name, textfile_path):
+  """
+    Creating a new component (with its "economics" and capex "CashFlow" nodes) under the "Components" node
+    @ In, components_node, xml.etree.ElementTree.Element, the "Components" node
+    @ In, comp_set_name, str, the component set name
+    @ In, textfile_path, str, The path of the componentSet file (only used in the comments of the XML file)
+    @ Out, new_comp_node, xml.etree.ElementTree.Element, the new "Component" node
+    @ Out, new_cash_node, xml.etree.ElementTree.Element, the new capex "CashFlow" node
+  """
+  new_comp_node = ET.SubElement(components_node, "Component", {'name': comp_set_name})
+  new_comp_node.append(ET.Comment(f" This component info are imported from: {textfile_path}"))
+  new_econ_node = ET.SubElement(new_comp_node, "economics")
+  new_cash_node = new_capex_cashflow(new_econ_node, comp_set_name)
+  new_cash_node.append(ET.Comment(f" Default values are assigned to the cashflow parameters and need to be reviewed by the user"))
+  return new_comp_node, new_cash_node
+
+
+def new_capex_cashflow(econ_node, comp_name):
+  """
+    Creating a capex "CashFlow" node with default attributes
+    @ In, econ_node, xml.etree.ElementTree.Element, the "economics" node
+    @ In, comp_name, str, the component name
+    @ Out, new_cash_node, xml.etree.ElementTree.Element, the new "CashFlow" node
+  """
+  return ET.SubElement(econ_node, "CashFlow",
+                       {'name': comp_name+"_capex",
+                        'type': "one-time",
+                        'taxable': "True",
+                        'inflation':"None",
+                        'mult_target': "False"})
+
+
+def add_cost_function_to_cashflow(cash_node, comp_set_dict):
+  """
+    Adding the cost function of a componentSet (reference driver, reference price and scaling factor) to a "CashFlow" node
+    @ In, cash_node, xml.etree.ElementTree.Element, the capex "CashFlow" node
+    @ In, comp_set_dict, dict, the componentSet dictionary
+    @ Out, None
+  """
+  # The capex of a HERON component is driven by its capacity (a power): only the power cost function is exported.
+  # If another cost driver fits the costs better (see FORCE.src.force.ForceComponentSet), the power fit of its ranking is used
+  cost_driver = comp_set_dict.get('Cost Driver', "Power")
+  power_fit = comp_set_dict
+  if cost_driver != "Power":
+    power_fits = [fit for fit in comp_set_dict.get('Cost Drivers Ranking', []) if fit.get('Cost Driver') == "Power"]
+    if not power_fits:
+      raise ValueError(f"The cost function of the component set '{comp_set_dict.get('Component Set Name')}' is driven by the {cost_driver} "
+                       "and cannot be exported to HERON: the HERON capacity is a power and the component set has no power cost function")
+    power_fit = power_fits[0]
+    print('\n','\033[91m', f"Warning: The {cost_driver} is the best cost driver of the component set '{comp_set_dict.get('Component Set Name')}' "
+          f"but HERON's capacity is a power: the power cost function is exported (fitting error {power_fit.get('Fitting Average Error (%)')} % "
+          f"instead of {comp_set_dict.get('Fitting Average Error (%)')} %)", '\033[0m')
+  ref_driver = power_fit.get('Reference Driver')
+  # The componentSets created before the other cost drivers were added store the units as 'Reference Driver Power Units'
+  ref_driver_units = power_fit.get('Reference Driver Units', power_fit.get('Reference Driver Power Units'))
+  if ref_driver_units == "kW":
+    ref_driver = ref_driver/1000
+  # The reference driver is a power in MW
+  units = "MW" if ref_driver_units in ["kW", "MW", None] else ref_driver_units
+  ref_price = power_fit.get('Reference Price (USD)')
+  scaling_factor = power_fit.get('Scaling Factor')
+  fit_error = power_fit.get('Fitting Average Error (%)')
+
+  ref_driver_node = ET.SubElement(cash_node, "reference_driver")
+  ref_driver_val_node = ET.SubElement(ref_driver_node, "fixed_value")
+  ref_driver_val_node.text = str(ref_driver)
+  ref_driver_node.append(ET.Comment(f"Units : {units}"))
+
+  ref_price_node = ET.SubElement(cash_node, "reference_price")
+  ref_price_val_node = ET.SubElement(ref_price_node, "fixed_value")
+  ref_price_val_node.text = str(ref_price*(-1))
+  ref_price_node.append(ET.Comment("Reference Price (USD)"))
+
+  scaling_factor_node = ET.SubElement(cash_node, "scaling_factor_x")
+  scaling_factor_val_node = ET.SubElement(scaling_factor_node, "fixed_value")
+  scaling_factor_val_node.text = str(scaling_factor)
+  cash_node.append(ET.Comment(f"Note that the cost function curve fitting error is {fit_error} %"))
+  if cost_driver != "Power":
+    cash_node.append(ET.Comment(f"{DRIVER_NOTE_COMMENT} the {cost_driver} fits the costs better "
+                                f"(fitting error {comp_set_dict.get('Fitting Average Error (%)')} %)"))
+
+
+#####
+# Section 3:
+# Python Methods to update many HERON input files from one library of component sets
+
+def new_HERON_file_path(heron_input_xml, output_folder=None):
+  """
+    The path of the updated HERON input file: "new_<filename>" in the folder of the original file (or in output_folder)
+    @ In, heron_input_xml, str, The path of the original HERON xml file
+    @ In, output_folder, str, optional, The folder of the updated file
+    @ Out, output_file, str, The path of the updated HERON xml file
+  """
+  if output_folder is None:
+    output_folder = os.path.abspath(os.path.join(heron_input_xml, os.pardir))
+  return os.path.join(output_folder, "new_" + os.path.basename(heron_input_xml))
+
+
+def update_HERON_file(heron_input_xml, comp_sets, output_file=None):
+  """
+    Create/update the components (component-sets) of one HERON input file and write the updated file
+    @ In, heron_input_xml, str, The path of the original HERON xml file
+    @ In, comp_sets, list, list of tuples (the path of the componentSet file, the componentSet dictionary), see load_componentsets
+    @ In, output_file, str, optional, The path of the updated HERON xml file (see new_HERON_file_path by default)
+    @ Out, output_file, str, The path of the updated HERON xml file
+  """
+  if output_file is None:
+    output_file = new_HERON_file_path(heron_input_xml)
+  HERON_inp_tree = update_HERON_tree(parse_HERON_file(heron_input_xml), comp_sets, heron_input_xml)
+  if os.path.exists(output_file):
+    os.remove(output_file)
+  with open(output_file, "w", encoding="utf8") as out:
+    write_pretty(HERON_inp_tree, out)
+  print(f" \n The new HERON file is updated/created at: '{output_file}' ")
+  return output_file
+
+
+def create_componentsets_in_many_HERON_files(comp_sets_folder, heron_input_xmls, workers=None, output_folder=None):
+  """
+    Create/update the components (component-sets) of many HERON input files (e.g. the sweep and opt variants of a case).
+    The componentSets files are loaded once and applied to all the HERON files (in parallel if workers > 1)
+    @ In, comp_sets_folder, str, The path of the folder that includes the componentSets files
+    @ In, heron_input_xmls, list, The paths of the original HERON xml files
+    @ In, workers, int, optional, The number of processes that update the HERON files in parallel (sequential if None or 1)
+    @ In, output_folder, str, optional, The folder of the updated files. By default each updated file is next to its original file
+    @ Out, output_files, list, The paths of the updated HERON xml files (in the order of heron_input_xmls)
+  """
+  output_files = [new_HERON_file_path(heron_input_xml, output_folder) for heron_input_xml in heron_input_xmls]
+  if len(set(output_files)) < len(output_files):
+    raise ValueError(f"Several HERON files have the same name and would be written to the same updated file in '{output_folder}'")
+  comp_sets = load_componentsets(comp_sets_folder)
+  if output_folder is not None:
+    os.makedirs(output_folder, exist_ok=True)
+  return map_files(partial(_update_HERON_file_to, comp_sets=comp_sets, output_folder=output_folder),
+                   heron_input_xmls, workers=workers)
+
+
+def _update_HERON_file_to(heron_input_xml, comp_sets, output_folder):
+  """
+    Update one HERON file into the output folder (a picklable function for the process pool)
+    @ In, heron_input_xml, str, The path of the original HERON xml file
+    @ In, comp_sets, list, the componentSets, see load_componentsets
+    @ In, output_folder, str, The folder of the updated file (None for the folder of the original file)
+    @ Out, output_file, str, The path of the updated HERON xml file
+  """
+  return update_HERON_file(heron_input_xml, comp_sets, new_HERON_file_path(heron_input_xml, output_folder))
+
+
+#####
+# Section 4:
+# Python Methods for the incremental update of the HERON input files
+
+class _GeneratedCommentsTreeBuilder(ET.TreeBuilder):
+  """
+    An XML tree builder that keeps the comments created by this module (see GENERATED_COMMENTS) and drops the other comments
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    super().__init__(insert_comments=True)
+
+  def comment(self, text):
+    """
+      Adding a comment to the tree if it is a generated comment
+      @ In, text, str, the comment text
+      @ Out, comment, xml.etree.ElementTree.Element, the comment element (None if the comment is dropped)
+    """
+    if text.strip().startswith(GENERATED_COMMENTS):
+      return super().comment(text)
+    return None
+
+
+def parse_HERON_file(heron_input_xml):
+  """
+    Parsing a HERON input file. The comments created by a previous update (including the fingerprints) are kept
+    @ In, heron_input_xml, str, The path of the HERON xml file
+    @ Out, HERON_inp_tree, xml.etree.ElementTree.ElementTree, the HERON input file (XML tree)
+  """
+  return ET.parse(heron_input_xml, parser=ET.XMLParser(target=_GeneratedCommentsTreeBuilder()))
+
+
+def componentset_fingerprint(comp_set_dict):
+  """
+    The fingerprint of a componentSet. It changes whenever any value of the componentSet changes
+    @ In, comp_set_dict, dict, the componentSet dictionary
+    @ Out, fingerprint, str, the sha256 hex digest of the componentSet
+  """
+  return hashlib.sha256(json.dumps(comp_set_dict, sort_keys=True, default=str).encode('utf8')).hexdigest()
+
+
+def find_capex_cashflow(econ_node):
+  """
+    Finding the capex "CashFlow" node (the first "CashFlow" node whose name includes 'capex') of an "economics" node
+    @ In, econ_node, xml.etree.ElementTree.Element, the "economics" node
+    @ Out, cash_node, xml.etree.ElementTree.Element, the capex "CashFlow" node (None if not found)
+  """
+  for cash_node in econ_node.findall("CashFlow"):
+    if 'capex' in str(cash_node.attrib.get("name")):
+      return cash_node
+  return None
+
+
+def applied_fingerprint(comp):
+  """
+    The fingerprint of the componentSet that was last applied to a component
+    @ In, comp, xml.etree.ElementTree.Element, the "Component" node
+    @ Out, fingerprint, str, the fingerprint stored in the capex "CashFlow" node (None if not found)
+  """
+  econ_node = comp.find("economics")
+  cash_node = find_capex_cashflow(econ_node) if econ_node is not None else None
+  if cash_node is None:
+    return None
+  for node in cash_node:
+    if node.tag is ET.Comment and node.text.strip().startswith(FINGERPRINT_COMMENT):
+      return node.text.strip()[len(FINGERPRINT_COMMENT):].strip()
+  return None
+
+
+def remove_generated_comments(node, comments):
+  """
+    Removing the generated comments of a node (only its direct children)
+    @ In, node, xml.etree.ElementTree.Element, the node
+    @ In, comments, tuple, the beginnings of the comments to remove
+    @ Out, None
+  """
+  for child in [child for child in node if child.tag is ET.Comment and child.text.strip().startswith(comments)]:
+    node.remove(child)
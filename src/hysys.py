@@ -13,7 +13,8 @@ https://www.aspentech.com/en/products/pages/aspen-process-economic-analyzer
 https://www.osti.gov/biblio/1890160
 
 To faciliate this integration, this code includes the following
-1 - Python Class and method for the component info in Aspen HYSYS
+1 - Python Class for the Aspen HYSYS output workbook (the HYSYS sheets are streamed once)
+2 - Python Class and method for the component info in Aspen HYSYS
 """
 
 #####
@@ -22,12 +23,118 @@ To faciliate this integration, this code includes the following
 
 import os
 import json
-import pandas as pd
 import shutil
+from functools import partial
+try:
+  from .aspen_utils import list_xlsx_files, map_files, cache_file_path, load_cached_components, store_cached_components, write_components_jsonl
+  from .aspen_utils import open_workbook, iter_sheet_rows, rows_to_frame
+except ImportError:
+  from aspen_utils import list_xlsx_files, map_files, cache_file_path, load_cached_components, store_cached_components, write_components_jsonl
+  from aspen_utils import open_workbook, iter_sheet_rows, rows_to_frame
+
+# The HYSYS sheets that include the components and the keywords of the rows that include the components capacities
+HYSYS_SHEETS = ['Expanders', 'Coolers', 'Pumps', 'Heaters', 'Tees', 'Mixers', 'Heat Exchangers']
+CAPACITY_KEYWORDS = ['POWER' , 'Power' , 'DUTY' , 'Duty']
+# The version of the extracted HYSYS components. It should be increased whenever the extracted information changes
+# so that the cached components (see extract_all_hysys_components) are not used anymore
+HYSYS_PARSER_VERSION = 3
 
 #####
 # Section 1:
-# Python Class for the HYSYS Component
+# Python Classes for the HYSYS Workbook and the HYSYS Component
+
+class HysysWorkbook:
+  """
+    The Aspen HYSYS output workbook: only the HYSYS sheets of a HYSYS output xlsx file are read (in read-only mode) and each of them
+    is streamed once (the other sheets, e.g. the stream tables, are never read). A sheet is streamed up to its first 'POWER' row,
+    since the rows below it cannot change the capacity row, and to its end otherwise.
+    Two indices are built from the parsed sheets:
+    1- header -> sheet: the sheet at which each component (header) is found
+    2- sheet -> capacity row: the row of each sheet that includes the capacity keyword ('POWER'/'DUTY')
+  """
+  def __init__(self, xlsx_filename):
+    """
+    Constructor
+    @ In, xlsx_filename, str, HYSYS output xlsx file
+    @ Out, None
+    """
+    self.xlsx_filename = xlsx_filename
+    self.sheets = {}
+    workbook = open_workbook(self.xlsx_filename)
+    try:
+      for sheet in HYSYS_SHEETS:
+        if sheet in workbook.sheetnames:
+          self.sheets[sheet] = self.read_sheet(workbook[sheet])
+    finally:
+      workbook.close()
+
+    self.header_sheet = {}
+    self.capacity_rows = {}
+    for sheet, sheet_data in self.sheets.items():
+      # If a header is found in several sheets, the last sheet is the one used (similar to the sequential search)
+      for header in sheet_data.columns.values:
+        self.header_sheet[header] = sheet
+      if sheet_data.shape[1]:
+        first_column = list(sheet_data.iloc[:, 0].values)
+        # The keywords are checked in order (e.g. 'POWER' before 'DUTY') and the first matching row is used
+        for keyword in CAPACITY_KEYWORDS:
+          if keyword in first_column:
+            self.capacity_rows[sheet] = first_column.index(keyword)
+            break
+
+  @staticmethod
+  def read_sheet(worksheet):
+    """
+    Reading the rows of one HYSYS sheet from the header row down to the first row of the first capacity keyword ('POWER').
+    The other keywords have a lower priority (a 'DUTY' row is only used if the sheet has no 'POWER' row), so the sheet is
+    read to its end if it has no 'POWER' row
+    @ In, worksheet, openpyxl read-only worksheet, the HYSYS sheet
+    @ Out, sheet_data, pandas.DataFrame, the sheet data (as read by pandas.read_excel) down to the 'POWER' row
+    """
+    rows = []
+    for row in iter_sheet_rows(worksheet):
+      rows.append(row)
+      if len(rows) > 1 and row and row[0] == CAPACITY_KEYWORDS[0]:
+        break
+    return rows_to_frame(rows)
+
+  def component_headers(self, sheet):
+    """
+    The headers of the components found in one sheet (the "Unit" and the unnamed columns are excluded)
+    @ In, sheet, str, the sheet name
+    @ Out, real_headers, list, the components names
+    """
+    if sheet not in self.sheets:
+      return []
+    headers = list(self.sheets[sheet].columns.values)
+    real_headers = [header for header in headers if not (header.__contains__("Unit") or header.__contains__("named"))]
+    return real_headers
+
+  def component_sheet(self, component_name):
+    """
+    The sheet at which a component is found
+    @ In, component_name, str, the component name
+    @ Out, sheet, str, the sheet name
+    """
+    if component_name not in self.header_sheet:
+      raise KeyError(f"The component '{component_name}' is not found in the HYSYS output file {self.xlsx_filename}")
+    return self.header_sheet[component_name]
+
+  def component_capacity(self, component_name):
+    """
+    The capacity (power or duty) of a component and its units
+    @ In, component_name, str, the component name
+    @ Out, (power, power_unit), tuple, the component capacity and its units ("unknown" if not available)
+    """
+    sheet = self.component_sheet(component_name)
+    if sheet not in self.capacity_rows:
+      return "unknown", "unknown"
+    sheet_data = self.sheets[sheet]
+    row = self.capacity_rows[sheet]
+    power = sheet_data[component_name].values[row]
+    power_unit = sheet_data["Unit"].values[row]
+    return power, power_unit
+
 
 class AspenHysysComponent:
   """
@@ -37,15 +144,18 @@ class AspenHysysComponent:
     2- The HYSYS output xlsx file from which the component info is imported
     It is possible to have two compoennts with the same name from different xlsx output files
   """
-  def __init__(self, xlsx_filename, component_name):
+  def __init__(self, xlsx_filename, component_name, workbook=None):
     """
     Constructor
     @ In, xlsx_filename, str, HYSYS output xlsx file from which the component info is imported
     @ In, component_name, str, the component name
+    @ In, workbook, HysysWorkbook, optional, the already loaded HYSYS workbook of xlsx_filename.
+      If not provided, the workbook is loaded when the component info is requested
     @ Out, None
     """
     self.xlsx_filename = xlsx_filename
     self.component_name = component_name
+    self.workbook = workbook
 
   def component_info(self):
     """
@@ -54,75 +164,97 @@ class AspenHysysComponent:
     @ Out, HYSYS_comp_info,  dict, The component relevant infomration extracted from the HYSYS code for a specific component
     """
 
-    sheets_names = ['Expanders', 'Coolers', 'Pumps', 'Heaters', 'Tees', 'Mixers', 'Heat Exchangers']
-    for sheet in sheets_names:
-      headers =list(pd.read_excel(self.xlsx_filename, sheet_name= sheet).columns.values)
-      if self.component_name in headers:
-        df = pd.read_excel(self.xlsx_filename, sheet_name= sheet)
-        keywords = ['POWER' , 'Power' , 'DUTY' , 'Duty']
-        capacity = (list(set(keywords).intersection(df.iloc[:, 0].values)))
-        if len(capacity):
-          power = df.loc[df.iloc[:, 0] == capacity[0] , self.component_name].values[0]
-          power_unit = df.loc[df.iloc[:, 0] == capacity[0] , "Unit"].values[0]
-        else:
-          power ="unknown"
-          power_unit = "unknown"
-
-        HYSYS_comp_info= {
-                          "Component Name": self.component_name,
-                          "HYSYS Category": sheet,
-                          "HYSYS Source": self.xlsx_filename,
-                          "HYSYS Power": power,
-                          "HYSYS Power Units": power_unit,
-                          "Component ID": self.component_name + "_from_" + self.xlsx_filename.split("/")[-1]
-                          }
+    if self.workbook is None:
+      self.workbook = HysysWorkbook(self.xlsx_filename)
+    sheet = self.workbook.component_sheet(self.component_name)
+    power, power_unit = self.workbook.component_capacity(self.component_name)
+
+    HYSYS_comp_info= {
+                      "Component Name": self.component_name,
+                      "HYSYS Category": sheet,
+                      "HYSYS Source": self.xlsx_filename,
+                      "HYSYS Power": power,
+                      "HYSYS Power Units": power_unit,
+                      "Component ID": self.component_name + "_from_" + self.xlsx_filename.split("/")[-1]
+                      }
     return HYSYS_comp_info
 
 
 #####
 # Section 2:
-# Python Method extracing all the HYSYS components
+# Python Methods extracing all the HYSYS components
+
+def extract_hysys_components_from_file(HYSYS_file_path, HYSYS_xlsx_outputs_folder_path, cache_folder=None, persist=True):
+  """
+    Extracting all the Aspen HYSYS components of one HYSYS output file
+    @ In, HYSYS_file_path, str, The path of the HYSYS output xlsx file
+    @ In, HYSYS_xlsx_outputs_folder_path, str, The path of the folder that includes all the outut files from HYSYS
+    @ In, cache_folder, str, optional, The folder of the cached components. If the same file was already parsed
+      (same content and same parser version), the components are loaded from the cache instead of the xlsx file
+    @ In, persist, bool, optional, If False, the components are only returned in memory and no text file is written
+    @ Out, HYSYS_outputs_path, str, The folder that contains the components created from this HYSYS file (None if persist is False)
+    @ Out, list_of_HYSYS_dicts, list, The components dictionaries of this HYSYS file
+  """
+  HYSYS_outputs_path = None
+  if persist:
+    HYSYS_outputs_path = os.path.split(os.path.abspath(HYSYS_xlsx_outputs_folder_path))[0]+\
+        "/HYSYS_comps/comp_from_"+str(os.path.basename(HYSYS_file_path))+"/"
+    HYSYS_outputs_path   = HYSYS_outputs_path .replace(" ", "_")
+    isExist = os.path.exists(HYSYS_outputs_path)
+    if isExist:
+      shutil.rmtree(HYSYS_outputs_path)
+    # Create a new directory
+    os.makedirs(HYSYS_outputs_path)
+    print("\n A new directory is created with all the Aspen HYSYS components at:", "\n", HYSYS_outputs_path, "\n")
+
+  cache_path = None
+  if cache_folder is not None:
+    cache_path = cache_file_path(cache_folder, HYSYS_file_path, "HYSYS", HYSYS_PARSER_VERSION)
+  list_of_HYSYS_dicts = load_cached_components(cache_path)
+  if list_of_HYSYS_dicts is None:
+    list_of_HYSYS_dicts = []
+    # The HYSYS sheets are read once per file
+    HYSYS_workbook = HysysWorkbook(HYSYS_file_path)
+    for sheet in HYSYS_SHEETS:
+      for header in HYSYS_workbook.component_headers(sheet):
+        component_1 = AspenHysysComponent(HYSYS_file_path, header, workbook=HYSYS_workbook)
+        list_of_HYSYS_dicts.append(component_1.component_info())
+    store_cached_components(cache_path, HYSYS_file_path, list_of_HYSYS_dicts)
+
+  if not persist:
+    return HYSYS_outputs_path, list_of_HYSYS_dicts
+  for component_1_info in list_of_HYSYS_dicts:
+    output_file = HYSYS_outputs_path+str(component_1_info["Component Name"]).replace(" ", "").replace('/', '_')+".txt"
+    # remove old file if exists
+    file_exists = os.path.exists(output_file)
+    if file_exists:
+      os.remove(output_file)
+    with open(output_file, 'w') as output:
+      json.dump(component_1_info, output, indent = 2)
+  return HYSYS_outputs_path, list_of_HYSYS_dicts
+
 
-def extract_all_hysys_components(HYSYS_xlsx_outputs_folder_path):
+def extract_all_hysys_components(HYSYS_xlsx_outputs_folder_path, workers=None, cache_folder=None, persist=True, jsonl_file=None):
   """
     Extracting all the Aspen HYSYS components
     @ In, HYSYS_xlsx_outputs_folder_path, str, The path of the folder that includes all the outut files from HYSYS
-    @ Out, HYSYS_outputs_path, str, The folder that contains the components created from the HYSYS code
+    @ In, workers, int, optional, The number of processes that parse the HYSYS files in parallel (sequential if None or 1)
+    @ In, cache_folder, str, optional, The folder of the cached components. Only the new or modified files are parsed
+    @ In, persist, bool, optional, If False, no folder and no text file is created for the components (they are only returned in memory)
+    @ In, jsonl_file, str, optional, The path of a JSON Lines file where all the components are written (one component per line)
+    @ Out, HYSYS_outputs_path, str, The folder that contains the components created from the HYSYS code (None if persist is False)
+    @ Out, list_of_HYSYS_dicts, list, The components dictionaries of all the HYSYS files (in the order of the files names)
   """
-  files_list = os.listdir(HYSYS_xlsx_outputs_folder_path)
+  HYSYS_files_paths = list_xlsx_files(HYSYS_xlsx_outputs_folder_path)
+  results = map_files(partial(extract_hysys_components_from_file,
+                              HYSYS_xlsx_outputs_folder_path=HYSYS_xlsx_outputs_folder_path,
+                              cache_folder=cache_folder,
+                              persist=persist),
+                      HYSYS_files_paths, workers=workers)
+  HYSYS_outputs_path = None
   list_of_HYSYS_dicts = []
-  for xlsxfile in files_list:
-    if xlsxfile.endswith(".xlsx"):
-      if xlsxfile[0].isalpha() or xlsxfile[0].isdigit():
-        HYSYS_file_path = HYSYS_xlsx_outputs_folder_path +"/" +xlsxfile
-
-        HYSYS_outputs_path = os.path.split(os.path.abspath(HYSYS_xlsx_outputs_folder_path))[0]+\
-            "/HYSYS_comps/comp_from_"+str(os.path.basename(HYSYS_file_path))+"/"
-        HYSYS_outputs_path   = HYSYS_outputs_path .replace(" ", "_")
-        isExist = os.path.exists(HYSYS_outputs_path)
-        if isExist:
-          shutil.rmtree(HYSYS_outputs_path)
-        # Create a new directory
-        os.makedirs(HYSYS_outputs_path)
-        print("\n A new directory is created with all the Aspen HYSYS components at:", "\n", HYSYS_outputs_path, "\n")
-
-        sheets_names = ['Expanders', 'Coolers', 'Pumps', 'Heaters', 'Tees', 'Mixers', 'Heat Exchangers']
-        for sheet in sheets_names:
-          HYSYS_file_data= pd.read_excel(HYSYS_file_path,sheet_name=sheet)
-          headers=list(HYSYS_file_data.columns.values)
-         
-          unwanted_headers =[]
-          for header in headers:
-            if (header.__contains__("Unit")) or (header.__contains__("named")):
-              unwanted_headers.append(header)
-          real_headers = [i for i in headers if i not in unwanted_headers]
-          for header in real_headers:
-            component_1 = AspenHysysComponent(HYSYS_file_path,header)
-            output_file = HYSYS_outputs_path+str(component_1.component_name).replace(" ", "").replace('/', '_')+".txt"
-            # remove old file if exists
-            file_exists = os.path.exists(output_file)
-            if file_exists:
-              os.remove(output_file)
-            json.dump(component_1.component_info(), open(output_file, 'w'),indent = 2)
-            list_of_HYSYS_dicts.append(component_1.component_info())
+  for HYSYS_outputs_path, file_HYSYS_dicts in results:
+    list_of_HYSYS_dicts.extend(file_HYSYS_dicts)
+  if jsonl_file is not None:
+    write_components_jsonl(jsonl_file, list_of_HYSYS_dicts)
   return HYSYS_outputs_path, list_of_HYSYS_dicts
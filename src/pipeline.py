@@ -0,0 +1,233 @@
+# Copyright 2024, Battelle Energy Alliance, LLC
+# ALL RIGHTS RESERVED
+"""
+The objective of this code is the vertical integration (auomated data transfer) between different IES codes.
+- Most of these IES codes are the FORCE codes: https://ies.inl.gov/SitePages/FORCE.aspx
+- Other codes are the Aspen HYSYS and the Aspen APEA:
+https://www.aspentech.com/en/products/engineering/aspen-hysys
+https://www.aspentech.com/en/products/pages/aspen-process-economic-analyzer
+
+This code includes the pipeline that goes from the Aspen HYSYS and APEA output xlsx files to the HERON input file:
+
+1 - A Python Class for the "Aspen-HERON pipeline". The pipeline runs the following stages and hands the artifact of each stage to the next one in memory:
+  - extract: extracting the HYSYS and APEA components from the xlsx files
+  - force_components: creating the FORCE components from the HYSYS and APEA components
+  - component_sets: creating the FORCE component sets and their cost functions
+  - heron: creating/updating the component sets in the HERON input file. The component sets of the component_sets stage are applied
+    with the other componentSets already in the component sets folder (as in create_componentsets_in_HERON)
+  The artifact of each stage can be stored in a checkpoint folder so that the pipeline can be started from any stage.
+  The time (and optionally the memory) of each stage is reported.
+"""
+#####
+# Section 0
+# Importing libraries and modules
+
+import os
+import json
+import time
+import tracemalloc
+try:
+  from .aspen_utils import _json_default
+  from .hysys import extract_all_hysys_components
+  from .apea import extract_all_apea_components
+  from .force import create_all_force_components_from_hysys_apea, extract_all_force_componentsets, list_setfiles
+  from .heron import update_HERON_file, load_componentsets
+except ImportError:
+  from aspen_utils import _json_default
+  from hysys import extract_all_hysys_components
+  from apea import extract_all_apea_components
+  from force import create_all_force_components_from_hysys_apea, extract_all_force_componentsets, list_setfiles
+  from heron import update_HERON_file, load_componentsets
+
+# The stages of the pipeline (in order)
+STAGES = ['extract', 'force_components', 'component_sets', 'heron']
+
+#####
+# Section 1:
+# A Python Class for the Aspen-HERON pipeline
+
+class AspenHeronPipeline:
+  """
+    The pipeline that creates/updates the component sets of a HERON input file from the Aspen HYSYS and APEA output xlsx files.
+    The artifact of each stage is handed to the next stage in memory, and it is stored in the checkpoint folder (if any)
+    as "<stage>.json" so that a later run can start from the next stage.
+  """
+  def __init__(self, hysys_folder, apea_folder, comp_sets_folder, heron_input_xml,
+               workers=None, cache_folder=None, checkpoint_folder=None, trace_memory=False, persist=True,
+               cost_drivers=None):
+    """
+      Constructor
+      @ In, hysys_folder, str, The folder containing the HYSYS output xlsx files
+      @ In, apea_folder, str, The folder containing the APEA output xlsx files
+      @ In, comp_sets_folder, str, The folder that contains the Setfiles (the user-defined files that identify which components to group together)
+      @ In, heron_input_xml, str, The initial HERON xml file that needs to be updated. The new file is "new_<filename>" in the same folder
+      @ In, workers, int, optional, The number of processes that parse the HYSYS and APEA xlsx files in parallel
+      @ In, cache_folder, str, optional, The folder of the cached HYSYS and APEA components (see aspen_utils)
+      @ In, checkpoint_folder, str, optional, The folder of the artifacts of the stages. No checkpoint is stored if None
+      @ In, trace_memory, bool, optional, if True, the peak memory of each stage is traced with tracemalloc.
+        Note that tracemalloc slows down the stages and does not trace the memory of the worker processes
+      @ In, persist, bool, optional, if False, the text files of the HYSYS, APEA and FORCE components are not written
+        (the components are only handed to the next stage and stored in the checkpoints)
+      @ In, cost_drivers, list, optional, The candidate cost drivers of the component sets (see force.COST_DRIVERS).
+        The driver with the lowest fitting error is used. Only the power is used if None
+      @ Out, None
+    """
+    self.hysys_folder = hysys_folder
+    self.apea_folder = apea_folder
+    self.comp_sets_folder = comp_sets_folder
+    self.heron_input_xml = heron_input_xml
+    self.workers = workers
+    self.cache_folder = cache_folder
+    self.checkpoint_folder = checkpoint_folder
+    self.trace_memory = trace_memory
+    self.persist = persist
+    self.cost_drivers = cost_drivers
+    self.stage_methods = {'extract': self.extract,
+                          'force_components': self.force_components,
+                          'component_sets': self.component_sets,
+                          'heron': self.heron}
+    self.report = []
+
+  def run(self, from_stage=STAGES[0], to_stage=STAGES[-1]):
+    """
+      Running the stages of the pipeline from from_stage to to_stage
+      @ In, from_stage, str, optional, the first stage. If it is not the first stage of the pipeline,
+        the artifact of the previous stage is loaded from the checkpoint folder
+      @ In, to_stage, str, optional, the last stage
+      @ Out, artifacts, dict, the artifacts of the stages that were run by stage name
+    """
+    for stage in [from_stage, to_stage]:
+      if stage not in STAGES:
+        raise ValueError(f"The stage '{stage}' is not one of the pipeline stages: {STAGES}")
+    first, last = STAGES.index(from_stage), STAGES.index(to_stage)
+    if first > last:
+      raise ValueError(f"The stage '{from_stage}' comes after the stage '{to_stage}'")
+
+    artifact = self.load_checkpoint(STAGES[first-1]) if first > 0 else None
+    artifacts = {}
+    self.report = []
+    for step, stage in enumerate(STAGES[first:last+1], start=first+1):
+      print("\n",'\033[95m', f"Step{step} ({stage}) begins", '\033[0m', "\n")
+      artifact = self.run_stage(stage, artifact)
+      artifacts[stage] = artifact
+      self.save_checkpoint(stage, artifact)
+      print("\n",'\033[95m', f"Step{step} ({stage}) is complete", '\033[0m', "\n")
+    self.print_report()
+    return artifacts
+
+  def run_stage(self, stage, artifact):
+    """
+      Running one stage and recording its time (and memory) in the report
+      @ In, stage, str, the stage name
+      @ In, artifact, object, the artifact of the previous stage
+      @ Out, artifact, object, the artifact of this stage
+    """
+    if self.trace_memory:
+      tracemalloc.start()
+    start = time.perf_counter()
+    try:
+      artifact = self.stage_methods[stage](artifact)
+    finally:
+      stage_report = {"Stage": stage, "Time (s)": time.perf_counter() - start}
+      if self.trace_memory:
+        stage_report["Peak Memory (MB)"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+      self.report.append(stage_report)
+    return artifact
+
+  def print_report(self):
+    """
+      Printing the time (and memory) of the stages of the last run. The report is also stored in the checkpoint folder (if any)
+      @ In, None
+      @ Out, None
+    """
+    print("\n", "Pipeline report:")
+    for stage_report in self.report:
+      line = f"   {stage_report['Stage']:<18} {stage_report['Time (s)']:10.3f} s"
+      if "Peak Memory (MB)" in stage_report:
+        line += f" {stage_report['Peak Memory (MB)']:10.1f} MB"
+      print(line)
+    if self.checkpoint_folder is not None:
+      with open(os.path.join(self.checkpoint_folder, "pipeline_report.json"), 'w') as report_file:
+        json.dump(self.report, report_file, indent=2)
+
+  def checkpoint_path(self, stage):
+    """
+      The path of the checkpoint file of a stage
+      @ In, stage, str, the stage name
+      @ Out, checkpoint_path, str, the path of the checkpoint file
+    """
+    return os.path.join(self.checkpoint_folder, stage + ".json")
+
+  def save_checkpoint(self, stage, artifact):
+    """
+      Storing the artifact of a stage in the checkpoint folder (nothing is stored if there is no checkpoint folder)
+      @ In, stage, str, the stage name
+      @ In, artifact, object, the artifact of the stage
+      @ Out, None
+    """
+    if self.checkpoint_folder is None:
+      return
+    os.makedirs(self.checkpoint_folder, exist_ok=True)
+    checkpoint_path = self.checkpoint_path(stage)
+    # Writing to a temporary file first so that an interrupted run does not leave a corrupted checkpoint
+    temporary_path = checkpoint_path + ".tmp"
+    with open(temporary_path, 'w') as checkpoint_file:
+      json.dump(artifact, checkpoint_file, default=_json_default)
+    os.replace(temporary_path, checkpoint_path)
+
+  def load_checkpoint(self, stage):
+    """
+      Loading the artifact of a stage from the checkpoint folder
+      @ In, stage, str, the stage name
+      @ Out, artifact, object, the artifact of the stage
+    """
+    if self.checkpoint_folder is None or not os.path.exists(self.checkpoint_path(stage)):
+      raise FileNotFoundError(f"The checkpoint of the stage '{stage}' is not found in the checkpoint folder '{self.checkpoint_folder}'. "
+                              f"The stage '{stage}' needs to be run with a checkpoint folder first")
+    with open(self.checkpoint_path(stage)) as checkpoint_file:
+      print(f"\n The artifact of the stage '{stage}' is loaded from: {self.checkpoint_path(stage)}")
+      return json.load(checkpoint_file)
+
+  def extract(self, artifact=None):
+    """
+      The "extract" stage: extracting the HYSYS and APEA components
+      @ In, artifact, None, this is the first stage
+      @ Out, artifact, dict, the lists of the HYSYS and APEA components dictionaries {"HYSYS": list, "APEA": list}
+    """
+    hysys_comps_list = extract_all_hysys_components(self.hysys_folder, workers=self.workers, cache_folder=self.cache_folder, persist=self.persist)[1]
+    apea_comps_list = extract_all_apea_components(self.apea_folder, workers=self.workers, cache_folder=self.cache_folder, persist=self.persist)[1]
+    return {"HYSYS": hysys_comps_list, "APEA": apea_comps_list}
+
+  def force_components(self, artifact):
+    """
+      The "force_components" stage: creating the FORCE components
+      @ In, artifact, dict, the artifact of the "extract" stage
+      @ Out, artifact, list, the FORCE components dictionaries
+    """
+    return create_all_force_components_from_hysys_apea([artifact["HYSYS"], artifact["APEA"]], self.hysys_folder, persist=self.persist)[0]
+
+  def component_sets(self, artifact):
+    """
+      The "component_sets" stage: creating the FORCE component sets (the componentSet files are created next to the Setfiles)
+      @ In, artifact, list, the artifact of the "force_components" stage
+      @ Out, artifact, list, list of lists [the path of the componentSet file, the componentSet dictionary]
+    """
+    Setfiles_paths = list_setfiles(self.comp_sets_folder)
+    componentSet_dicts = extract_all_force_componentsets(self.comp_sets_folder, artifact, drivers=self.cost_drivers)
+    return [[self.comp_sets_folder + "/" + os.path.basename(Setfile_path).replace("Setfile", "componentSet"), componentSet_dict]
+            for Setfile_path, componentSet_dict in zip(Setfiles_paths, componentSet_dicts)]
+
+  def heron(self, artifact):
+    """
+      The "heron" stage: creating/updating the component sets in the HERON input file.
+      The component sets of the artifact are applied with the other componentSets files of the component sets folder
+      (the componentSets of the folder with the name of a component set of the artifact are replaced by the artifact)
+      @ In, artifact, list, the artifact of the "component_sets" stage (list of lists [the path of the componentSet file, the componentSet dictionary])
+      @ Out, output_file, str, the path of the new HERON input file
+    """
+    artifact_names = {comp_set_dict.get("Component Set Name") for _, comp_set_dict in artifact}
+    comp_sets = [(textfile_path, comp_set_dict) for textfile_path, comp_set_dict in load_componentsets(self.comp_sets_folder)
+                 if comp_set_dict.get("Component Set Name") not in artifact_names]
+    comp_sets += [(textfile_path, comp_set_dict) for textfile_path, comp_set_dict in artifact]
+    return update_HERON_file(self.heron_input_xml, comp_sets)
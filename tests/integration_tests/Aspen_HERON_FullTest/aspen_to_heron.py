@@ -12,8 +12,18 @@ It takes the following arguments:
 3- A folder that contains the user-defined files that idntify which components to group together
 4- The initial HERON XML file that needs to be updated
 
+Optional arguments:
+--workers: the number of processes that parse the HYSYS and APEA xlsx files in parallel
+--cache-folder: a folder where the extracted HYSYS and APEA components are cached (unchanged xlsx files are not parsed again)
+--checkpoint-folder: a folder where the artifact of each stage is stored so that the pipeline can be restarted from any stage
+--from-stage, --to-stage: the first and last stages to run (extract, force_components, component_sets, heron)
+--trace-memory: report the peak memory of each stage (in addition to its time)
+--no-persist: do not write the text files of the HYSYS, APEA and FORCE components (one file per component)
+
 Example:
 python aspen_to_heron.py HYSYS_outputs/ APEA_outputs/ Sets1/ heron_input.xml
+python aspen_to_heron.py HYSYS_outputs/ APEA_outputs/ Sets1/ heron_input.xml --workers 4 --cache-folder aspen_cache/
+python aspen_to_heron.py HYSYS_outputs/ APEA_outputs/ Sets1/ heron_input.xml --checkpoint-folder checkpoints/ --from-stage component_sets
 """
 
 
@@ -25,11 +35,8 @@ import argparse
 
 # import from the vertical_inegration/src
 sys.path.insert(1, os.path.dirname(__file__).rsplit("FORCE",maxsplit=1)[:-1][0]+"FORCE/src")
-import convert_utils as xm
-from hysys import extract_all_hysys_components
-from apea import extract_all_apea_components
-from force import create_all_force_components_from_hysys_apea, extract_all_force_componentsets
-from heron import create_componentsets_in_HERON
+from pipeline import AspenHeronPipeline, STAGES
+from force import COST_DRIVERS
 
 
 # Specifying user inputs and output file
@@ -42,37 +49,25 @@ if __name__ == "__main__":
   parser.add_argument("apea_xlsx_outputs_folder_path", help="apea_xlsx_outputs_folder_path")
   parser.add_argument("componentSets_folder", help="The paths of folders that contain the setfiles. Setfiles are files that list the components that the user wants to group together as one list")
   parser.add_argument("HERON_Input_XML", help="The original HERON input XML file to which the new component data are transferred")
+  parser.add_argument("--workers", type=int, default=1, help="The number of processes that parse the HYSYS and APEA xlsx files in parallel")
+  parser.add_argument("--cache-folder", default=None, help="A folder where the components extracted from the HYSYS and APEA xlsx files are cached. Unchanged xlsx files are not parsed again")
+  parser.add_argument("--checkpoint-folder", default=None, help="A folder where the artifact of each stage is stored. It is needed to start from a stage other than the first one")
+  parser.add_argument("--from-stage", default=STAGES[0], choices=STAGES, help="The first stage to run. The artifact of the previous stage is loaded from the checkpoint folder")
+  parser.add_argument("--to-stage", default=STAGES[-1], choices=STAGES, help="The last stage to run")
+  parser.add_argument("--trace-memory", action="store_true", help="Report the peak memory of each stage (slower)")
+  parser.add_argument("--no-persist", action="store_true", help="Do not write the text files of the HYSYS, APEA and FORCE components (they are only kept in memory and in the checkpoints)")
+  parser.add_argument("--cost-drivers", nargs='+', choices=list(COST_DRIVERS), default=None,
+                      help="The candidate cost drivers of the cost functions. The driver with the lowest fitting error is used (the power by default)")
   args = parser.parse_args()
-  
-  print("\n",'\033[95m', "Step1 (creating HYSES and APEA components) begins", '\033[0m', "\n")
-  hysys_comps_list = extract_all_hysys_components(args.hyses_xlsx_outputs_folder_path)[1]
-  apea_comps_list = extract_all_apea_components(args.apea_xlsx_outputs_folder_path)[1]
-  print("\n",'\033[95m', "Step1 (creating HYSES and APEA components) is complete", '\033[0m', "\n")
-
-  print("\n",'\033[95m', "Step2 (creating HYSES and APEA FORCE components) begins", '\033[0m', "\n")
-  FORCE_comps_list = create_all_force_components_from_hysys_apea( [hysys_comps_list, apea_comps_list ], args.hyses_xlsx_outputs_folder_path)[0]
-  print("\n",'\033[95m', "Step2 (creating HYSES and APEA FORCE components) is complete", '\033[0m', "\n")
-
-  
-
-  print("\n",'\033[95m', "Step3 (creating FORCE components Sets) begins", '\033[0m', "\n")
-  extract_all_force_componentsets(args.componentSets_folder, FORCE_comps_list)
-  print("\n",'\033[95m', "Step3 (creating FORCE componentsSets) is complete", '\033[0m', "\n")
-
-  print("\n",'\033[95m', "Step4 (Component Sets are loaded to the HERON input XMl file) begins", '\033[0m', "\n")
-  new_HERON_tree = create_componentsets_in_HERON (args.componentSets_folder, args.HERON_Input_XML)
-
-  parnet_folder_name = os.path.abspath(os.path.join(args.HERON_Input_XML, os.pardir))
-  filename = os.path.basename(args.HERON_Input_XML)
-
-
-  output_file = parnet_folder_name+"/new_"+filename
-  file_exists = os.path.exists(output_file)
-  if file_exists:
-    os.remove(output_file)
-
-  with open(output_file, "w", encoding="utf8") as out:
-    print((xm.prettify(new_HERON_tree )), file=out)
 
-  print (f" \n The new HERON file is updated/created at: '{output_file}' ")
-  print("\n",'\033[95m',"Step4 (Component Sets are loaded to the HERON input XMl file) is complete", '\033[0m', "\n")
+  pipeline = AspenHeronPipeline(args.hyses_xlsx_outputs_folder_path,
+                                args.apea_xlsx_outputs_folder_path,
+                                args.componentSets_folder,
+                                args.HERON_Input_XML,
+                                workers=args.workers,
+                                cache_folder=args.cache_folder,
+                                checkpoint_folder=args.checkpoint_folder,
+                                trace_memory=args.trace_memory,
+                                persist=not args.no_persist,
+                                cost_drivers=args.cost_drivers)
+  pipeline.run(from_stage=args.from_stage, to_stage=args.to_stage)
@@ -5,10 +5,15 @@ A script that creates/updates the component sets in HERON from the componentSets
 
 It takes the following arguments:
 1 - A folder that contains the user-defined files that idntify which components to group together
-2 - The initial HERON XML file that needs to be updated
+2 - The initial HERON XML file(s) that need to be updated. The componentSets are loaded once and applied to all the files
+
+Optional arguments:
+--workers: the number of processes that update the HERON XML files in parallel
+--output-folder: the folder of the updated HERON XML files (by default, each new file is next to its original file)
 
 Example:
 python force_component_sets_to_heron.py Sets1/ heron_input.xml
+python force_component_sets_to_heron.py Sets1/ case1/heron_sweep.xml case1/heron_opt.xml case2/heron_sweep.xml --workers 4
 """
 
 #!/usr/bin/env python
@@ -18,8 +23,7 @@ import argparse
 
 # import from the vertical_inegration/src
 sys.path.append(os.path.dirname(__file__).rsplit("FORCE",maxsplit=1)[:-1][0]+"/FORCE/src")
-from heron import create_componentsets_in_HERON
-import convert_utils as xm
+from heron import create_componentsets_in_many_HERON_files
 
 # Specifying user inputs and output file
 if __name__ == "__main__":
@@ -28,19 +32,9 @@ if __name__ == "__main__":
     )
     # Inputs from the user
   parser.add_argument("Comp_Sets_Folder", help="The folder that includes all the FORCE component sets that have the info we want to import to HERON input XML file ")
-  parser.add_argument("HERON_Input_XML", help="The original HERON input XML file to which the new component data are transferred")
+  parser.add_argument("HERON_Input_XML", nargs='+', help="The original HERON input XML file(s) to which the new component data are transferred")
+  parser.add_argument("--workers", type=int, default=1, help="The number of processes that update the HERON XML files in parallel")
+  parser.add_argument("--output-folder", default=None, help="The folder of the updated HERON XML files. By default, each new file is next to its original file")
   args = parser.parse_args()
-  parnet_folder_name = os.path.abspath(os.path.join(args.HERON_Input_XML, os.pardir))
-  filename = os.path.basename(args.HERON_Input_XML)
-
-  new_HERON_tree = create_componentsets_in_HERON (args.Comp_Sets_Folder, args.HERON_Input_XML)
-
-  output_file = parnet_folder_name+"/new_"+filename
-  file_exists = os.path.exists(output_file)
-  if file_exists:
-    os.remove(output_file)
-
-  with open(output_file, "w", encoding="utf8") as out:
-    print((xm.prettify(new_HERON_tree )), file=out)
 
-  print (f" \n The new HERON file is updated/created at: '{output_file}' ")
+  create_componentsets_in_many_HERON_files(args.Comp_Sets_Folder, args.HERON_Input_XML, workers=args.workers, output_folder=args.output_folder)
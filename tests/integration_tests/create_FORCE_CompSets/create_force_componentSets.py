@@ -25,7 +25,7 @@ import argparse
 sys.path.insert(1, os.path.dirname(__file__).rsplit("FORCE",maxsplit=2)[:-1][0]+"FORCE/src")
 from hysys import extract_all_hysys_components
 from apea import extract_all_apea_components
-from force import create_all_force_components_from_hysys_apea, extract_all_force_componentsets
+from force import create_all_force_components_from_hysys_apea, extract_all_force_componentsets, COST_DRIVERS
 
 
 # Specifying user inputs and output file
@@ -37,6 +37,8 @@ if __name__ == "__main__":
   parser.add_argument("hyses_xlsx_outputs_folder_path", help="hyses_xlsx_outputs_folder_path")
   parser.add_argument("apea_xlsx_outputs_folder_path", help="apea_xlsx_outputs_folder_path")
   parser.add_argument("componentSets_folder", help="The paths of folders that contain the setfiles. Setfiles are files that list the components that the user wants to group together as one list")
+  parser.add_argument("--cost-drivers", nargs='+', choices=list(COST_DRIVERS), default=None,
+                      help="The candidate cost drivers of the cost functions. The driver with the lowest fitting error is used (the power by default)")
   args = parser.parse_args()
   
   print("\n",'\033[95m', "Step1 (creating HYSES and APEA components) begins", '\033[0m', "\n")
@@ -51,5 +53,5 @@ if __name__ == "__main__":
   
 
   print("\n",'\033[95m', "Step3 (creating FORCE components Sets) begins", '\033[0m', "\n")
-  extract_all_force_componentsets(args.componentSets_folder, FORCE_comps_list)
+  extract_all_force_componentsets(args.componentSets_folder, FORCE_comps_list, drivers=args.cost_drivers)
   print("\n",'\033[95m', "Step3 (creating FORCE componentsSets) is complete", '\033[0m', "\n")
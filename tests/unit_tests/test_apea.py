@@ -0,0 +1,94 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import openpyxl
+import pandas as pd
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.src.apea import ApeaWorkbook, ApeaComponent, extract_all_apea_components
+
+COST_COLUMNS = ['Equipment Cost [USD]', 'Installed Cost [USD]', 'Equipment Weight [LBS]', 'Total Installed Weight [LBS]']
+
+def write_apea_file(xlsx_file, rows):
+  """
+    Writes an APEA output xlsx file with an 'Equipment' sheet (three title rows, then the header row and the equipment rows)
+    @ In, xlsx_file, str, the path of the xlsx file
+    @ In, rows, list, the equipment rows ([name, equipment cost, installed cost, equipment weight, total installed weight])
+    @ Out, None
+  """
+  workbook = openpyxl.Workbook()
+  equipment = workbook.active
+  equipment.title = 'Equipment'
+  equipment.append(['Project Name: test'])
+  equipment.append([None])
+  equipment.append(['Equipment List'])
+  equipment.append(['Name', 'Type'] + COST_COLUMNS)
+  for row in rows:
+    equipment.append([row[0], 'PUMP'] + list(row[1:]))
+  workbook.create_sheet('Summary').append(['Total Cost', 1e9])
+  workbook.save(xlsx_file)
+
+def read_cost_info_per_component(xlsx_file, component_name):
+  """
+    Reads the cost info of one component as the APEA module did before the workbook was parsed only once
+    (the 'Equipment' sheet is read again for each component and the first row with the component name is used)
+    @ In, xlsx_file, str, the path of the xlsx file
+    @ In, component_name, str, the component name
+    @ Out, apea_comp_info, dict, the component cost info
+  """
+  file_data = pd.read_excel(xlsx_file, sheet_name='Equipment', skiprows=3)
+  values = [file_data.loc[file_data['Name'] == component_name, column].values[0].item() for column in COST_COLUMNS]
+  return {"Component Name": component_name,
+          "APEA_Source": xlsx_file,
+          "APEA Equipment Cost [USD]": values[0],
+          "APEA Installed Cost [USD]": values[1],
+          "APEA Equipment Weight [LBS]": values[2],
+          "APEA Total Installed Weight [LBS]": values[3],
+          "Component ID": component_name + "_from_" + xlsx_file.split("/")[-1]}
+
+class TestApeaWorkbook(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.apea_folder = os.path.join(self.folder, "APEA_outputs")
+    os.makedirs(self.apea_folder)
+    self.xlsx_file = self.apea_folder + "/Output.xlsx"
+    # Integral and float values, a duplicate name (the first row is used) and a name with a space
+    write_apea_file(self.xlsx_file, [['P-100', 1000, 2500.5, 300, 700],
+                                     ['E 101', 12000.25, 40000, 1500.5, 3000],
+                                     ['P-100', 1, 2, 3, 4],
+                                     ['C-102', 0, 0.0, 10, 20]])
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_same_info_as_per_component_reads(self):
+    apea_workbook = ApeaWorkbook(self.xlsx_file)
+    self.assertEqual(apea_workbook.component_names(), ['P-100', 'E 101', 'P-100', 'C-102'])
+    for component_name in ['P-100', 'E 101', 'C-102']:
+      expected = read_cost_info_per_component(self.xlsx_file, component_name)
+      # With the shared workbook and with the workbook loaded by the component
+      for workbook in [apea_workbook, None]:
+        info = ApeaComponent(self.xlsx_file, component_name, workbook=workbook).component_cost_info()
+        self.assertEqual(info, expected)
+        for key, value in info.items():
+          self.assertIs(type(value), type(expected[key]), key)
+
+  def test_unknown_component(self):
+    with self.assertRaises(KeyError):
+      ApeaComponent(self.xlsx_file, 'P-999', workbook=ApeaWorkbook(self.xlsx_file)).component_cost_info()
+
+  def test_extract_all_components(self):
+    APEA_outputs_path, list_of_APEA_dicts = extract_all_apea_components(self.apea_folder)
+    # One component per row of the 'Equipment' sheet, in the order of the sheet
+    self.assertEqual(list_of_APEA_dicts, [read_cost_info_per_component(self.xlsx_file, name)
+                                          for name in ['P-100', 'E 101', 'P-100', 'C-102']])
+    self.assertEqual(sorted(os.listdir(APEA_outputs_path)), ['C-102.txt', 'E101.txt', 'P-100.txt'])
+
+# This is not needed for running tests through FORCE/run_tests
+# It does allow tests to be run via the unit tester when test_apea is run directly
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,200 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import openpyxl
+import pandas as pd
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.src.aspen_utils import open_workbook, iter_sheet_rows, rows_to_frame, map_files, cache_file_path
+from FORCE.src.hysys import HysysWorkbook
+from FORCE.src import apea
+from FORCE.src.apea import extract_all_apea_components, extract_apea_components_from_file
+
+def slow_square(number):
+  """
+    Squares a number, more slowly for the small numbers so that the workers finish in the reverse order of the numbers
+    @ In, number, int, the number
+    @ Out, (number, square, pid), tuple, the number, its square and the process that computed it
+  """
+  time.sleep(0.05 * (5 - number))
+  return number, number ** 2, os.getpid()
+
+def write_apea_file(xlsx_file, names):
+  """
+    Writes an APEA output xlsx file with one equipment row per name
+    @ In, xlsx_file, str, the path of the xlsx file
+    @ In, names, list, the names of the components
+    @ Out, None
+  """
+  workbook = openpyxl.Workbook()
+  equipment = workbook.active
+  equipment.title = 'Equipment'
+  for _ in range(3):
+    equipment.append([None])
+  equipment.append(['Name', 'Equipment Cost [USD]', 'Installed Cost [USD]', 'Equipment Weight [LBS]', 'Total Installed Weight [LBS]'])
+  for i, name in enumerate(names):
+    equipment.append([name, 1000.5 * (i + 1), 2500.5 * (i + 1), 100.5, 200.5])
+  workbook.save(xlsx_file)
+
+class TestStreamingReader(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.xlsx_file = os.path.join(self.folder, "Output.xlsx")
+    workbook = openpyxl.Workbook()
+    pumps = workbook.active
+    pumps.title = 'Pumps'
+    # Duplicate and missing headers, integral floats, missing values, "NA" strings and rows below the capacity row
+    pumps.append([None, 'Unit', 'P-100', 'P-101', 'P-100', None, 'P-102'])
+    pumps.append([None])
+    pumps.append(['Speed', 'rpm', '<empty>', '<empty>', '<empty>', None, '<empty>'])
+    pumps.append(['Power', 'kW', 7.0, 1.5, None, None, 'NA'])
+    pumps.append(['Feed Pressure', 'kPa', 100, 200, 300, None, 400])
+    pumps.append([None])
+    coolers = workbook.create_sheet('Coolers')
+    coolers.append([None, 'Unit', 'E-100'])
+    coolers.append([None])
+    coolers.append(['DUTY', 'MW', 12])
+    coolers.append(['Feed Temperature', 'C', 40.5])
+    heaters = workbook.create_sheet('Heaters')
+    # Both keywords: 'POWER' has the priority even if the 'DUTY' row comes first
+    heaters.append([None, 'Unit', 'E-101'])
+    heaters.append(['Duty', 'kW', 3])
+    heaters.append(['DUTY', 'MW', 4])
+    heaters.append(['POWER', 'kW', 5])
+    heaters.append(['Power', 'W', 6])
+    heaters.append(['POWER', 'MW', 7])
+    streams = workbook.create_sheet('Material Streams')
+    streams.append([None, 'Unit', 27])
+    workbook.save(self.xlsx_file)
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_same_frames_as_read_excel(self):
+    workbook = open_workbook(self.xlsx_file)
+    try:
+      for sheet in workbook.sheetnames:
+        frame = rows_to_frame(list(iter_sheet_rows(workbook[sheet])))
+        pd.testing.assert_frame_equal(frame, pd.read_excel(self.xlsx_file, sheet_name=sheet))
+        for skiprows in [1, 3]:
+          frame = rows_to_frame(list(iter_sheet_rows(workbook[sheet])), skiprows=skiprows)
+          pd.testing.assert_frame_equal(frame, pd.read_excel(self.xlsx_file, sheet_name=sheet, skiprows=skiprows))
+    finally:
+      workbook.close()
+
+  def test_hysys_sheets_read_to_capacity_row(self):
+    hysys_workbook = HysysWorkbook(self.xlsx_file)
+    # Only the HYSYS sheets are read and the rows below the first 'POWER' row are not
+    self.assertEqual(list(hysys_workbook.sheets), ['Coolers', 'Pumps', 'Heaters'])
+    self.assertEqual(len(hysys_workbook.sheets['Heaters']), 3)
+    # The sheets without a 'POWER' row are read to their end
+    for sheet in ['Pumps', 'Coolers']:
+      pd.testing.assert_frame_equal(hysys_workbook.sheets[sheet], pd.read_excel(self.xlsx_file, sheet_name=sheet))
+    self.assertEqual(hysys_workbook.component_headers('Pumps'), ['P-100', 'P-101', 'P-100.1', 'P-102'])
+    # The capacities are the same as the ones read by pandas from the whole sheet
+    pumps = pd.read_excel(self.xlsx_file, sheet_name='Pumps')
+    for header in ['P-100', 'P-101', 'P-100.1', 'P-102']:
+      power, power_unit = hysys_workbook.component_capacity(header)
+      expected = pumps[header].values[2]
+      self.assertEqual(type(power), type(expected))
+      if pd.isna(expected):
+        self.assertTrue(pd.isna(power))
+      else:
+        self.assertEqual(power, expected)
+      self.assertEqual(power_unit, 'kW')
+    self.assertEqual(hysys_workbook.component_capacity('E-100'), (12, 'MW'))
+    # The keywords priority (POWER > Power > DUTY > Duty) is the one of the whole sheet
+    self.assertEqual(hysys_workbook.component_capacity('E-101'), (5, 'kW'))
+
+class TestMapFiles(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.apea_folder = os.path.join(self.folder, "APEA_outputs")
+    os.makedirs(self.apea_folder)
+    # The files are listed in the order of their names, whatever the order in which they are written
+    for file_name, names in [('c.xlsx', ['C-1']), ('a.xlsx', ['A-1', 'A-2']), ('b.xlsx', ['B-1']), ('~$a.xlsx', ['X-1'])]:
+      write_apea_file(os.path.join(self.apea_folder, file_name), names)
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_order_of_results(self):
+    numbers = [0, 1, 2, 3, 4]
+    sequential = map_files(slow_square, numbers)
+    self.assertEqual([result[:2] for result in sequential], [(number, number ** 2) for number in numbers])
+    parallel = map_files(slow_square, numbers, workers=3)
+    # The results are in the order of the inputs although the last inputs are done first
+    self.assertEqual([result[:2] for result in parallel], [result[:2] for result in sequential])
+    self.assertNotIn(os.getpid(), [result[2] for result in parallel])
+
+  def test_parallel_extraction(self):
+    sequential = extract_all_apea_components(self.apea_folder, persist=False)[1]
+    self.assertEqual([component["Component Name"] for component in sequential], ['A-1', 'A-2', 'B-1', 'C-1'])
+    parallel = extract_all_apea_components(self.apea_folder, workers=2, persist=False)[1]
+    self.assertEqual(parallel, sequential)
+
+class TestComponentsCache(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.apea_folder = os.path.join(self.folder, "APEA_outputs")
+    self.cache_folder = os.path.join(self.folder, "cache")
+    os.makedirs(self.apea_folder)
+    self.xlsx_file = self.apea_folder + "/a.xlsx"
+    write_apea_file(self.xlsx_file, ['A-1', 'A-2'])
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def extract(self):
+    """
+      Extracts the components of the APEA file with the cache, and tells whether the file was parsed
+      @ In, None
+      @ Out, (components, parsed), tuple, the components dictionaries and whether the xlsx file was parsed
+    """
+    with mock.patch.object(apea, 'ApeaWorkbook', wraps=apea.ApeaWorkbook) as workbook:
+      components = extract_apea_components_from_file(self.xlsx_file, self.apea_folder, cache_folder=self.cache_folder,
+                                                     persist=False)[1]
+    return components, workbook.called
+
+  def test_hit_and_miss(self):
+    components, parsed = self.extract()
+    self.assertTrue(parsed)
+    cache_path = cache_file_path(self.cache_folder, self.xlsx_file, "APEA", apea.APEA_PARSER_VERSION)
+    self.assertEqual(os.listdir(self.cache_folder), [os.path.basename(cache_path)])
+    # Same content and same parser version: the components are loaded from the cache
+    cached_components, parsed = self.extract()
+    self.assertFalse(parsed)
+    self.assertEqual(cached_components, components)
+    # Another parser version: the file is parsed again
+    with mock.patch.object(apea, 'APEA_PARSER_VERSION', apea.APEA_PARSER_VERSION + 1):
+      self.assertTrue(self.extract()[1])
+      self.assertFalse(self.extract()[1])
+    # Another content: the file is parsed again and the new components are returned
+    write_apea_file(self.xlsx_file, ['A-1', 'A-3'])
+    components, parsed = self.extract()
+    self.assertTrue(parsed)
+    self.assertEqual([component["Component Name"] for component in components], ['A-1', 'A-3'])
+    self.assertFalse(self.extract()[1])
+
+  def test_corrupted_cache_file(self):
+    components = self.extract()[0]
+    cache_path = cache_file_path(self.cache_folder, self.xlsx_file, "APEA", apea.APEA_PARSER_VERSION)
+    for content in ['{"Source": "a.xlsx", "Compo', '', '[1, 2]', '{"Source": "a.xlsx", "Components": 3}', '\udcff']:
+      with open(cache_path, 'w', errors='surrogateescape') as cache_file:
+        cache_file.write(content)
+      # The corrupted cache file is ignored and replaced
+      self.assertEqual(self.extract(), (components, True))
+      self.assertEqual(self.extract(), (components, False))
+
+# This is not needed for running tests through FORCE/run_tests
+# It does allow tests to be run via the unit tester when test_aspen_utils is run directly
+if __name__ == '__main__':
+  unittest.main()
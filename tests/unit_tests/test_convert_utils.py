@@ -0,0 +1,82 @@
+import io
+import os
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.src.convert_utils import prettify, write_pretty
+
+class TestWritePretty(unittest.TestCase):
+
+  def setUp(self):
+    self.heron_xml = """<HERON>
+                          <Case name="case">
+                            <label>a &amp; b</label>
+                            <empty/>
+                          </Case>
+                          <Components>
+                            <Component name="Comp&quot;0">
+                              text<economics/>
+                            </Component>
+                          </Components>
+                        </HERON>"""
+    self.tree = ET.ElementTree(ET.fromstring(self.heron_xml))
+    self.tree.find('./Components/Component').append(ET.Comment(" imported "))
+
+  def test_pretty_output(self):
+    expected = ('<?xml version="1.0" ?>\n'
+                '<HERON>\n'
+                '  <Case name="case">\n'
+                '    <label>a &amp; b</label>\n'
+                '    <empty/>\n'
+                '  </Case>\n'
+                '\n\n'
+                '  <Components>\n'
+                '    <Component name="Comp&quot;0">\n'
+                '                              text\n' # the text is not re-indented
+                '      <economics/>\n'
+                '      <!-- imported -->\n'
+                '    </Component>\n'
+                '\n'
+                '  </Components>\n'
+                '\n\n'
+                '</HERON>\n')
+    self.assertEqual(prettify(self.tree), expected)
+
+  def test_write_to_handle(self):
+    handle = io.StringIO()
+    write_pretty(self.tree, handle)
+    self.assertEqual(handle.getvalue(), prettify(self.tree))
+    # The root element can be written too
+    handle = io.StringIO()
+    write_pretty(self.tree.getroot(), handle)
+    self.assertEqual(handle.getvalue(), prettify(self.tree))
+
+  def test_namespaces(self):
+    # The namespaces are written with prefixes and declared on the root, as in the previous (ET.tostring) implementation
+    tree = ET.ElementTree(ET.fromstring('<a:HERON xmlns:a="urn:heron" xmlns:b="urn:other" name="x" b:unit="MW">'
+                                        '<Case><b:label>v</b:label></Case>'
+                                        '<a:Components><a:Component xml:lang="en" name="c"/></a:Components>'
+                                        '</a:HERON>'))
+    expected = ('<?xml version="1.0" ?>\n'
+                '<ns0:HERON xmlns:ns0="urn:heron" xmlns:ns1="urn:other" name="x" ns1:unit="MW">\n'
+                '  <Case>\n'
+                '    <ns1:label>v</ns1:label>\n'
+                '  </Case>\n'
+                '\n\n'
+                '  <ns0:Components>\n'
+                '    <ns0:Component xml:lang="en" name="c"/>\n'
+                '  </ns0:Components>\n'
+                '\n\n'
+                '</ns0:HERON>\n')
+    self.assertEqual(prettify(tree), expected)
+    # The output can be parsed back to the same tree
+    parsed = ET.fromstring(expected.encode())
+    self.assertEqual([(e.tag, e.attrib) for e in parsed.iter()], [(e.tag, e.attrib) for e in tree.getroot().iter()])
+
+# This is not needed for running tests through FORCE/run_tests
+# It does allow tests to be run via the unit tester when test_convert_utils is run directly
+if __name__ == '__main__':
+  unittest.main()
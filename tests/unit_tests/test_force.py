@@ -0,0 +1,394 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import importlib.util
+import xml.etree.ElementTree as ET
+import numpy as np
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.src import force
+from FORCE.src.force import ComponentCatalog, ForceComponentSet, fit_cost_functions, plot_cost_function
+from FORCE.src.force import create_all_force_components_from_hysys_apea
+from FORCE.src.force import components_to_table, table_to_components, write_force_components_table, read_force_components_table
+from FORCE.src.force import fit_cost_drivers, fit_multi_driver_cost_function, extract_all_force_componentsets
+from FORCE.src.aspen_utils import read_components_jsonl, write_components_jsonl
+from FORCE.src.heron import add_cost_function_to_cashflow, DRIVER_NOTE_COMMENT
+
+def make_force_component(name, category, power, power_units, installed_cost, source="test.xlsx", weights=None):
+  """
+    Creates a FORCE component dictionary similar to the ones created by create_all_force_components_from_hysys_apea
+    @ In, name, str, the component name
+    @ In, category, str, the HYSYS category
+    @ In, power, float or str, the HYSYS power
+    @ In, power_units, str, the HYSYS power units
+    @ In, installed_cost, float, the APEA installed cost
+    @ In, source, str, optional, the name of the xlsx file of the component
+    @ In, weights, dict, optional, the APEA weights (e.g. {"Equipment Weight [LBS]": 500})
+    @ Out, force_dict, dict, the FORCE component dictionary
+  """
+  return {"Component Name": name,
+          "Component ID": name + "_from_" + source,
+          "APEA": dict({"Installed Cost [USD]": installed_cost}, **(weights or {})),
+          "HYSYS": {"Category": category, "Power": power, "Power Units": power_units}}
+
+class TestFitCostFunctions(unittest.TestCase):
+
+  def setUp(self):
+    self.capacity_ratios = [np.array([0.1, 0.25, 0.5, 1.0]),
+                            np.array([0.2, 0.4, 0.6, 0.8, 1.0])]
+    self.costs = [2000 * self.capacity_ratios[0] ** 0.6,
+                  5e5 * self.capacity_ratios[1] ** 0.8]
+
+  def test_closed_form_recovers_power_law(self):
+    fits = fit_cost_functions(self.capacity_ratios, self.costs, refine=False)
+    self.assertEqual(len(fits), 2)
+    self.assertAlmostEqual(fits[0]["Reference Price"], 2000, places=6)
+    self.assertAlmostEqual(fits[0]["Scaling Factor"], 0.6, places=10)
+    self.assertAlmostEqual(fits[1]["Reference Price"], 5e5, places=4)
+    self.assertAlmostEqual(fits[1]["Scaling Factor"], 0.8, places=10)
+    self.assertAlmostEqual(fits[0]["MAPE (%)"], 0, places=8)
+    self.assertFalse(fits[0]["Refined"])
+
+  def test_batched_fit_matches_individual_fits(self):
+    noisy_costs = [costs * np.array([1.05, 0.97, 1.02, 0.99, 1.01][:len(costs)]) for costs in self.costs]
+    batched = fit_cost_functions(self.capacity_ratios, noisy_costs)
+    for i in range(2):
+      individual = fit_cost_functions([self.capacity_ratios[i]], [noisy_costs[i]])[0]
+      self.assertTrue(batched[i]["Refined"])
+      self.assertAlmostEqual(batched[i]["Reference Price"], individual["Reference Price"], places=6)
+      self.assertAlmostEqual(batched[i]["Scaling Factor"], individual["Scaling Factor"], places=10)
+      # The fitted coefficients are inside their confidence intervals
+      lower, upper = batched[i]["Scaling Factor Confidence Interval"]
+      self.assertTrue(lower <= batched[i]["Scaling Factor"] <= upper)
+
+  def test_too_few_components(self):
+    fits = fit_cost_functions([np.array([1.0]), np.array([0.5, 1.0])], [np.array([100.0]), np.array([50.0, 100.0])])
+    # A single capacity cannot give a scaling factor: a linear scaling is assumed
+    self.assertEqual(fits[0]["Scaling Factor"], 1.0)
+    self.assertAlmostEqual(fits[0]["Reference Price"], 100.0)
+    # Two components give an exact fit but no confidence interval
+    self.assertAlmostEqual(fits[1]["Scaling Factor"], 1.0)
+    self.assertIsNone(fits[1]["Scaling Factor Confidence Interval"])
+
+class TestComponentSetFiltering(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.components = [make_force_component("P1", "Pumps", 100, "kW", 1000),
+                       make_force_component("P2", "Pumps", 0.4, "MW", 2500),
+                       make_force_component("P3", "Pumps", 1000, "kW", 7000),
+                       make_force_component("P4", "Pumps", "unknown", "unknown", 3000),
+                       make_force_component("P5", "Pumps", 50, "kW", 0),
+                       make_force_component("T1", "Expanders", 10, "MW", 1e6)]
+    self.setfile = os.path.join(self.folder, "Setfile_pumps.txt")
+    with open(self.setfile, 'w') as setfile:
+      json.dump({"Set Name": "pumps", "Included Categories": ["Pumps"]}, setfile)
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_catalog_indices(self):
+    catalog = ComponentCatalog(self.components)
+    self.assertEqual(len(catalog), 6)
+    self.assertEqual(catalog.category_indices("Pumps"), [0, 1, 2, 3, 4])
+    self.assertEqual(catalog.name_indices("T1"), [5])
+    self.assertEqual(catalog.name_indices("missing"), [])
+    self.assertTrue(np.isnan(catalog.powers[3]))
+
+  def test_excluded_components_and_units(self):
+    component_set = ForceComponentSet(self.setfile, self.components).prepare()
+    self.assertEqual(component_set.updated_components_set, ["P1", "P2", "P3"])
+    self.assertEqual(component_set.common_unit, "kW")
+    np.testing.assert_allclose(component_set.updated_powers_same_unit, [100, 400, 1000])
+    excluded = {comp["Component Name"]: comp["Reasons"] for comp in component_set.excluded_components}
+    self.assertEqual(sorted(excluded), ["P4", "P5"])
+    self.assertEqual(len(excluded["P4"]), 2)  # unknown power and unknown unit
+    self.assertEqual(excluded["P5"], ["unknown or non-positive cost"])
+
+  def test_deferred_plot(self):
+    component_set = ForceComponentSet(self.setfile, self.components)
+    component_set.component_set_info(plot=False)
+    png_file = os.path.join(self.folder, "Setfile_pumps.png")
+    self.assertFalse(os.path.exists(png_file))
+    self.assertEqual(component_set.plot_data["Output File"], png_file)
+    self.assertEqual(plot_cost_function(component_set.plot_data), png_file)
+    self.assertTrue(os.path.exists(png_file))
+
+  def test_plot_pool_shutdown(self):
+    with open(os.path.join(self.folder, "Setfile_turbines.txt"), 'w') as setfile:
+      json.dump({"Set Name": "turbines", "Included Categories": ["Expanders"]}, setfile)
+    with mock.patch.object(force, 'ProcessPoolExecutor') as executor_class:
+      executor = executor_class.return_value
+      executor.submit.return_value.result.return_value = "plot.png"
+      extract_all_force_componentsets(self.folder + "/", self.components, plot_workers=2)
+      self.assertEqual(executor.submit.call_count, 2)
+      executor.shutdown.assert_called_once()
+      # The pool is shut down when a component set fails
+      executor.reset_mock()
+      component_set_info = ForceComponentSet.component_set_info
+      def failing_info(component_set, **kwargs):
+        if component_set.set_name == "turbines":
+          raise RuntimeError("The component set cannot be fitted")
+        return component_set_info(component_set, **kwargs)
+      with mock.patch.object(ForceComponentSet, 'component_set_info', failing_info):
+        with self.assertRaises(RuntimeError):
+          extract_all_force_componentsets(self.folder + "/", self.components, plot_workers=2)
+      self.assertEqual(executor.submit.call_count, 1)
+      executor.shutdown.assert_called_once()
+
+class TestCostDrivers(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    # The installed cost follows a power law of the equipment weight (not of the power)
+    powers = [100, 300, 200, 800, 500, 1000]
+    equipment_weights = [1000, 2000, 4000, 5000, 8000, 10000]
+    installed_weights = [3000, 5000, 9000, 16000, 17000, 25000]
+    self.components = [make_force_component(f"P{i}", "Pumps", power, "kW", 5e4 * (weight / 10000) ** 0.7,
+                                            weights={"Equipment Weight [LBS]": weight, "Total Installed Weight [LBS]": installed_weight})
+                       for i, (power, weight, installed_weight) in enumerate(zip(powers, equipment_weights, installed_weights))]
+    self.components.append(make_force_component("P6", "Pumps", 400, "kW", 3e4, weights={"Equipment Weight [LBS]": "NA"}))
+    self.drivers = ["Equipment Weight [LBS]", "Total Installed Weight [LBS]"]
+    self.setfile = os.path.join(self.folder, "Setfile_pumps.txt")
+    with open(self.setfile, 'w') as setfile:
+      json.dump({"Set Name": "pumps", "Included Categories": ["Pumps"]}, setfile)
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_default_driver(self):
+    comp_set_dict = ForceComponentSet(self.setfile, self.components).component_set_info(plot=False)
+    # Only the power is used by default: the component without weights is included and no driver keys are added
+    self.assertEqual(len(comp_set_dict["Included components"]), 7)
+    for key in ["Cost Driver", "Cost Drivers Ranking", "Multi-Driver Cost Function"]:
+      self.assertNotIn(key, comp_set_dict)
+    with self.assertRaises(ValueError):
+      ForceComponentSet(self.setfile, self.components, drivers=["Volume"])
+    # The power cost function is exported to HERON in MW
+    self.assertEqual(comp_set_dict["Reference Driver Units"], "kW")
+    cash_node = ET.Element("CashFlow")
+    add_cost_function_to_cashflow(cash_node, comp_set_dict)
+    self.assertEqual(cash_node.find("reference_driver/fixed_value").text, "1.0")
+
+  def test_best_driver(self):
+    component_set = ForceComponentSet(self.setfile, self.components, drivers=self.drivers)
+    comp_set_dict = component_set.component_set_info(plot=False)
+    excluded = {comp["Component Name"]: comp["Reasons"] for comp in comp_set_dict["Excluded components"]}
+    self.assertEqual(excluded, {"P6": ["unknown or non-positive Equipment Weight [LBS]", "unknown or non-positive Total Installed Weight [LBS]"]})
+    ranking = [driver_fit["Cost Driver"] for driver_fit in comp_set_dict["Cost Drivers Ranking"]]
+    self.assertEqual(ranking[0], "Equipment Weight [LBS]")
+    self.assertEqual(sorted(ranking), sorted(["Power"] + self.drivers))
+    self.assertEqual(comp_set_dict["Cost Driver"], "Equipment Weight [LBS]")
+    self.assertEqual(comp_set_dict["Reference Driver"], 10000)
+    self.assertEqual(comp_set_dict["Reference Driver Units"], "LBS")
+    self.assertAlmostEqual(comp_set_dict["Scaling Factor"], 0.7, places=5)
+    self.assertAlmostEqual(comp_set_dict["Reference Price (USD)"], 5e4, places=2)
+    self.assertEqual(component_set.plot_data["Cost Driver"], "Equipment Weight [LBS]")
+    # The batched fits give the same component set
+    drivers_fits = fit_cost_drivers([component_set.drivers_ratios], [component_set.updated_costs])[0]
+    self.assertEqual(list(drivers_fits), ["Power"] + self.drivers)
+    self.assertEqual(extract_all_force_componentsets(self.folder + "/", self.components, plot=False, drivers=self.drivers)[0], comp_set_dict)
+
+  def test_power_fit_with_several_drivers(self):
+    component_set = ForceComponentSet(self.setfile, self.components, drivers=self.drivers).prepare()
+    # The given fit is the power fit: it is ranked with the other drivers (here it is the best one) instead of being ignored
+    power_fit = dict(fit_cost_functions([component_set.drivers_ratios["Power"]], [component_set.updated_costs])[0],
+                     **{"Reference Price": 1234.5, "Scaling Factor": 0.42, "MAPE (%)": 0.0})
+    comp_set_dict = component_set.component_set_info(fit=power_fit, plot=False)
+    self.assertEqual(comp_set_dict["Cost Driver"], "Power")
+    self.assertEqual(comp_set_dict["Reference Price (USD)"], 1234.5)
+    self.assertEqual(comp_set_dict["Scaling Factor"], 0.42)
+    self.assertEqual(comp_set_dict["Cost Drivers Ranking"][0]["Reference Price (USD)"], 1234.5)
+    self.assertEqual(sorted(driver_fit["Cost Driver"] for driver_fit in comp_set_dict["Cost Drivers Ranking"]), sorted(["Power"] + self.drivers))
+    # The given fit also replaces the power fit of the given drivers fits
+    drivers_fits = fit_cost_drivers([component_set.drivers_ratios], [component_set.updated_costs])[0]
+    self.assertEqual(component_set.component_set_info(fit=power_fit, drivers_fits=drivers_fits, plot=False), comp_set_dict)
+
+  def test_multi_driver_fit(self):
+    drivers_ratios = {"A": np.array([0.1, 0.5, 0.3, 1.0, 0.7]), "B": np.array([0.6, 0.2, 1.0, 0.4, 0.9])}
+    costs = 300 * drivers_ratios["A"] ** 0.6 * drivers_ratios["B"] ** 0.3
+    fit = fit_multi_driver_cost_function(drivers_ratios, costs)
+    self.assertAlmostEqual(fit["Reference Price"], 300, places=6)
+    np.testing.assert_allclose(fit["Scaling Factors"], [0.6, 0.3])
+    self.assertAlmostEqual(fit["MAPE (%)"], 0, places=8)
+
+  def test_heron_power_fit(self):
+    comp_set_dict = ForceComponentSet(self.setfile, self.components, drivers=self.drivers).component_set_info(plot=False)
+    power_fit = [fit for fit in comp_set_dict["Cost Drivers Ranking"] if fit["Cost Driver"] == "Power"][0]
+    cash_node = ET.Element("CashFlow")
+    add_cost_function_to_cashflow(cash_node, comp_set_dict)
+    # The weight is the best driver but only the power cost function (in MW) is exported to HERON
+    self.assertEqual(cash_node.find("reference_driver/fixed_value").text, "1.0")
+    self.assertEqual(cash_node.find("reference_price/fixed_value").text, str(-power_fit["Reference Price (USD)"]))
+    self.assertEqual(cash_node.find("scaling_factor_x/fixed_value").text, str(power_fit["Scaling Factor"]))
+    comments = [node.text for node in cash_node.iter(ET.Comment)]
+    self.assertIn("Units : MW", comments)
+    self.assertIn(f"{DRIVER_NOTE_COMMENT} the Equipment Weight [LBS] fits the costs better "
+                  f"(fitting error {comp_set_dict['Fitting Average Error (%)']} %)", comments)
+    # A componentSet without a power cost function cannot be exported
+    comp_set_dict["Cost Drivers Ranking"] = comp_set_dict["Cost Drivers Ranking"][:1]
+    with self.assertRaises(ValueError):
+      add_cost_function_to_cashflow(ET.Element("CashFlow"), comp_set_dict)
+
+def merge_per_component_id(list_of_lists_of_comps):
+  """
+    Merges the components of several codes as the FORCE module did before the single pass join
+    (the flat list of all the components is scanned once per "Component ID")
+    @ In, list_of_lists_of_comps, list, the lists of the components dictionaries of each code
+    @ Out, merged, dict, the merged dictionary of each "Component ID"
+  """
+  flat_list = [comp for comps in list_of_lists_of_comps for comp in comps]
+  merged = {}
+  for comp_id in set(comp.get("Component ID") for comp in flat_list):
+    merged[comp_id] = {}
+    for comp in flat_list:
+      if comp.get("Component ID") == comp_id:
+        merged[comp_id].update(comp)
+  return merged
+
+class TestForceComponentsMerge(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.hysys_folder = os.path.join(self.folder, "HYSYS_outputs")
+    hysys = lambda name, power: {"Component Name": name, "Component ID": name + "_from_a.xlsx", "HYSYS Source": "a.xlsx",
+                                 "HYSYS Category": "Pumps", "HYSYS Power": power, "HYSYS Power Units": "kW"}
+    apea = lambda name, cost: {"Component Name": name, "Component ID": name + "_from_a.xlsx", "APEA_Source": "a.xlsx",
+                               "APEA Equipment Cost [USD]": cost / 2, "APEA Installed Cost [USD]": cost,
+                               "APEA Equipment Weight [LBS]": 10.0, "APEA Total Installed Weight [LBS]": 20.0}
+    # Components found by both codes, by one code only, and twice by the same code (the last one is used)
+    self.hysys_comps = [hysys("P1", 100.0), hysys("T 1", 10.0), hysys("X1", 5.0), hysys("P1", 150.0)]
+    self.apea_comps = [apea("T 1", 3000.0), apea("A1", 10.0), apea("P1", 1000.0)]
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_same_components_as_per_id_merge(self):
+    force_comps, force_outputs_path = create_all_force_components_from_hysys_apea([self.hysys_comps, self.apea_comps],
+                                                                                  self.hysys_folder)
+    # The components are in the order in which they are first found
+    self.assertEqual([comp["Component ID"] for comp in force_comps],
+                     ["P1_from_a.xlsx", "T 1_from_a.xlsx", "X1_from_a.xlsx", "A1_from_a.xlsx"])
+    merged = merge_per_component_id([self.hysys_comps, self.apea_comps])
+    for comp in force_comps:
+      expected = merged[comp["Component ID"]]
+      self.assertEqual(comp["Sources"], str(expected.get("HYSYS Source")) + "  &  " + str(expected.get("APEA_Source")))
+      self.assertEqual("HYSYS" in comp, "HYSYS Power" in expected)
+      self.assertEqual("APEA" in comp, "APEA_Source" in expected)
+      if "HYSYS" in comp:
+        self.assertEqual(comp["HYSYS"], {"Category": expected["HYSYS Category"], "Power": expected["HYSYS Power"],
+                                         "Power Units": expected["HYSYS Power Units"]})
+      if "APEA" in comp:
+        self.assertEqual(comp["APEA"]["Installed Cost [USD]"], expected["APEA Installed Cost [USD]"])
+    self.assertEqual(force_comps[0]["HYSYS"]["Power"], 150.0)
+    # One file is written per component, with the merged component
+    self.assertEqual(sorted(os.listdir(force_outputs_path)),
+                     ["A1_from_a.xlsx.txt", "P1_from_a.xlsx.txt", "T1_from_a.xlsx.txt", "X1_from_a.xlsx.txt"])
+    for comp in force_comps:
+      with open(force_outputs_path + comp["Component ID"].replace(" ", "") + ".txt") as comp_file:
+        self.assertEqual(json.load(comp_file), comp)
+
+  def test_jsonl_numpy_values(self):
+    # The values read from the xlsx files may be numpy scalars
+    comps = [{"Component Name": "P1", "HYSYS Power": np.float64(1.5), "Count": np.int64(3)}, {"Component Name": "P2"}]
+    jsonl_file = os.path.join(self.folder, "comps", "HYSYS_comps.jsonl")
+    write_components_jsonl(jsonl_file, comps)
+    self.assertEqual(read_components_jsonl(jsonl_file), [{"Component Name": "P1", "HYSYS Power": 1.5, "Count": 3},
+                                                         {"Component Name": "P2"}])
+    self.assertEqual(os.listdir(os.path.dirname(jsonl_file)), ["HYSYS_comps.jsonl"])
+
+class TestForceComponentsPersistence(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.hysys_folder = os.path.join(self.folder, "HYSYS_outputs")
+    self.hysys_comps = [{"Component Name": "P1", "Component ID": "P1_from_a.xlsx", "HYSYS Source": "a.xlsx",
+                         "HYSYS Category": "Pumps", "HYSYS Power": 100, "HYSYS Power Units": "kW"}]
+    self.apea_comps = [{"Component Name": "P1", "Component ID": "P1_from_a.xlsx", "APEA_Source": "a.xlsx",
+                        "APEA Installed Cost [USD]": 1000}]
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_in_memory(self):
+    force_comps, force_outputs_path = create_all_force_components_from_hysys_apea([self.hysys_comps, self.apea_comps],
+                                                                                  self.hysys_folder, persist=False)
+    self.assertIsNone(force_outputs_path)
+    self.assertEqual(os.listdir(self.folder), [])
+    self.assertEqual(force_comps[0]["HYSYS"]["Power"], 100)
+    self.assertEqual(force_comps[0]["APEA"]["Installed Cost [USD]"], 1000)
+
+  def test_jsonl_artifact(self):
+    jsonl_file = os.path.join(self.folder, "FORCE_Components.jsonl")
+    force_comps = create_all_force_components_from_hysys_apea([self.hysys_comps, self.apea_comps],
+                                                              self.hysys_folder, persist=False, jsonl_file=jsonl_file)[0]
+    # Only the consolidated file is written
+    self.assertEqual(os.listdir(self.folder), ["FORCE_Components.jsonl"])
+    self.assertEqual(read_components_jsonl(jsonl_file), force_comps)
+
+class TestForceComponentsTable(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.components = [make_force_component("P1", "Pumps", 100, "kW", 1000),
+                       make_force_component("P2", "Pumps", 0.4, "MW", 2500),
+                       make_force_component("P3", "Pumps", 1000, "kW", 7000),
+                       make_force_component("NA", "Pumps", "unknown", "unknown", 3000),
+                       make_force_component("T1", "Expanders", 10, "MW", 1e6),
+                       {"Component Name": "A1", "Component ID": "A1_from_test.xlsx", "APEA": {"Installed Cost [USD]": 10}}]
+    self.setfile = os.path.join(self.folder, "Setfile_pumps.txt")
+    with open(self.setfile, 'w') as setfile:
+      json.dump({"Set Name": "pumps", "Included Categories": ["Pumps"]}, setfile)
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_csv_round_trip(self):
+    table_file = os.path.join(self.folder, "FORCE_Components.csv")
+    write_force_components_table(table_file, self.components)
+    table = read_force_components_table(table_file)
+    self.assertEqual(list(table["Component Name"]), ["P1", "P2", "P3", "NA", "T1", "A1"])
+    self.assertTrue(np.isnan(table["HYSYS Power"][3]))
+    components = table_to_components(table)
+    # The component without HYSYS information has no HYSYS mini dictionary and the unknown power is kept
+    self.assertNotIn("HYSYS", components[5])
+    self.assertEqual(components[3]["HYSYS"]["Power"], "unknown")
+    self.assertEqual(components[1]["HYSYS"], self.components[1]["HYSYS"])
+    self.assertEqual(components[4]["APEA"]["Installed Cost [USD]"], 1e6)
+
+  def test_catalog_from_table(self):
+    catalog = ComponentCatalog(self.components)
+    table_catalog = ComponentCatalog.from_table(components_to_table(self.components))
+    self.assertEqual(len(table_catalog), 5)
+    for column in ["names", "ids", "categories", "power_units"]:
+      self.assertEqual(list(getattr(table_catalog, column)), list(getattr(catalog, column)))
+    np.testing.assert_array_equal(table_catalog.powers, catalog.powers)
+    np.testing.assert_array_equal(table_catalog.installed_costs, catalog.installed_costs)
+    self.assertEqual(table_catalog.category_index, catalog.category_index)
+    # The component set is the same whether it is created from the dictionaries or from the table
+    info = ForceComponentSet(self.setfile, self.components).component_set_info(plot=False)
+    table_info = ForceComponentSet(self.setfile, components_to_table(self.components)).component_set_info(plot=False)
+    self.assertEqual(table_info, info)
+
+  def test_table_formats(self):
+    with self.assertRaises(ValueError):
+      write_force_components_table(os.path.join(self.folder, "FORCE_Components.xlsx"), self.components)
+    parquet_file = os.path.join(self.folder, "FORCE_Components.parquet")
+    if importlib.util.find_spec("pyarrow") is None and importlib.util.find_spec("fastparquet") is None:
+      with self.assertRaises(ImportError):
+        write_force_components_table(parquet_file, self.components)
+      self.assertEqual(os.listdir(self.folder), ["Setfile_pumps.txt"])
+    else:
+      write_force_components_table(parquet_file, self.components)
+      self.assertEqual(table_to_components(read_force_components_table(parquet_file)),
+                       table_to_components(components_to_table(self.components)))
+
+# This is not needed for running tests through FORCE/run_tests
+# It does allow tests to be run via the unit tester when test_force is run directly
+if __name__ == '__main__':
+  unittest.main()
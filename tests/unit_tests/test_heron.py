@@ -1,12 +1,16 @@
 import os
 import sys
+import json
+import shutil
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch, call, MagicMock
 import xml.etree.ElementTree as ET
 
 FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
 sys.path.append(FORCE_LOC)
-from FORCE.src.heron import create_componentsets_in_HERON
+from FORCE.src.heron import create_componentsets_in_HERON, update_HERON_tree, create_componentsets_in_many_HERON_files
+from FORCE.src.heron import update_HERON_file, parse_HERON_file, FINGERPRINT_COMMENT, DRIVER_NOTE_COMMENT
 
 class HERONTestCase(unittest.TestCase):
   """
@@ -667,6 +671,183 @@ class TestCompSetsFolderMultFiles(HERONTestCase):
           # Verify file was not opened
           self.assertNotIn(call('/fake/folder/'+file), mock_open.call_args_list)
 
+class TestManyCompSets(HERONTestCase):
+
+  def setUp(self):
+    # Many components, some of them without economics node, in two Components nodes
+    components = "".join(f"""<Component name="Component{i}">
+                               <economics>
+                                 <CashFlow name="Component{i}_capex">
+                                   <reference_price><fixed_value>1</fixed_value></reference_price>
+                                 </CashFlow>
+                               </economics>
+                             </Component>""" if i % 2 else f"""<Component name="Component{i}"></Component>"""
+                             for i in range(200))
+    self.heron_xml = f"""<HERON>
+                           <Components>{components}</Components>
+                           <Components><Component name="OtherComponent"></Component></Components>
+                         </HERON>"""
+    self.tree = ET.ElementTree(ET.fromstring(self.heron_xml))
+
+  def make_comp_set(self, name, ref_price):
+    return (f"/fake/folder/componentSet_{name}.json",
+            {"Component Set Name": name,
+             "Reference Driver": 1000,
+             "Reference Driver Power Units": "kW",
+             "Reference Price (USD)": ref_price,
+             "Scaling Factor": 0.5})
+
+  def test_many_comp_sets(self):
+    comp_sets = [self.make_comp_set(f"Component{i}", 100 + i) for i in range(200)]
+    comp_sets += [self.make_comp_set("OtherComponent", 5), self.make_comp_set("NewComponent", 6)]
+    # The same componentSet applied twice updates the component only once
+    comp_sets += [self.make_comp_set("NewComponent", 7), self.make_comp_set("Component1", 8)]
+    result_tree = update_HERON_tree(self.tree, comp_sets)
+
+    components_nodes = result_tree.findall("./Components")
+    self.assertEqual(len(components_nodes[0].findall("./Component")), 201)
+    self.assertEqual(len(components_nodes[1].findall("./Component")), 1)
+    for i in range(200):
+      cashflows = result_tree.findall(f'./Components/Component[@name="Component{i}"]/economics/CashFlow')
+      self.assertEqual(len(cashflows), 1)
+      self.check_reference_driver(cashflows[0], '1.0')
+      self.check_reference_price(cashflows[0], '-8' if i == 1 else f'-{100 + i}')
+      self.check_scaling_factor(cashflows[0], '0.5')
+    # Components of the second Components node are found as well
+    other = result_tree.findall('./Components/Component[@name="OtherComponent"]/economics/CashFlow')
+    self.check_reference_price(other[0], '-5')
+    new = result_tree.findall('./Components/Component[@name="NewComponent"]')
+    self.assertEqual(len(new), 1)
+    self.check_reference_price(new[0].find('./economics/CashFlow'), '-7')
+
+class TestManyHERONFiles(HERONTestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.comp_sets_folder = os.path.join(self.folder, "Sets")
+    os.makedirs(self.comp_sets_folder)
+    with open(os.path.join(self.comp_sets_folder, "componentSet_pumps.txt"), 'w') as comp_set_file:
+      json.dump({"Component Set Name": "pumps",
+                 "Reference Driver": 1000,
+                 "Reference Driver Power Units": "kW",
+                 "Reference Price (USD)": 2000,
+                 "Scaling Factor": 0.5}, comp_set_file)
+    self.heron_xmls = []
+    for case in ["sweep", "opt"]:
+      os.makedirs(os.path.join(self.folder, case))
+      heron_xml = os.path.join(self.folder, case, f"heron_{case}.xml")
+      with open(heron_xml, 'w') as heron_file:
+        heron_file.write(f"""<HERON><Case name="{case}"/><Components><Component name="pumps"/></Components></HERON>""")
+      self.heron_xmls.append(heron_xml)
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_many_heron_files(self):
+    output_files = create_componentsets_in_many_HERON_files(self.comp_sets_folder, self.heron_xmls)
+    for case, heron_xml, output_file in zip(["sweep", "opt"], self.heron_xmls, output_files):
+      # The updated files are next to the original files
+      self.assertEqual(output_file, os.path.join(os.path.dirname(heron_xml), "new_" + os.path.basename(heron_xml)))
+      result_tree = ET.parse(output_file)
+      self.assertEqual(result_tree.find('./Case').attrib['name'], case)
+      cashflows = result_tree.findall('./Components/Component[@name="pumps"]/economics/CashFlow')
+      self.assertEqual(len(cashflows), 1)
+      self.check_reference_driver(cashflows[0], '1.0')
+      self.check_reference_price(cashflows[0], '-2000')
+
+  def test_output_folder(self):
+    output_folder = os.path.join(self.folder, "updated")
+    create_componentsets_in_many_HERON_files(self.comp_sets_folder, self.heron_xmls, output_folder=output_folder)
+    self.assertEqual(sorted(os.listdir(output_folder)), ["new_heron_opt.xml", "new_heron_sweep.xml"])
+    # Files with the same name cannot be written to the same output folder
+    with self.assertRaises(ValueError):
+      create_componentsets_in_many_HERON_files(self.comp_sets_folder, self.heron_xmls + self.heron_xmls[:1], output_folder=output_folder)
+
+class TestIncrementalUpdate(HERONTestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.heron_xml = os.path.join(self.folder, "heron_input.xml")
+    with open(self.heron_xml, 'w') as heron_file:
+      heron_file.write("""<HERON>
+                            <!-- A user comment -->
+                            <Components>
+                              <Component name="pumps">
+                                <economics>
+                                  <CashFlow name="pumps_capex"/>
+                                </economics>
+                              </Component>
+                            </Components>
+                          </HERON>""")
+    self.comp_sets = [("Sets/componentSet_pumps.txt",
+                       {"Component Set Name": "pumps", "Reference Driver": 1000, "Reference Driver Power Units": "kW",
+                        "Reference Price (USD)": 2000, "Scaling Factor": 0.5}),
+                      ("Sets/componentSet_turbines.txt",
+                       {"Component Set Name": "turbines", "Reference Driver": 10, "Reference Driver Power Units": "MW",
+                        "Reference Price (USD)": 5000, "Scaling Factor": 0.7})]
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def count_comments(self, node, text):
+    return len([e for e in node.iter() if e.tag is ET.Comment and text in e.text])
+
+  def test_rerun_is_idempotent(self):
+    first_file = update_HERON_file(self.heron_xml, self.comp_sets, os.path.join(self.folder, "first.xml"))
+    second_file = update_HERON_file(first_file, self.comp_sets, os.path.join(self.folder, "second.xml"))
+    with open(first_file) as first, open(second_file) as second:
+      self.assertEqual(first.read(), second.read())
+    tree = ET.parse(second_file, parser=ET.XMLParser(target=ET.TreeBuilder(insert_comments=True)))
+    self.assertEqual(self.count_comments(tree.getroot(), FINGERPRINT_COMMENT), 2)
+    # The comments of the user are not transferred (as before)
+    self.assertEqual(self.count_comments(tree.getroot(), "A user comment"), 0)
+
+  def test_only_changed_sets_are_updated(self):
+    first_file = update_HERON_file(self.heron_xml, self.comp_sets, os.path.join(self.folder, "first.xml"))
+    self.comp_sets[0][1]["Scaling Factor"] = 0.6
+    second_file = update_HERON_file(first_file, self.comp_sets, os.path.join(self.folder, "second.xml"))
+    tree = ET.parse(second_file, parser=ET.XMLParser(target=ET.TreeBuilder(insert_comments=True)))
+    pumps = tree.find('./Components/Component[@name="pumps"]')
+    cashflows = pumps.findall('./economics/CashFlow')
+    self.assertEqual(len(cashflows), 1)
+    self.check_scaling_factor(cashflows[0], '0.6')
+    # The generated comments are replaced, not duplicated
+    self.assertEqual(self.count_comments(pumps, FINGERPRINT_COMMENT), 1)
+    self.assertEqual(self.count_comments(pumps, "Some of this component economic info"), 1)
+    self.assertEqual(self.count_comments(pumps, "Some of this component cashFlow info"), 1)
+    # The unchanged set is skipped
+    turbines = tree.find('./Components/Component[@name="turbines"]')
+    self.check_reference_price(turbines.find('./economics/CashFlow'), '-5000')
+    self.assertEqual(self.count_comments(turbines, FINGERPRINT_COMMENT), 1)
+
+  def test_driver_note_is_not_duplicated(self):
+    # A componentSet whose best cost driver is not the power: the power fit is exported with a note
+    pumps = self.comp_sets[0][1]
+    pumps.update({"Cost Driver": "Equipment Weight [LBS]", "Fitting Average Error (%)": 1.5,
+                  "Cost Drivers Ranking": [{"Cost Driver": "Equipment Weight [LBS]", "Fitting Average Error (%)": 1.5},
+                                           {"Cost Driver": "Power", "Reference Driver": 1000, "Reference Driver Units": "kW",
+                                            "Reference Price (USD)": 2000, "Scaling Factor": 0.5, "Fitting Average Error (%)": 4.5}]})
+    first_file = update_HERON_file(self.heron_xml, self.comp_sets, os.path.join(self.folder, "first.xml"))
+    # The note is kept when the updated file is parsed and it is replaced when the same set is applied again
+    tree = parse_HERON_file(first_file)
+    self.assertEqual(self.count_comments(tree.find('./Components/Component[@name="pumps"]'), DRIVER_NOTE_COMMENT), 1)
+    update_HERON_tree(tree, self.comp_sets, incremental=False)
+    second_file = os.path.join(self.folder, "second.xml")
+    tree.write(second_file)
+    tree = parse_HERON_file(second_file)
+    pumps_node = tree.find('./Components/Component[@name="pumps"]')
+    self.check_reference_price(pumps_node.find('./economics/CashFlow'), '-2000')
+    self.assertEqual(self.count_comments(pumps_node, DRIVER_NOTE_COMMENT), 1)
+    self.assertEqual(self.count_comments(tree.find('./Components/Component[@name="turbines"]'), DRIVER_NOTE_COMMENT), 0)
+
+  def test_not_incremental(self):
+    tree = ET.parse(self.heron_xml)
+    update_HERON_tree(tree, self.comp_sets)
+    update_HERON_tree(tree, self.comp_sets, incremental=False)
+    pumps = tree.find('./Components/Component[@name="pumps"]')
+    self.check_reference_price(pumps.find('./economics/CashFlow'), '-2000')
+    self.assertEqual(self.count_comments(pumps, FINGERPRINT_COMMENT), 1)
+
 # This is not needed for running tests through FORCE/run_tests
 # It does allow tests to be run via the unit tester when test_heron is run directly
 if __name__ == '__main__':
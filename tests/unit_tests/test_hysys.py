@@ -0,0 +1,100 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import openpyxl
+import pandas as pd
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.src.hysys import HysysWorkbook, AspenHysysComponent, extract_all_hysys_components, HYSYS_SHEETS
+
+def read_info_per_component(xlsx_file, component_name):
+  """
+    Reads the info of one component as the HYSYS module did before the workbook was read only once
+    (every HYSYS sheet is read again for each component and the last sheet that includes the component is used)
+    @ In, xlsx_file, str, the path of the xlsx file
+    @ In, component_name, str, the component name
+    @ Out, HYSYS_comp_info, dict, the component info
+  """
+  HYSYS_comp_info = None
+  for sheet in HYSYS_SHEETS:
+    df = pd.read_excel(xlsx_file, sheet_name=sheet)
+    if component_name not in list(df.columns.values):
+      continue
+    # The sheets of this test have at most one capacity keyword
+    capacity = list({'POWER', 'Power', 'DUTY', 'Duty'}.intersection(df.iloc[:, 0].values))
+    if len(capacity):
+      power = df.loc[df.iloc[:, 0] == capacity[0], component_name].values[0]
+      power_unit = df.loc[df.iloc[:, 0] == capacity[0], "Unit"].values[0]
+    else:
+      power, power_unit = "unknown", "unknown"
+    HYSYS_comp_info = {"Component Name": component_name,
+                       "HYSYS Category": sheet,
+                       "HYSYS Source": xlsx_file,
+                       "HYSYS Power": power,
+                       "HYSYS Power Units": power_unit,
+                       "Component ID": component_name + "_from_" + xlsx_file.split("/")[-1]}
+  return HYSYS_comp_info
+
+class TestHysysWorkbook(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.hysys_folder = os.path.join(self.folder, "HYSYS_outputs")
+    os.makedirs(self.hysys_folder)
+    self.xlsx_file = self.hysys_folder + "/Output.xlsx"
+    sheets = {'Expanders': [[None, 'Unit', 'K-100'], [None], ['Power', 'kW', 250.5]],
+              'Coolers': [[None, 'Unit', 'E-100', 'E-101'], [None], ['Feed Temperature', 'C', 40.5, 50.5],
+                          ['DUTY', 'MW', 12.25, 3.5]],
+              'Pumps': [[None, 'Unit', 'P-100'], ['POWER', 'kW', 7.5]],
+              'Heaters': [[None, 'Unit', 'E-200'], ['Feed Temperature', 'C', 400.5]],
+              'Tees': [[None, 'Unit', 'TEE-100'], ['Duty', 'kW', 1.5]],
+              'Mixers': [[None, 'Unit', 'TEE-100', 'MIX-100'], ['Duty', 'kW', 2.5, 5.5]],
+              'Heat Exchangers': [[None, 'Unit', 'HX 100'], ['DUTY', 'kW', 900.5]]}
+    workbook = openpyxl.Workbook()
+    workbook.active.title = 'Material Streams'
+    workbook.active.append([None, 'Unit', 'S1'])
+    for sheet, rows in sheets.items():
+      worksheet = workbook.create_sheet(sheet)
+      for row in rows:
+        worksheet.append(row)
+    workbook.save(self.xlsx_file)
+    self.components = ['K-100', 'E-100', 'E-101', 'P-100', 'E-200', 'TEE-100', 'MIX-100', 'HX 100']
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_same_info_as_per_component_reads(self):
+    hysys_workbook = HysysWorkbook(self.xlsx_file)
+    self.assertEqual(list(hysys_workbook.sheets), HYSYS_SHEETS)
+    for component_name in self.components:
+      expected = read_info_per_component(self.xlsx_file, component_name)
+      # With the shared workbook and with the workbook loaded by the component
+      for workbook in [hysys_workbook, None]:
+        info = AspenHysysComponent(self.xlsx_file, component_name, workbook=workbook).component_info()
+        self.assertEqual(info, expected)
+        for key, value in info.items():
+          self.assertIs(type(value), type(expected[key]), key)
+    # A component found in several sheets belongs to the last one and a sheet without capacity row has unknown capacities
+    self.assertEqual(hysys_workbook.component_sheet('TEE-100'), 'Mixers')
+    self.assertEqual(hysys_workbook.component_capacity('E-200'), ("unknown", "unknown"))
+
+  def test_unknown_component(self):
+    with self.assertRaises(KeyError):
+      AspenHysysComponent(self.xlsx_file, 'S1', workbook=HysysWorkbook(self.xlsx_file)).component_info()
+
+  def test_extract_all_components(self):
+    HYSYS_outputs_path, list_of_HYSYS_dicts = extract_all_hysys_components(self.hysys_folder)
+    # The components are listed sheet by sheet (in the order of HYSYS_SHEETS) and header by header
+    self.assertEqual([info["Component Name"] for info in list_of_HYSYS_dicts],
+                     ['K-100', 'E-100', 'E-101', 'P-100', 'E-200', 'TEE-100', 'TEE-100', 'MIX-100', 'HX 100'])
+    self.assertEqual(list_of_HYSYS_dicts, [read_info_per_component(self.xlsx_file, info["Component Name"])
+                                           for info in list_of_HYSYS_dicts])
+    self.assertIn('HX100.txt', os.listdir(HYSYS_outputs_path))
+
+# This is not needed for running tests through FORCE/run_tests
+# It does allow tests to be run via the unit tester when test_hysys is run directly
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.src.pipeline import AspenHeronPipeline
+
+class TestPipelineStages(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.checkpoint_folder = os.path.join(self.folder, "checkpoints")
+    self.pipeline = AspenHeronPipeline("hysys/", "apea/", "sets/", "heron_input.xml",
+                                       checkpoint_folder=self.checkpoint_folder, trace_memory=True)
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  @patch('FORCE.src.pipeline.extract_all_apea_components', return_value=("apea_comps", [{"Component Name": "A"}]))
+  @patch('FORCE.src.pipeline.extract_all_hysys_components', return_value=("hysys_comps", [{"Component Name": "H"}]))
+  @patch('FORCE.src.pipeline.create_all_force_components_from_hysys_apea', return_value=([{"Component Name": "F"}], "force_comps"))
+  def test_checkpoints(self, mock_force, mock_hysys, mock_apea):
+    artifacts = self.pipeline.run(to_stage='force_components')
+    self.assertEqual(list(artifacts), ['extract', 'force_components'])
+    # The artifacts are handed from stage to stage in memory
+    mock_force.assert_called_once_with([[{"Component Name": "H"}], [{"Component Name": "A"}]], "hysys/", persist=True)
+    self.assertEqual(artifacts['force_components'], [{"Component Name": "F"}])
+    with open(os.path.join(self.checkpoint_folder, "force_components.json")) as checkpoint:
+      self.assertEqual(json.load(checkpoint), [{"Component Name": "F"}])
+    # The report includes the time and the memory of each stage
+    self.assertEqual([stage["Stage"] for stage in self.pipeline.report], ['extract', 'force_components'])
+    self.assertIn("Peak Memory (MB)", self.pipeline.report[0])
+
+    # Restarting from a stage uses the checkpoint of the previous stage and does not run the previous stages
+    mock_hysys.reset_mock()
+    mock_force.reset_mock()
+    artifacts = self.pipeline.run(from_stage='force_components', to_stage='force_components')
+    mock_hysys.assert_not_called()
+    mock_force.assert_called_once_with([[{"Component Name": "H"}], [{"Component Name": "A"}]], "hysys/", persist=True)
+
+  @patch('FORCE.src.pipeline.update_HERON_file', return_value="new_heron_input.xml")
+  def test_heron_stage(self, mock_update):
+    sets_folder = os.path.join(self.folder, "sets")
+    os.makedirs(sets_folder)
+    for name in ["pumps", "turbines"]:
+      with open(os.path.join(sets_folder, f"componentSet_{name}.txt"), 'w') as comp_set_file:
+        json.dump({"Component Set Name": name}, comp_set_file)
+    pipeline = AspenHeronPipeline("hysys/", "apea/", sets_folder, "heron_input.xml")
+    # The component sets of the artifact (e.g. read from a checkpoint) are used instead of the componentSet files with the same name
+    # and the other componentSets already in the folder are applied as well
+    artifact = [[sets_folder + "/componentSet_pumps.txt", {"Component Set Name": "pumps", "Scaling Factor": 0.6}]]
+    self.assertEqual(pipeline.heron(artifact), "new_heron_input.xml")
+    comp_sets = mock_update.call_args[0][1]
+    self.assertEqual(sorted(comp_set_dict["Component Set Name"] for _, comp_set_dict in comp_sets), ["pumps", "turbines"])
+    self.assertIn((sets_folder + "/componentSet_pumps.txt", {"Component Set Name": "pumps", "Scaling Factor": 0.6}), comp_sets)
+
+  def test_bad_stages(self):
+    with self.assertRaises(ValueError):
+      self.pipeline.run(from_stage='unknown')
+    with self.assertRaises(ValueError):
+      self.pipeline.run(from_stage='heron', to_stage='extract')
+    # The checkpoint of the previous stage is needed
+    with self.assertRaises(FileNotFoundError):
+      self.pipeline.run(from_stage='heron')
+
+# This is not needed for running tests through FORCE/run_tests
+# It does allow tests to be run via the unit tester when test_pipeline is run directly
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,73 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+FORCE_LOC = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+sys.path.append(FORCE_LOC)
+from FORCE.developer_tools.synthetic_aspen import synthetic_components, create_synthetic_aspen_outputs, write_setfiles, COST_MODELS
+from FORCE.src.hysys import extract_all_hysys_components
+from FORCE.src.apea import extract_all_apea_components
+
+class TestSyntheticAspenOutputs(unittest.TestCase):
+
+  def setUp(self):
+    self.folder = tempfile.mkdtemp()
+    self.hysys_folder = os.path.join(self.folder, "HYSYS_outputs") + "/"
+    self.apea_folder = os.path.join(self.folder, "APEA_outputs") + "/"
+
+  def tearDown(self):
+    shutil.rmtree(self.folder)
+
+  def test_seeded_components(self):
+    components = synthetic_components(50, seed=3)
+    self.assertEqual(components, synthetic_components(50, seed=3))
+    self.assertNotEqual(components, synthetic_components(50, seed=4))
+    self.assertEqual(len({comp["Component Name"] for comp in components}), 50)
+    for comp in components:
+      if comp["HYSYS Category"] in COST_MODELS:
+        low, high = COST_MODELS[comp["HYSYS Category"]]["Capacity Range"]
+        self.assertTrue(low <= comp["Capacity"] <= high)
+        self.assertGreater(comp["Installed Cost [USD]"], 0)
+      else:
+        # The Tees and the Mixers do not have a capacity row
+        self.assertIsNone(comp["Capacity"])
+    with self.assertRaises(ValueError):
+      synthetic_components(5, categories=['Pumps', 'Compressors'])
+
+  def test_extracted_components(self):
+    files_components = create_synthetic_aspen_outputs(self.hysys_folder, self.apea_folder, 60, n_files=2, seed=1)
+    self.assertEqual(sorted(os.listdir(self.hysys_folder)), sorted(files_components))
+    self.assertEqual(sorted(os.listdir(self.apea_folder)), sorted(files_components))
+    expected = {comp["Component Name"] + "_from_" + file_name: comp
+                for file_name, file_components in files_components.items() for comp in file_components}
+    self.assertEqual(len(expected), 60)
+
+    hysys_comps = extract_all_hysys_components(self.hysys_folder, persist=False)[1]
+    self.assertEqual({comp["Component ID"] for comp in hysys_comps}, set(expected))
+    for comp in hysys_comps:
+      synthetic = expected[comp["Component ID"]]
+      self.assertEqual(comp["HYSYS Category"], synthetic["HYSYS Category"])
+      if synthetic["Capacity"] is None:
+        self.assertEqual(comp["HYSYS Power"], "unknown")
+      else:
+        self.assertAlmostEqual(comp["HYSYS Power"], synthetic["Capacity"])
+        self.assertEqual(comp["HYSYS Power Units"], synthetic["Capacity Units"])
+
+    apea_comps = extract_all_apea_components(self.apea_folder, persist=False)[1]
+    self.assertEqual({comp["Component ID"] for comp in apea_comps}, set(expected))
+    for comp in apea_comps:
+      synthetic = expected[comp["Component ID"]]
+      self.assertEqual(comp["APEA Installed Cost [USD]"], synthetic["Installed Cost [USD]"])
+      self.assertEqual(comp["APEA Equipment Weight [LBS]"], synthetic["Equipment Weight [LBS]"])
+
+  def test_setfiles(self):
+    Setfiles_paths = write_setfiles(os.path.join(self.folder, "Sets"))
+    self.assertEqual([os.path.basename(path) for path in Setfiles_paths],
+                     ["Setfile_" + category.lower().replace(" ", "_") + ".txt" for category in COST_MODELS])
+
+# This is not needed for running tests through FORCE/run_tests
+# It does allow tests to be run via the unit tester when test_synthetic_aspen is run directly
+if __name__ == '__main__':
+  unittest.main()